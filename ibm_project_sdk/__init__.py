@@ -19,6 +19,22 @@ from ibm_cloud_sdk_core import IAMTokenManager, DetailedResponse, BaseService, A
 
 from .common import get_sdk_headers
 from .version import __version__
+from .batch import BatchItem, BatchResult
+from .cache import CacheStats, ConditionalCache, NegativeCache, ResponseCache
+from .circuit import CircuitBreaker, CircuitOpenError, CircuitState
+from .coalesce import CoalescingStats
+from .compression import CompressionConfig, CompressionStats
+from .hedging import HedgingPolicy, HedgingStats
+from .http2 import HTTP2Adapter
+from .pagers import AdaptiveLimit, AdaptiveLimitStats, ExportStats, Pager, PagerCheckpoint, StreamingPager
+from .pool import PoolConfig, PoolStats
+from .ratelimit import RateLimiter, RateLimitExceeded
+from .retry import RetryPolicy
+from .streaming import StreamingCollection
+from .token_store import TokenStore
+from .version_cache import VersionCache
 from .project_v1 import ProjectV1
+from .crawler import CrawlRecord, Crawler, CrawlStats
+from .async_project_v1 import AsyncConfigsPager, AsyncProjectEnvironmentsPager, AsyncProjectsPager, AsyncProjectV1
 
 # from .example_service_v1 import ExampleServiceV1
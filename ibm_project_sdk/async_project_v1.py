@@ -0,0 +1,572 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an asyncio client for the project service, sending requests
+with httpx. It requires the `async` extra:
+
+    pip install ibm-project-sdk[async]
+"""
+
+from functools import partial
+from json import JSONDecodeError
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse, get_query_param
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+import requests
+from requests.hooks import dispatch_hook
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .batch import BatchItem, BatchResult, run_batch_async, unique_ids
+from .common import Operation, add_response_hook
+from .pagers import PagerCheckpoint
+from .pool import PoolConfig
+from .project_v1 import _attempt_timeout, _ProjectV1Base
+
+try:
+    import httpx
+
+    from .http2 import to_httpx_timeout, to_requests_exception
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncProjectV1(_ProjectV1Base):
+    """
+    The asyncio client for the project V1 service.
+
+    It has the operation methods of ProjectV1, which validate their arguments and
+    build their request when called, and return a coroutine that sends the
+    request, e.g. `response = await service.get_config(project_id, id)`.
+    Requests are sent by an httpx client sized by the pool configuration, so
+    many calls can be in flight on one event loop. Compression, coalescing, the
+    caches, the retry policy, the rate limiter and the circuit breaker apply as
+    in ProjectV1, and the batch methods send their requests concurrently on the
+    event loop. Hedging, transport adapters and the `stream_*` methods are
+    specific to ProjectV1. Use the asyncio pagers, e.g. AsyncConfigsPager; the
+    pagers and the crawler of ProjectV1 reject this client.
+
+    A client is bound to the event loop it is first used on. Close it with
+    `aclose` or use it as an async context manager.
+    """
+
+    _is_async = True
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        pool_config: Optional[PoolConfig] = None,
+        http2: bool = False,
+    ) -> None:
+        """
+        Construct a new asyncio client for the project service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+        :param PoolConfig pool_config: (optional) The sizing of the HTTP connection pool
+               shared by all the tasks that use this client.
+        :param bool http2: (optional) Whether HTTPS connections negotiate HTTP/2; this
+               requires the `http2` extra.
+        """
+        if httpx is None:
+            raise ImportError('AsyncProjectV1 requires httpx; install it with "pip install ibm-project-sdk[async]"')
+        self.http2 = http2
+        self._async_client = None
+        _ProjectV1Base.__init__(self, authenticator, pool_config=pool_config)
+
+    async def __aenter__(self) -> 'AsyncProjectV1':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connections of the client."""
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
+
+    def set_pool_config(self, pool_config: PoolConfig) -> None:
+        """
+        Size the HTTP connection pool with the specified configuration.
+
+        The pool is replaced when the client is next used; connections held by the
+        previous pool are closed once their requests have completed.
+
+        :param PoolConfig pool_config: The sizing of the HTTP connection pool.
+        """
+        if pool_config is None:
+            raise ValueError('pool_config must be provided')
+        self.pool_config = pool_config
+        self._release_async_client()
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        """Set whether the client verifies the server's SSL certificate."""
+        _ProjectV1Base.set_disable_ssl_verification(self, status)
+        self._release_async_client()
+
+    async def get_configs(
+        self,
+        project_id: str,
+        ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> BatchResult:
+        """
+        Get many project configurations concurrently.
+
+        Like `ProjectV1.get_configs`, with at most `max_workers` requests in flight
+        on the event loop.
+
+        :param str project_id: The unique project ID.
+        :param Iterable[str] ids: The unique configuration IDs.
+        :param int max_workers: (optional) The maximum number of concurrent requests.
+        :param dict headers: A `dict` containing the request headers
+        :return: The responses and errors, keyed by configuration ID in request order.
+        :rtype: BatchResult with `dict` results representing `ProjectConfig` objects
+        """
+        ids = unique_ids(ids)
+        items = [item async for item in self.iter_configs(project_id, ids, max_workers=max_workers, **kwargs)]
+        return BatchResult.from_items(ids, items)
+
+    def iter_configs(
+        self,
+        project_id: str,
+        ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Get many project configurations concurrently, returning each one as soon as
+        it has been received.
+
+        Like `ProjectV1.iter_configs`, iterated with `async for`. Closing the
+        iterator early with `aclose` cancels the requests in flight.
+
+        :param str project_id: The unique project ID.
+        :param Iterable[str] ids: The unique configuration IDs.
+        :param int max_workers: (optional) The maximum number of concurrent requests.
+        :param dict headers: A `dict` containing the request headers
+        :return: An asynchronous iterator over the outcome of each request.
+        :rtype: AsyncIterator of BatchItem with `dict` results representing `ProjectConfig` objects
+        """
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        return run_batch_async(lambda id: self.get_config(project_id, id, **kwargs), unique_ids(ids), max_workers)
+
+    async def _invoke(  # pylint: disable=invalid-overridden-method
+        self,
+        operation: Operation,
+        kwargs: dict,
+        *,
+        path_vars: tuple = (),
+        params: Optional[dict] = None,
+        data: Optional[str] = None,
+    ) -> DetailedResponse:
+        """
+        Build the request for an operation from its precompiled descriptor and send it.
+
+        The arguments are those of `ProjectV1._invoke`. The authenticator is called
+        on the event loop; token-based authenticators refresh their token in a
+        background thread before it expires, so only the first request of a
+        client waits for a token.
+        """
+        request = self._build_request(operation, kwargs, path_vars, params, data)
+        send = partial(self._execute_async, operation, request, kwargs)
+        return await self._with_caches(operation, request, kwargs, path_vars, send, asynchronous=True)()
+
+    async def _execute_async(self, operation: Operation, request: dict, kwargs: dict) -> DetailedResponse:
+        """
+        Send a prepared operation request, applying the retry policy of the client.
+        """
+        retry_policy = self._retry_policy
+        if retry_policy is None:
+            return await self._send_attempt_async(operation, request, kwargs)
+        send = partial(self._send_attempt_async, operation, request)
+        if retry_policy.deadline is not None and 'timeout' in self._http_config:
+            # Let the policy cap the configured timeout, and send_async apply the capped one.
+            kwargs = dict(kwargs, timeout=self._http_config['timeout'])
+            send = partial(_send_with_attempt_timeout_async, send)
+        return await retry_policy.execute_async(operation, send, kwargs)
+
+    async def _send_attempt_async(self, operation: Operation, request: dict, kwargs: dict) -> DetailedResponse:
+        """
+        Send one attempt of an operation request once the rate limiter allows it,
+        through the circuit breaker of the client.
+        """
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(operation.operation_id)
+        circuit_breaker = self._circuit_breaker
+        if circuit_breaker is None:
+            return await self.send_async(request, **kwargs)
+        return await circuit_breaker.call_async(operation, lambda: self.send_async(request, **kwargs))
+
+    async def send_async(self, request: dict, **kwargs) -> DetailedResponse:
+        """
+        Send a prepared request and wrap the response in a DetailedResponse or
+        ApiException, like `BaseService.send`.
+
+        Successful JSON responses are decoded. With `stream=True`, the result is the
+        `httpx.Response`, whose body has not been read; close it with `aclose`.
+        Other results are `requests.Response` objects with their body loaded.
+
+        :param dict request: The request built by `prepare_request`.
+        :raises ApiException: If the response has an error status.
+        :raises requests.exceptions.RequestException: If the request cannot be sent.
+        """
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        stream = kwargs.get('stream') or False
+        timeout = to_httpx_timeout(kwargs['timeout'])
+        if self.pool_config.pool_timeout is not None:
+            timeout = httpx.Timeout(
+                connect=timeout.connect, read=timeout.read, write=timeout.write, pool=self.pool_config.pool_timeout
+            )
+        client = self._get_async_client()
+        http_request = client.build_request(
+            request['method'],
+            request['url'],
+            params=request.get('params'),
+            headers=request.get('headers'),
+            content=request.get('data'),
+            timeout=timeout,
+        )
+        try:
+            logger.debug('Sending HTTP request message')
+            http_response = await client.send(http_request, stream=stream)
+        except httpx.TransportError as error:
+            raise to_requests_exception(error) from error
+        logger.debug('Received HTTP response message, status code %d', http_response.status_code)
+
+        status_code = http_response.status_code
+        if 200 <= status_code <= 299 and stream:
+            return DetailedResponse(
+                response=http_response, headers=CaseInsensitiveDict(http_response.headers), status_code=status_code
+            )
+        if stream:
+            await http_response.aread()
+        response = dispatch_hook('response', kwargs.get('hooks'), _to_requests_response(http_response), stream=stream)
+        if not 200 <= status_code <= 299:
+            raise ApiException(status_code, http_response=response)
+        if status_code == 204 or request['method'] == 'HEAD' or not response.text:
+            result = None
+        elif is_json_mimetype(response.headers.get('Content-Type')):
+            try:
+                result = json.loads(response.text, strict=False)
+            except JSONDecodeError as error:
+                raise ApiException(
+                    code=status_code, http_response=response, message='Error processing the HTTP response'
+                ) from error
+        else:
+            result = response
+        return DetailedResponse(response=result, headers=response.headers, status_code=status_code)
+
+    def _get_async_client(self) -> 'httpx.AsyncClient':
+        if self._async_client is None:
+            pool_config = self.pool_config
+            max_connections = pool_config.max_connections_per_host * pool_config.max_hosts
+            # Without `block`, the synchronous pool opens extra connections rather than waiting.
+            limits = httpx.Limits(
+                max_connections=max_connections if pool_config.block else None,
+                max_keepalive_connections=pool_config.max_idle if pool_config.max_idle is not None else max_connections,
+                keepalive_expiry=pool_config.idle_timeout,
+            )
+            self._async_client = httpx.AsyncClient(
+                http2=self.http2,
+                verify=not self.disable_ssl_verification,
+                limits=limits,
+                cookies=self.jar,
+            )
+        return self._async_client
+
+    def _release_async_client(self) -> None:
+        # Requests in flight keep using the previous client, which is left to the garbage collector.
+        self._async_client = None
+
+
+async def _send_with_attempt_timeout_async(
+    send: Callable[[dict], Awaitable[DetailedResponse]], kwargs: dict
+) -> DetailedResponse:
+    token = _attempt_timeout.set(kwargs.get('timeout'))
+    try:
+        return await send(kwargs)
+    finally:
+        _attempt_timeout.reset(token)
+
+
+def _to_requests_response(http_response: 'httpx.Response') -> requests.Response:
+    # Wrap a fully read httpx response, so that response hooks and ApiException handle it as usual.
+    response = requests.Response()
+    response.status_code = http_response.status_code
+    response.headers = CaseInsensitiveDict(http_response.headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.reason = http_response.reason_phrase
+    response.url = str(http_response.url)
+    response._content = http_response.content  # pylint: disable=protected-access
+    return response
+
+
+##############################################################################
+# Pagers
+##############################################################################
+
+
+class _AsyncPager:
+    """
+    The base class of the asyncio pagers. Iterating a pager with `async for`
+    yields the resources one at a time; the request for the next page is sent as
+    soon as a page has been received, so that it overlaps with the processing of
+    the current page. Checkpoints work as with the synchronous pagers.
+    """
+
+    _collection_key = None
+
+    def __init__(
+        self,
+        *,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+        checkpoint: Optional[PagerCheckpoint] = None,
+    ) -> None:
+        checkpoint = checkpoint or PagerCheckpoint()
+        self._limit = checkpoint.limit if checkpoint.limit is not None else limit
+        self._has_next = not checkpoint.done
+        self._page_context = {'next': checkpoint.token}
+        self._prefetch = prefetch
+        self._skip = checkpoint.offset
+        self._position = (checkpoint.token, checkpoint.offset)
+        self._done = checkpoint.done
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    async def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents a resource.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+        page, _, end, has_next = await self._get_page(self._page_context.get('next'), self._skip)
+        self._take(end, has_next)
+        self._position = end
+        self._done = not has_next
+        return page
+
+    async def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents a resource.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = await self.get_next()
+            results.extend(next_page)
+        return results
+
+    def get_checkpoint(self) -> PagerCheckpoint:
+        """
+        Returns the position of the pager after the results returned so far.
+        :rtype: PagerCheckpoint
+        """
+        token, offset = self._position
+        return PagerCheckpoint(token=token, limit=self._limit, offset=offset, done=self._done)
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        pending = self._request_next() if self.has_next() else None
+        try:
+            while pending is not None:
+                page, (token, offset), end, has_next = await pending
+                pending = None
+                self._take(end, has_next)
+                if self._prefetch and has_next:
+                    pending = self._request_next()
+                page = page or []
+                for index, item in enumerate(page, 1):
+                    if index == len(page):
+                        self._position = end
+                        self._done = not self._has_next
+                    else:
+                        self._position = (token, offset + index)
+                    yield item
+                if not page:
+                    self._position = end
+                    self._done = not self._has_next
+                if pending is None and self.has_next():
+                    pending = self._request_next()
+        finally:
+            # The consumer stopped early: drop the prefetched page, which did not
+            # move the pager forward.
+            if pending is not None and not pending.cancel() and not pending.cancelled():
+                pending.exception()
+
+    def _request_next(self) -> 'asyncio.Future':
+        return asyncio.ensure_future(self._get_page(self._page_context.get('next'), self._skip))
+
+    def _take(self, end: tuple, has_next: bool) -> None:
+        # Hand a page to the caller: the next request starts after it.
+        self._page_context['next'], _ = end
+        self._skip = 0
+        self._has_next = has_next
+
+    async def _get_page(self, token: Optional[str], skip: int) -> Tuple[List[dict], tuple, tuple, bool]:
+        # Request the page at a token, dropping its first `skip` resources, and
+        # return it with the positions before and after it, and whether more pages
+        # follow. The state of the pager is left alone, as this may be a prefetched
+        # page that the caller never takes.
+        result = await self._list(token)
+
+        next = None  # pylint: disable=redefined-builtin
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next = get_query_param(next_page_link.get('href'), 'token')
+
+        page = result.get(self._collection_key)
+        if skip and page is not None:
+            page = page[skip:]
+        return page, (token, skip), (next, 0), next is not None
+
+    async def _list(self, token: Optional[str]) -> dict:
+        raise NotImplementedError()
+
+
+class AsyncProjectsPager(_AsyncPager):
+    """
+    AsyncProjectsPager can be used to simplify the use of the "list_projects" method
+    of AsyncProjectV1.
+    """
+
+    _collection_key = 'projects'
+
+    def __init__(
+        self,
+        *,
+        client: AsyncProjectV1,
+        limit: int = None,
+        prefetch: bool = True,
+        checkpoint: PagerCheckpoint = None,
+    ) -> None:
+        """
+        Initialize an AsyncProjectsPager object.
+        :param int limit: (optional) The maximum number of resources to return. The
+               number of resources that are returned is the same, except for the last
+               page.
+        :param bool prefetch: (optional) Whether iterating the pager requests the
+               next page while the current one is being processed.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        """
+        super().__init__(limit=limit, prefetch=prefetch, checkpoint=checkpoint)
+        self._client = client
+
+    async def _list(self, token: Optional[str]) -> dict:
+        response = await self._client.list_projects(limit=self._limit, token=token)
+        return response.get_result()
+
+
+class AsyncProjectEnvironmentsPager(_AsyncPager):
+    """
+    AsyncProjectEnvironmentsPager can be used to simplify the use of the
+    "list_project_environments" method of AsyncProjectV1.
+    """
+
+    _collection_key = 'environments'
+
+    def __init__(
+        self,
+        *,
+        client: AsyncProjectV1,
+        project_id: str,
+        limit: int = None,
+        prefetch: bool = True,
+        checkpoint: PagerCheckpoint = None,
+    ) -> None:
+        """
+        Initialize an AsyncProjectEnvironmentsPager object.
+        :param str project_id: The unique project ID.
+        :param int limit: (optional) The maximum number of resources to return. The
+               number of resources that are returned is the same, except for the last
+               page.
+        :param bool prefetch: (optional) Whether iterating the pager requests the
+               next page while the current one is being processed.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        """
+        super().__init__(limit=limit, prefetch=prefetch, checkpoint=checkpoint)
+        self._client = client
+        self._project_id = project_id
+
+    async def _list(self, token: Optional[str]) -> dict:
+        response = await self._client.list_project_environments(
+            project_id=self._project_id, limit=self._limit, token=token
+        )
+        return response.get_result()
+
+
+class AsyncConfigsPager(_AsyncPager):
+    """
+    AsyncConfigsPager can be used to simplify the use of the "list_configs" method
+    of AsyncProjectV1.
+    """
+
+    _collection_key = 'configs'
+
+    def __init__(
+        self,
+        *,
+        client: AsyncProjectV1,
+        project_id: str,
+        limit: int = None,
+        prefetch: bool = True,
+        checkpoint: PagerCheckpoint = None,
+    ) -> None:
+        """
+        Initialize an AsyncConfigsPager object.
+        :param str project_id: The unique project ID.
+        :param int limit: (optional) The maximum number of resources to return. The
+               number of resources that are returned is the same, except for the last
+               page.
+        :param bool prefetch: (optional) Whether iterating the pager requests the
+               next page while the current one is being processed.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        """
+        super().__init__(limit=limit, prefetch=prefetch, checkpoint=checkpoint)
+        self._client = client
+        self._project_id = project_id
+
+    async def _list(self, token: Optional[str]) -> dict:
+        response = await self._client.list_configs(project_id=self._project_id, limit=self._limit, token=token)
+        return response.get_result()
@@ -0,0 +1,181 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides batch operations, which call an operation for many
+resources concurrently, and their results.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional
+import asyncio
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+
+class BatchItem:
+    """
+    The outcome of the call for one resource of a batch.
+
+    :attr str id: The ID of the resource.
+    :attr DetailedResponse response: The response of the call, if it succeeded.
+    :attr Exception error: The error raised by the call, if it failed.
+    """
+
+    def __init__(
+        self,
+        id: str,  # pylint: disable=redefined-builtin
+        response: Optional[DetailedResponse] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.id = id
+        self.response = response
+        self.error = error
+
+    def get_result(self) -> dict:
+        """Return the result of the call, or raise its error."""
+        if self.error is not None:
+            raise self.error
+        return self.response.get_result()
+
+
+class BatchResult:
+    """
+    The outcomes of the calls of a batch, keyed by resource ID in request order.
+
+    :attr dict responses: The responses of the calls that succeeded.
+    :attr dict errors: The errors raised by the calls that failed.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, DetailedResponse]] = None,
+        errors: Optional[Dict[str, Exception]] = None,
+    ) -> None:
+        self.responses = responses if responses is not None else {}
+        self.errors = errors if errors is not None else {}
+
+    @classmethod
+    def from_items(cls, ids: list, items: Iterable[BatchItem]) -> 'BatchResult':
+        """Return the result of a batch from its outcomes, ordered as `ids`."""
+        items = {item.id: item for item in items}
+        result = cls()
+        for id in ids:  # pylint: disable=redefined-builtin
+            item = items[id]
+            if item.error is not None:
+                result.errors[id] = item.error
+            else:
+                result.responses[id] = item.response
+        return result
+
+    def get_results(self) -> Dict[str, dict]:
+        """Return the results of the calls that succeeded, keyed by resource ID."""
+        return {id: response.get_result() for id, response in self.responses.items()}
+
+    def __len__(self) -> int:
+        return len(self.responses) + len(self.errors)
+
+    def __str__(self) -> str:
+        return 'BatchResult(responses={0}, errors={1})'.format(len(self.responses), len(self.errors))
+
+
+def unique_ids(ids: Iterable[str]) -> list:
+    """Return the IDs without duplicates, in their first order, checking that none is empty."""
+    ids = list(dict.fromkeys(ids))
+    if not all(ids):
+        raise ValueError('ids must not contain empty IDs')
+    return ids
+
+
+def run_batch(call: Callable[[str], DetailedResponse], ids: list, max_workers: int) -> Iterator[BatchItem]:
+    """
+    Call `call` for each ID on up to `max_workers` threads and return an iterator
+    over the outcomes, in the order they complete. Closing the iterator early
+    cancels the calls not started yet.
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be greater than 0')
+    return _run(call, ids, max_workers)
+
+
+def _run(call: Callable[[str], DetailedResponse], ids: list, max_workers: int) -> Iterator[BatchItem]:
+    if not ids:
+        return
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(ids)), thread_name_prefix='ibm-project-batch')
+    remaining = iter(ids)
+    pending = {}
+    try:
+        # Keep at most max_workers calls submitted, so that an early exit leaves little work behind.
+        for id in remaining:  # pylint: disable=redefined-builtin
+            pending[executor.submit(call, id)] = id
+            if len(pending) == max_workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                id = pending.pop(future)  # pylint: disable=redefined-builtin
+                next_id = next(remaining, None)
+                if next_id is not None:
+                    pending[executor.submit(call, next_id)] = next_id
+                error = future.exception()
+                if error is not None:
+                    yield BatchItem(id, error=error)
+                else:
+                    yield BatchItem(id, response=future.result())
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def run_batch_async(
+    call: Callable[[str], Awaitable[DetailedResponse]], ids: list, max_workers: int
+) -> AsyncIterator[BatchItem]:
+    """
+    Like `run_batch`, but await `call` for each ID with up to `max_workers` calls
+    in flight on the event loop. Closing the iterator early with `aclose` cancels
+    the calls in flight.
+    """
+    if max_workers < 1:
+        raise ValueError('max_workers must be greater than 0')
+    return _run_async(call, ids, max_workers)
+
+
+async def _run_async(
+    call: Callable[[str], Awaitable[DetailedResponse]], ids: list, max_workers: int
+) -> AsyncIterator[BatchItem]:
+    remaining = iter(ids)
+    pending = {}
+    try:
+        for id in remaining:  # pylint: disable=redefined-builtin
+            pending[asyncio.ensure_future(call(id))] = id
+            if len(pending) == max_workers:
+                break
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                id = pending.pop(task)  # pylint: disable=redefined-builtin
+                next_id = next(remaining, None)
+                if next_id is not None:
+                    pending[asyncio.ensure_future(call(next_id))] = next_id
+                error = task.exception()
+                if error is not None:
+                    yield BatchItem(id, error=error)
+                else:
+                    yield BatchItem(id, response=task.result())
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,633 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides client-side caches of operation responses.
+"""
+
+from collections import OrderedDict
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.utils import string_to_datetime
+
+from .common import Operation
+
+# The read operations of single resources that return an ETag or a `modified_at` date.
+CONDITIONAL_OPERATIONS = frozenset(['get_project', 'get_project_environment', 'get_config', 'get_stack_definition'])
+
+
+class CacheStats:
+    """
+    A point-in-time snapshot of the activity of a cache.
+
+    :attr int hits: The number of calls answered from the cache.
+    :attr int misses: The number of calls answered by the service.
+    :attr int evictions: The number of entries dropped to make room for new ones.
+    :attr int invalidations: The number of entries dropped because a write made
+          them stale.
+    :attr int entries: The number of entries in the cache.
+    :attr int bytes: The approximate size in bytes of the cached response bodies.
+    """
+
+    def __init__(
+        self,
+        *,
+        hits: int = 0,
+        misses: int = 0,
+        evictions: int = 0,
+        invalidations: int = 0,
+        entries: int = 0,
+        bytes: int = 0,  # pylint: disable=redefined-builtin
+    ) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.invalidations = invalidations
+        self.entries = entries
+        self.bytes = bytes
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'CacheStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'CacheStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class _Entry:
+    # A cached response and the request header that revalidates it.
+
+    def __init__(self, response: DetailedResponse, validator: Tuple[str, str], size: int) -> None:
+        self.response = response
+        self.validator = validator
+        self.size = size
+
+
+class ConditionalCache:
+    """
+    Revalidates cached responses of read operations with conditional requests.
+
+    The response of each call of a cached operation is kept with its validator:
+    the ETag header of the response or, failing that, the `modified_at` date of
+    the resource when it falls on a whole second. The next call for the same URL sends it in an `If-None-Match`
+    or `If-Modified-Since` header, and when the service answers 304 Not Modified
+    the cached response is returned instead; the service neither encodes nor
+    sends the resource again. At most `max_entries` responses are kept, the least
+    recently used being dropped first.
+
+    Calls that receive a cached response share its result, so they must not
+    modify it.
+
+    :param Iterable[str] operations: (optional) The IDs of the GET operations to
+           cache; `get_project`, `get_project_environment`, `get_config` and
+           `get_stack_definition` if not set.
+    :param int max_entries: (optional) The maximum number of cached responses.
+    """
+
+    def __init__(self, *, operations: Optional[Iterable[str]] = None, max_entries: int = 1000) -> None:
+        if max_entries < 1:
+            raise ValueError('max_entries must be greater than 0')
+        self.operations = frozenset(operations) if operations is not None else CONDITIONAL_OPERATIONS
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def is_cached(self, operation: Operation, kwargs: dict) -> bool:
+        """Return true if calls of the operation with these `send` arguments are cached."""
+        return operation.method == 'GET' and operation.operation_id in self.operations and not kwargs.get('stream')
+
+    @staticmethod
+    def get_key(operation: Operation, request: dict) -> Hashable:
+        """Return the key of the cached response of a request."""
+        return _get_key(operation, request)
+
+    def get_stats(self) -> CacheStats:
+        """Return a snapshot of the activity of the cache."""
+        with self._lock:
+            return CacheStats(**self._stats.to_dict())
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.entries = self._stats.bytes = 0
+
+    def execute(self, key: Hashable, request: dict, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Send the request, conditional on the cached response if there is one, and
+        return the cached response if it has not been modified.
+
+        :param key: The key of the request, from `get_key`.
+        :param dict request: The prepared request; its headers are updated.
+        :param Callable send: Sends the request.
+        :return: The response of the request, or the cached response.
+        :raises ApiException: The error of the request.
+        """
+        entry = self._prepare(key, request)
+        try:
+            response = send()
+        except ApiException as error:
+            return self._not_modified(entry, error)
+        self._store(key, response)
+        return response
+
+    async def execute_async(
+        self, key: Hashable, request: dict, send: Callable[[], Awaitable[DetailedResponse]]
+    ) -> DetailedResponse:
+        """
+        Like `execute`, for a `send` function returning a coroutine.
+        """
+        entry = self._prepare(key, request)
+        try:
+            response = await send()
+        except ApiException as error:
+            return self._not_modified(entry, error)
+        self._store(key, response)
+        return response
+
+    def _prepare(self, key: Hashable, request: dict) -> Optional[_Entry]:
+        # Add the validator of the cached response to the request headers.
+        headers = request.setdefault('headers', {})
+        if any(name.lower() in ('if-none-match', 'if-modified-since') for name in headers):
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            name, value = entry.validator
+            headers[name] = value
+        return entry
+
+    def _not_modified(self, entry: Optional[_Entry], error: ApiException) -> DetailedResponse:
+        if entry is None or error.status_code != 304:
+            raise error
+        with self._lock:
+            self._stats.hits += 1
+        cached = entry.response
+        return _copy(cached)
+
+    def _store(self, key: Hashable, response: DetailedResponse) -> None:
+        validator = _get_validator(response)
+        with self._lock:
+            self._stats.misses += 1
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._stats.bytes -= previous.size
+            if validator is None:
+                self._stats.entries = len(self._entries)
+                return
+            entry = self._entries[key] = _Entry(response, validator, _body_size(response))
+            self._stats.bytes += entry.size
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._stats.bytes -= evicted.size
+                self._stats.evictions += 1
+            self._stats.entries = len(self._entries)
+
+
+class _TimedEntry:
+    # A cached response, the URL it was requested from and its expiry time.
+
+    def __init__(self, response: DetailedResponse, url: str, expires: float, size: int) -> None:
+        self.response = response
+        self.url = url
+        self.expires = expires
+        self.size = size
+
+
+class ResponseCache:
+    """
+    Serves the calls of read operations from the responses of earlier calls.
+
+    A response is kept for `ttl` seconds, or the TTL of its operation in
+    `operation_ttls`, and evicted earlier, least recently used first, when there
+    are more than `max_entries` responses or their bodies take more than
+    `max_bytes` bytes.
+
+    The cache follows the resource hierarchy of the URLs, so that the client
+    does not read stale data after its own writes. A write (any non-GET call)
+    drops the cached responses of the resource it changes, of the
+    resources below it, and of the collections and resources above it. For
+    example, `update_config`, `approve`, `deploy_config` or `delete_config` drop
+    the `get_config`, `list_config_versions` and `list_config_resources`
+    responses of the configuration, and the `list_configs` and `get_project`
+    responses of its project. Create calls only drop the collection they add to
+    and the resources above it. A failed write drops them too, as it may have
+    been applied. Changes made by other clients are seen once the TTL has expired.
+
+    Calls that receive a cached response share its result, so they must not
+    modify it.
+
+    :param float ttl: (optional) The number of seconds a response is kept.
+    :param dict operation_ttls: (optional) The TTLs of specific operations, keyed
+           by operation ID; a TTL of 0 disables caching for the operation.
+    :param Iterable[str] operations: (optional) The IDs of the GET operations to
+           cache; all GET operations if not set.
+    :param int max_entries: (optional) The maximum number of cached responses.
+    :param int max_bytes: (optional) The maximum total size of the cached bodies.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 30.0,
+        operation_ttls: Optional[Dict[str, float]] = None,
+        operations: Optional[Iterable[str]] = None,
+        max_entries: int = 1000,
+        max_bytes: int = 10 * 1024 * 1024,
+    ) -> None:
+        if ttl < 0 or any(value < 0 for value in (operation_ttls or {}).values()):
+            raise ValueError('TTLs must not be negative')
+        if max_entries < 1:
+            raise ValueError('max_entries must be greater than 0')
+        if max_bytes < 1:
+            raise ValueError('max_bytes must be greater than 0')
+        self.ttl = ttl
+        self.operation_ttls = dict(operation_ttls or {})
+        self.operations = frozenset(operations) if operations is not None else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, _TimedEntry]' = OrderedDict()
+        self._stats = CacheStats()
+        # Incremented by each write, so that a read started before a write does not cache its response.
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_ttl(self, operation: Operation) -> float:
+        """Return the number of seconds the responses of an operation are kept, 0 if they are not cached."""
+        if operation.method != 'GET':
+            return 0
+        if self.operations is not None and operation.operation_id not in self.operations:
+            return 0
+        return self.operation_ttls.get(operation.operation_id, self.ttl)
+
+    def get_stats(self) -> CacheStats:
+        """Return a snapshot of the activity of the cache."""
+        with self._lock:
+            return CacheStats(**self._stats.to_dict())
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._stats.entries = self._stats.bytes = 0
+
+    def execute(
+        self, operation: Operation, request: dict, kwargs: dict, send: Callable[[], DetailedResponse]
+    ) -> DetailedResponse:
+        """
+        Return the cached response of a read, or call `send` and cache its response;
+        after a write, drop the responses it makes stale.
+
+        :param Operation operation: The operation being invoked.
+        :param dict request: The prepared request.
+        :param dict kwargs: The `send` arguments of the call.
+        :param Callable send: Sends the request.
+        :return: The response of the call.
+        :raises ApiException: The error of the request.
+        """
+        if operation.method != 'GET':
+            try:
+                return send()
+            finally:
+                self.invalidate(operation, request['url'])
+        ttl = self.get_ttl(operation)
+        if not ttl or kwargs.get('stream'):
+            return send()
+        key = _get_key(operation, request)
+        cached, generation = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = send()
+        self._store(key, request['url'], response, ttl, generation)
+        return response
+
+    async def execute_async(
+        self, operation: Operation, request: dict, kwargs: dict, send: Callable[[], Awaitable[DetailedResponse]]
+    ) -> DetailedResponse:
+        """
+        Like `execute`, for a `send` function returning a coroutine.
+        """
+        if operation.method != 'GET':
+            try:
+                return await send()
+            finally:
+                self.invalidate(operation, request['url'])
+        ttl = self.get_ttl(operation)
+        if not ttl or kwargs.get('stream'):
+            return await send()
+        key = _get_key(operation, request)
+        cached, generation = self._lookup(key)
+        if cached is not None:
+            return cached
+        response = await send()
+        self._store(key, request['url'], response, ttl, generation)
+        return response
+
+    def invalidate(self, operation: Operation, url: str) -> None:
+        """
+        Drop the cached responses made stale by a write.
+
+        :param Operation operation: The write operation.
+        :param str url: The URL of the write request, without query parameters.
+        """
+        target, ancestors = _get_scope(operation, url)
+        subtree = target + '/'
+        create = operation.operation_id.startswith('create_')
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.url == target or entry.url in ancestors or (not create and entry.url.startswith(subtree))
+            ]
+            for key in stale:
+                self._stats.bytes -= self._entries.pop(key).size
+            self._stats.invalidations += len(stale)
+            self._stats.entries = len(self._entries)
+
+    def _lookup(self, key: Hashable) -> Tuple[Optional[DetailedResponse], int]:
+        # Return a copy of the cached response if it has not expired, and the current generation.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                self._stats.bytes -= entry.size
+                self._stats.entries = len(self._entries)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None, self._generation
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+        return _copy(entry.response), None
+
+    def _store(self, key: Hashable, url: str, response: DetailedResponse, ttl: float, generation: int) -> None:
+        size = _body_size(response)
+        if size > self.max_bytes:
+            return
+        entry = _TimedEntry(response, url, time.monotonic() + ttl, size)
+        with self._lock:
+            if generation != self._generation:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._stats.bytes -= previous.size
+            self._entries[key] = entry
+            self._stats.bytes += size
+            while len(self._entries) > self.max_entries or self._stats.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._stats.bytes -= evicted.size
+                self._stats.evictions += 1
+            self._stats.entries = len(self._entries)
+
+
+class NegativeCache:
+    """
+    Remembers for a short while the URLs that read operations found missing.
+
+    When a GET call fails with 404 Not Found, the calls that follow for the same
+    URL, or for a URL below it, fail with the same error for `ttl` seconds
+    without a request: once a configuration is known to be missing, so are its
+    versions and stack definition. A write (any non-GET call) drops the entries
+    of the resource it targets, of the resources below it, and of the resources
+    above it, since a create call can bring a resource back and a successful
+    write proves that its parents exist.
+
+    :param float ttl: (optional) The number of seconds a 404 is remembered.
+    :param Iterable[str] operations: (optional) The IDs of the GET operations
+           whose 404 errors are remembered; all GET operations if not set.
+    :param int max_entries: (optional) The maximum number of URLs remembered.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 10.0,
+        operations: Optional[Iterable[str]] = None,
+        max_entries: int = 10000,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError('ttl must be greater than 0')
+        if max_entries < 1:
+            raise ValueError('max_entries must be greater than 0')
+        self.ttl = ttl
+        self.operations = frozenset(operations) if operations is not None else None
+        self.max_entries = max_entries
+        # The URLs found missing, with the time they are forgotten and the error.
+        self._entries: 'OrderedDict[str, Tuple[float, ApiException]]' = OrderedDict()
+        self._stats = CacheStats()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def is_cached(self, operation: Operation) -> bool:
+        """Return true if the 404 errors of the operation are remembered."""
+        return self.operations is None or operation.operation_id in self.operations
+
+    def get_stats(self) -> CacheStats:
+        """Return a snapshot of the activity of the cache."""
+        with self._lock:
+            return CacheStats(**self._stats.to_dict())
+
+    def clear(self) -> None:
+        """Forget all missing URLs."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._stats.entries = 0
+
+    def execute(self, operation: Operation, request: dict, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Fail a read of a URL known to be missing, or call `send` and remember a 404;
+        after a write, forget the URLs it may have brought back.
+
+        :param Operation operation: The operation being invoked.
+        :param dict request: The prepared request.
+        :param Callable send: Sends the request.
+        :return: The response of the call.
+        :raises ApiException: The 404 error of an earlier call, or the error of the request.
+        """
+        if operation.method != 'GET':
+            try:
+                return send()
+            finally:
+                self.invalidate(operation, request['url'])
+        if not self.is_cached(operation):
+            return send()
+        generation = self._check(request['url'])
+        try:
+            return send()
+        except ApiException as error:
+            self._store(request['url'], error, generation)
+            raise
+
+    async def execute_async(
+        self, operation: Operation, request: dict, send: Callable[[], Awaitable[DetailedResponse]]
+    ) -> DetailedResponse:
+        """
+        Like `execute`, for a `send` function returning a coroutine.
+        """
+        if operation.method != 'GET':
+            try:
+                return await send()
+            finally:
+                self.invalidate(operation, request['url'])
+        if not self.is_cached(operation):
+            return await send()
+        generation = self._check(request['url'])
+        try:
+            return await send()
+        except ApiException as error:
+            self._store(request['url'], error, generation)
+            raise
+
+    def invalidate(self, operation: Operation, url: str) -> None:
+        """
+        Forget the missing URLs that a write may have brought back.
+
+        :param Operation operation: The write operation.
+        :param str url: The URL of the write request, without query parameters.
+        """
+        target, ancestors = _get_scope(operation, url)
+        subtree = target + '/'
+        with self._lock:
+            self._generation += 1
+            stale = [
+                missing
+                for missing in self._entries
+                if missing == target or missing in ancestors or missing.startswith(subtree)
+            ]
+            for missing in stale:
+                del self._entries[missing]
+            self._stats.invalidations += len(stale)
+            self._stats.entries = len(self._entries)
+
+    def _check(self, url: str) -> int:
+        # Raise the remembered error if the URL or one above it is missing; return the current generation.
+        now = time.monotonic()
+        with self._lock:
+            for missing in _with_ancestors(url):
+                entry = self._entries.get(missing)
+                if entry is None:
+                    continue
+                expires, error = entry
+                if expires <= now:
+                    del self._entries[missing]
+                    self._stats.entries = len(self._entries)
+                    continue
+                self._stats.hits += 1
+                raise ApiException(error.status_code, message=error.message, http_response=error.http_response)
+            self._stats.misses += 1
+            return self._generation
+
+    def _store(self, url: str, error: ApiException, generation: int) -> None:
+        if error.status_code != 404:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries.pop(url, None)
+            self._entries[url] = (time.monotonic() + self.ttl, error)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+            self._stats.entries = len(self._entries)
+
+
+def _get_key(operation: Operation, request: dict) -> Hashable:
+    # The caches ignore the headers: they hold the credentials, which change over time.
+    return (
+        operation.operation_id,
+        request['url'],
+        tuple(sorted((name, str(value)) for name, value in (request.get('params') or {}).items())),
+    )
+
+
+def _get_scope(operation: Operation, url: str) -> Tuple[str, frozenset]:
+    # Return the URL of the resource changed by a write, and the URLs of the resources above it.
+    segments = operation.path.strip('/').split('/')
+    actions = 0
+    if not operation.operation_id.startswith('create_'):
+        # Trailing literal segments name an action on the resource, e.g. /approve.
+        while actions < len(segments) and not segments[-1 - actions].startswith('{'):
+            actions += 1
+        actions = min(actions, len(segments) - 1)
+    parts = urlsplit(url)
+    path = parts.path.rstrip('/').split('/')
+    if actions:
+        path = path[:-actions]
+    base = '{0}://{1}'.format(parts.scheme, parts.netloc)
+    ancestors = frozenset(base + '/'.join(path[:i]) for i in range(2, len(path)))
+    return base + '/'.join(path), ancestors
+
+
+def _with_ancestors(url: str) -> Iterator[str]:
+    # Yield the URL, then the URLs above it up to the service root.
+    parts = urlsplit(url)
+    base = '{0}://{1}'.format(parts.scheme, parts.netloc)
+    path = parts.path.rstrip('/').split('/')
+    for end in range(len(path), 1, -1):
+        yield base + '/'.join(path[:end])
+
+
+def _copy(response: DetailedResponse) -> DetailedResponse:
+    # A new DetailedResponse sharing the result of a cached one.
+    return DetailedResponse(
+        response=response.get_result(), headers=response.get_headers(), status_code=response.get_status_code()
+    )
+
+
+def _get_validator(response: DetailedResponse) -> Optional[Tuple[str, str]]:
+    # Return the conditional request header matching the response, if it has a validator.
+    etag = (response.get_headers() or {}).get('ETag')
+    if etag:
+        return 'If-None-Match', etag
+    result = response.get_result()
+    modified_at = result.get('modified_at') if isinstance(result, dict) else None
+    if not modified_at:
+        return None
+    try:
+        modified_at = string_to_datetime(modified_at)
+    except ValueError:
+        return None
+    if modified_at.microsecond:
+        # HTTP dates have a precision of one second, so a change made later in the
+        # same second would not be seen.
+        return None
+    return 'If-Modified-Since', format_datetime(modified_at.astimezone(timezone.utc), usegmt=True)
+
+
+def _body_size(response: DetailedResponse) -> int:
+    # Return the size of the body of a response, from its Content-Length or its JSON encoding.
+    content_length = (response.get_headers() or {}).get('Content-Length')
+    if content_length is not None and str(content_length).isdigit():
+        return int(content_length)
+    return len(json.dumps(response.get_result(), separators=(',', ':')))
@@ -0,0 +1,334 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a circuit breaker that fails calls fast while an endpoint
+of the service is unhealthy.
+"""
+
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+import requests
+
+from .common import Operation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_STATUSES = (500, 502, 503, 504)
+
+
+class CircuitState(str, Enum):
+    """
+    The state of a circuit.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(ApiException):
+    """
+    Raised instead of sending a request while the circuit of its endpoint is open.
+
+    :attr str key: The operation ID or URL template of the circuit.
+    :attr float retry_after: The number of seconds until the circuit lets a trial
+          request through.
+    """
+
+    def __init__(self, key: str, retry_after: float) -> None:
+        super().__init__(
+            503,
+            message='Circuit open for {0}; retry in {1:.3f} seconds'.format(key, retry_after),
+        )
+        self.key = key
+        self.retry_after = retry_after
+
+
+class _Circuit:
+    # The state of one circuit; CircuitBreaker serializes access to it.
+
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.trial_calls = 0
+        self.trial_outcomes: List[Tuple[bool, bool]] = []
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of the calls to each endpoint of the service and stops
+    sending requests to an endpoint while it is failing.
+
+    A circuit is kept per operation ID, or per URL template when `key` is 'path'.
+    While it is closed, the outcomes of the last `window_size` calls are recorded;
+    once at least `minimum_calls` are known and the rate of failed or slow calls
+    reaches its threshold, the circuit opens and calls fail immediately with
+    CircuitOpenError. After `open_duration` seconds the circuit becomes half-open
+    and lets `half_open_calls` trial calls through: it closes again if they are
+    healthy and reopens otherwise.
+
+    :param float failure_rate_threshold: (optional) The fraction of failed calls
+           that opens the circuit.
+    :param float slow_call_rate_threshold: (optional) The fraction of slow calls
+           that opens the circuit.
+    :param float slow_call_duration: (optional) The number of seconds after which
+           a call is slow; slow calls are not tracked if not set.
+    :param int window_size: (optional) The number of recent calls tracked per circuit.
+    :param int minimum_calls: (optional) The number of calls needed before the
+           rates are evaluated.
+    :param float open_duration: (optional) The number of seconds a circuit stays
+           open before letting trial calls through.
+    :param int half_open_calls: (optional) The number of trial calls of a
+           half-open circuit.
+    :param str key: (optional) 'operation_id' to keep one circuit per operation,
+           or 'path' to keep one per URL template.
+    :param Iterable[int] failure_statuses: (optional) The HTTP status codes that
+           count as failures; connection errors and timeouts always do.
+    :param Callable on_state_change: (optional) Called with the circuit key, the
+           previous state and the new state whenever a circuit changes state.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: Optional[float] = None,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+        key: str = 'operation_id',
+        failure_statuses: Iterable[int] = DEFAULT_FAILURE_STATUSES,
+        on_state_change: Optional[Callable[[str, CircuitState, CircuitState], None]] = None,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError('rate thresholds must be greater than 0 and at most 1')
+        if slow_call_duration is not None and slow_call_duration <= 0:
+            raise ValueError('slow_call_duration must be greater than 0')
+        if window_size < 1 or not 1 <= minimum_calls <= window_size:
+            raise ValueError('minimum_calls must be between 1 and window_size')
+        if open_duration <= 0:
+            raise ValueError('open_duration must be greater than 0')
+        if half_open_calls < 1:
+            raise ValueError('half_open_calls must be greater than 0')
+        if key not in ('operation_id', 'path'):
+            raise ValueError("key must be 'operation_id' or 'path'")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.key = key
+        self.failure_statuses = frozenset(failure_statuses)
+        self._listeners = [on_state_change] if on_state_change is not None else []
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[str, CircuitState, CircuitState], None]) -> None:
+        """Register a callback called with the key, previous state and new state on state changes."""
+        self._listeners.append(callback)
+
+    def get_key(self, operation: Operation) -> str:
+        """Return the key of the circuit that tracks the operation."""
+        return operation.path if self.key == 'path' else operation.operation_id
+
+    def get_state(self, key: str) -> CircuitState:
+        """Return the state of a circuit, moving it to half-open if its open period has ended."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CircuitState.CLOSED
+            changes = self._expire(key, circuit, time.monotonic())
+            state = circuit.state
+        self._notify(changes)
+        return state
+
+    def get_states(self) -> Dict[str, CircuitState]:
+        """Return the state of every circuit that has seen a call."""
+        return {key: self.get_state(key) for key in list(self._circuits)}
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close one circuit, or all of them, and forget their recorded calls."""
+        changes = []
+        with self._lock:
+            keys = [key] if key is not None else list(self._circuits)
+            for circuit_key in keys:
+                circuit = self._circuits.pop(circuit_key, None)
+                if circuit is not None and circuit.state != CircuitState.CLOSED:
+                    changes.append((circuit_key, circuit.state, CircuitState.CLOSED))
+        self._notify(changes)
+
+    def is_failure(self, error: Exception) -> bool:
+        """Return true if the error of a call counts against the health of its endpoint."""
+        if isinstance(error, CircuitOpenError):
+            return False
+        if isinstance(error, ApiException):
+            return error.status_code in self.failure_statuses
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def acquire(self, key: str) -> None:
+        """
+        Check that a call may be sent through a circuit.
+
+        :raises CircuitOpenError: If the circuit is open, or half-open with all of
+                its trial calls in flight.
+        """
+        with self._lock:
+            now = time.monotonic()
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                circuit = self._circuits[key] = _Circuit(self.window_size)
+            changes = self._expire(key, circuit, now)
+            error = None
+            if circuit.state == CircuitState.OPEN:
+                error = CircuitOpenError(key, circuit.opened_at + self.open_duration - now)
+            elif circuit.state == CircuitState.HALF_OPEN:
+                if circuit.trial_calls >= self.half_open_calls:
+                    # Wait for the trial calls to decide; they finish within one open period.
+                    error = CircuitOpenError(key, self.open_duration)
+                else:
+                    circuit.trial_calls += 1
+        self._notify(changes)
+        if error is not None:
+            raise error
+
+    def record(self, key: str, duration: float, error: Optional[Exception] = None) -> None:
+        """
+        Record the outcome of a call sent through a circuit.
+
+        :param str key: The key of the circuit.
+        :param float duration: The number of seconds the call took.
+        :param Exception error: (optional) The error raised by the call, if any.
+        """
+        failed = error is not None and self.is_failure(error)
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return
+            if circuit.state == CircuitState.HALF_OPEN:
+                changes = self._record_trial(key, circuit, (failed, slow))
+            elif circuit.state == CircuitState.CLOSED:
+                circuit.outcomes.append((failed, slow))
+                changes = []
+                if len(circuit.outcomes) >= self.minimum_calls and self._is_unhealthy(circuit.outcomes):
+                    changes = self._transition(key, circuit, CircuitState.OPEN)
+            else:
+                # A call sent before the circuit opened.
+                changes = []
+        self._notify(changes)
+
+    def release(self, key: str) -> None:
+        """
+        Give back the trial call taken by `acquire` for a call that was abandoned,
+        such as a cancelled one, without recording an outcome.
+
+        :param str key: The key of the circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is not None and circuit.state == CircuitState.HALF_OPEN and circuit.trial_calls > 0:
+                circuit.trial_calls -= 1
+
+    def call(self, operation: Operation, send: Callable[[], object]) -> object:
+        """
+        Call `send` through the circuit of the operation and record its outcome.
+
+        :raises CircuitOpenError: If the circuit does not let the call through.
+        """
+        key = self.get_key(operation)
+        self.acquire(key)
+        start = time.monotonic()
+        try:
+            result = send()
+        except Exception as error:
+            self.record(key, time.monotonic() - start, error)
+            raise
+        except BaseException:
+            # The call was abandoned, e.g. cancelled: its outcome says nothing of the endpoint.
+            self.release(key)
+            raise
+        self.record(key, time.monotonic() - start)
+        return result
+
+    async def call_async(self, operation: Operation, send: Callable[[], Awaitable[object]]) -> object:
+        """
+        Await `send()` through the circuit of the operation and record its outcome (see `call`).
+        """
+        key = self.get_key(operation)
+        self.acquire(key)
+        start = time.monotonic()
+        try:
+            result = await send()
+        except Exception as error:
+            self.record(key, time.monotonic() - start, error)
+            raise
+        except BaseException:
+            # The call was abandoned, e.g. cancelled: its outcome says nothing of the endpoint.
+            self.release(key)
+            raise
+        self.record(key, time.monotonic() - start)
+        return result
+
+    def _is_unhealthy(self, outcomes: Iterable[Tuple[bool, bool]]) -> bool:
+        outcomes = list(outcomes)
+        failures = sum(1 for failed, _ in outcomes if failed)
+        slow_calls = sum(1 for _, slow in outcomes if slow)
+        return (
+            failures / len(outcomes) >= self.failure_rate_threshold
+            or slow_calls / len(outcomes) >= self.slow_call_rate_threshold
+        )
+
+    def _record_trial(self, key: str, circuit: _Circuit, outcome: Tuple[bool, bool]) -> list:
+        circuit.trial_outcomes.append(outcome)
+        if self._is_unhealthy(circuit.trial_outcomes):
+            return self._transition(key, circuit, CircuitState.OPEN)
+        if len(circuit.trial_outcomes) >= self.half_open_calls:
+            return self._transition(key, circuit, CircuitState.CLOSED)
+        return []
+
+    def _expire(self, key: str, circuit: _Circuit, now: float) -> list:
+        if circuit.state == CircuitState.OPEN and now - circuit.opened_at >= self.open_duration:
+            return self._transition(key, circuit, CircuitState.HALF_OPEN)
+        return []
+
+    def _transition(self, key: str, circuit: _Circuit, state: CircuitState) -> list:
+        previous = circuit.state
+        circuit.state = state
+        circuit.outcomes.clear()
+        circuit.trial_calls = 0
+        circuit.trial_outcomes = []
+        if state == CircuitState.OPEN:
+            circuit.opened_at = time.monotonic()
+        return [(key, previous, state)]
+
+    def _notify(self, changes: list) -> None:
+        # Called outside of the lock so that callbacks may use the breaker.
+        for key, previous, state in changes:
+            logger.debug('Circuit %s changed from %s to %s', key, previous.value, state.value)
+            for listener in self._listeners:
+                listener(key, previous, state)
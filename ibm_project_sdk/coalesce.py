@@ -0,0 +1,175 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides single-flight coalescing of identical read requests.
+"""
+
+from typing import Awaitable, Callable, Dict, Hashable
+import asyncio
+import threading
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import Operation
+
+
+class CoalescingStats:
+    """
+    A point-in-time snapshot of the requests seen by a coalescer.
+
+    :attr int hits: The number of calls that joined a request already in flight.
+    :attr int misses: The number of calls that sent their own request.
+    """
+
+    def __init__(self, *, hits: int = 0, misses: int = 0) -> None:
+        self.hits = hits
+        self.misses = misses
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'CoalescingStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'CoalescingStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class _Flight:
+    # One request in flight, shared by the calls waiting for it.
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """
+    Lets concurrent identical GET calls share one request.
+
+    The first call sends the request; calls with the same operation, URL, query
+    parameters and headers that arrive while it is in flight wait for it and
+    receive the same DetailedResponse (or the same error) instead of sending
+    their own. Nothing is kept once the request completes, so a later call
+    always sends a new request.
+
+    Callers that share a response must not modify its result.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, asyncio.Future] = {}
+        self._stats = CoalescingStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_coalesced(operation: Operation, kwargs: dict) -> bool:
+        """Return true if a call of the operation with these `send` arguments may share a request."""
+        # A streamed response can only be read once.
+        return operation.method == 'GET' and not kwargs.get('stream')
+
+    @staticmethod
+    def get_key(operation: Operation, request: dict) -> Hashable:
+        """Return the key identifying the calls that may share the request."""
+        return (
+            operation.operation_id,
+            request['url'],
+            tuple(sorted((name, str(value)) for name, value in (request.get('params') or {}).items())),
+            tuple(sorted((name.lower(), value) for name, value in (request.get('headers') or {}).items())),
+        )
+
+    def get_stats(self) -> CoalescingStats:
+        """Return a snapshot of the hit and miss counts."""
+        with self._lock:
+            return CoalescingStats(**self._stats.to_dict())
+
+    def execute(self, key: Hashable, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Call `send`, unless a call with the same key is in flight, and return its response.
+
+        :param key: The key of the request, from `get_key`.
+        :param Callable send: Sends the request.
+        :return: The response of the shared request.
+        :raises ApiException: The error of the shared request.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        try:
+            flight.response = send()
+            return flight.response
+        except Exception as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def execute_async(self, key: Hashable, send: Callable[[], Awaitable[DetailedResponse]]) -> DetailedResponse:
+        """
+        Await `send()`, unless a call with the same key is in flight in the same
+        event loop, and return its response.
+
+        :param key: The key of the request, from `get_key`.
+        :param Callable send: Returns a coroutine that sends the request.
+        :return: The response of the shared request.
+        :raises ApiException: The error of the shared request.
+        """
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        with self._lock:
+            future = self._async_flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._async_flights[key] = loop.create_future()
+                # Consume the outcome, so that a flight nobody joined does not log a warning.
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        if not leader:
+            # Shield the shared request from the cancellation of one of its waiters.
+            return await asyncio.shield(future)
+        try:
+            response = await send()
+        except BaseException as error:
+            if isinstance(error, Exception):
+                future.set_exception(error)
+            else:
+                future.cancel()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._async_flights[key]
@@ -18,7 +18,10 @@
 This module provides common methods for use across all service modules.
 """
 
+from types import MappingProxyType
+from typing import Callable, Iterable, Optional
 import platform
+import re
 from ibm_project_sdk.version import __version__
 
 HEADER_NAME_USER_AGENT = 'User-Agent'
@@ -66,3 +69,94 @@ def get_sdk_headers(service_name, service_version, operation_id):
     headers = {}
     headers[HEADER_NAME_USER_AGENT] = get_user_agent()
     return headers
+
+
+class Operation:
+    """
+    A precompiled description of a service operation.
+
+    The SDK headers, the HTTP method and the URL template of an operation never
+    change between calls, so they are computed once when the operation table is
+    built and each call only fills in the caller's headers and path parameters.
+
+    :param str service_name: The name of the service the operation belongs to.
+    :param str service_version: The version of the service API.
+    :param str operation_id: The operation ID used for SDK metrics.
+    :param str method: The HTTP method of the operation.
+    :param str path: The URL path template, e.g. '/v1/projects/{project_id}'.
+    :param str content_type: (optional) The content type of the request body.
+    :param str accept: (optional) The value of the Accept header, or None to
+           omit the header.
+    """
+
+    _PATH_PARAM = re.compile(r'\{(\w+)\}')
+
+    def __init__(
+        self,
+        service_name: str,
+        service_version: str,
+        operation_id: str,
+        method: str,
+        path: str,
+        *,
+        content_type: Optional[str] = None,
+        accept: Optional[str] = 'application/json',
+    ) -> None:
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.path_params = tuple(self._PATH_PARAM.findall(path))
+        self.accept = accept
+        headers = get_sdk_headers(
+            service_name=service_name,
+            service_version=service_version,
+            operation_id=operation_id,
+        )
+        if content_type is not None:
+            headers['content-type'] = content_type
+        self.headers = MappingProxyType(headers)
+        # Headers used when the caller does not pass any, with Accept already applied.
+        self._default_headers = dict(headers)
+        if accept is not None:
+            self._default_headers['Accept'] = accept
+        # Turn '/v1/projects/{project_id}' into the positional '/v1/projects/{0}'.
+        positions = iter(range(len(self.path_params)))
+        self._format_url = self._PATH_PARAM.sub(lambda _: '{%d}' % next(positions), path).format
+
+    def build_headers(self, headers: Optional[dict] = None) -> dict:
+        """
+        Return the request headers for a call, merging in the caller's headers.
+
+        The caller's headers override the SDK headers, except for Accept which is
+        always set by the operation.
+        """
+        if not headers:
+            return self._default_headers.copy()
+        merged = dict(self.headers)
+        merged.update(headers)
+        if self.accept is not None:
+            merged['Accept'] = self.accept
+        return merged
+
+    def build_url(self, path_values: Iterable[str] = ()) -> str:
+        """
+        Return the request path for a call from its already-encoded path parameter values,
+        given in the order they appear in the path template.
+        """
+        return self._format_url(*path_values)
+
+    def __str__(self) -> str:
+        return '{0} {1} ({2})'.format(self.method, self.path, self.operation_id)
+
+
+def add_response_hook(kwargs: dict, hook: Callable) -> None:
+    """
+    Add a `requests` response hook to the keyword arguments of a `send` call,
+    keeping any hooks the caller already passed.
+    """
+    hooks = dict(kwargs.get('hooks') or {})
+    response_hooks = hooks.get('response') or []
+    if callable(response_hooks):
+        response_hooks = [response_hooks]
+    hooks['response'] = list(response_hooks) + [hook]
+    kwargs['hooks'] = hooks
@@ -0,0 +1,148 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides size-based gzip compression of request bodies and
+accounting of the bytes saved by compressing requests and responses.
+"""
+
+from typing import Dict
+import gzip
+import threading
+
+import requests
+
+
+class CompressionConfig:
+    """
+    The settings of the opt-in request and response compression of a service client.
+
+    :param int threshold: (optional) The minimum size in bytes of a request body
+           before it is gzip-compressed.
+    :param int level: (optional) The gzip compression level, from 1 (fastest) to
+           9 (smallest).
+    :param bool compress_responses: (optional) Whether read operations ask the
+           server for gzip-encoded responses.
+    """
+
+    def __init__(self, *, threshold: int = 1024, level: int = 6, compress_responses: bool = True) -> None:
+        if threshold < 0:
+            raise ValueError('threshold must not be negative')
+        if not 1 <= level <= 9:
+            raise ValueError('level must be between 1 and 9')
+        self.threshold = threshold
+        self.level = level
+        self.compress_responses = compress_responses
+
+
+class CompressionStats:
+    """
+    A point-in-time snapshot of the bytes moved by a service client.
+
+    :attr int requests_compressed: The number of request bodies that were compressed.
+    :attr int request_bytes: The size of the request bodies before compression.
+    :attr int request_bytes_sent: The size of the request bodies as sent.
+    :attr int responses_compressed: The number of responses received gzip-encoded.
+    :attr int response_bytes: The size of the response bodies after decoding.
+    :attr int response_bytes_received: The size of the response bodies as received.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_compressed: int = 0,
+        request_bytes: int = 0,
+        request_bytes_sent: int = 0,
+        responses_compressed: int = 0,
+        response_bytes: int = 0,
+        response_bytes_received: int = 0,
+    ) -> None:
+        self.requests_compressed = requests_compressed
+        self.request_bytes = request_bytes
+        self.request_bytes_sent = request_bytes_sent
+        self.responses_compressed = responses_compressed
+        self.response_bytes = response_bytes
+        self.response_bytes_received = response_bytes_received
+
+    @property
+    def bytes_saved(self) -> int:
+        """The number of bytes that compression kept off the wire."""
+        return self.request_bytes - self.request_bytes_sent + self.response_bytes - self.response_bytes_received
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        _dict = dict(vars(self))
+        _dict['bytes_saved'] = self.bytes_saved
+        return _dict
+
+    def __str__(self) -> str:
+        return 'CompressionStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+
+class Compressor:
+    """Compresses request bodies and counts request and response bytes for one service client."""
+
+    def __init__(self, config: CompressionConfig) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._stats = CompressionStats()
+
+    def compress_request(self, request: dict) -> None:
+        """Gzip the body of a prepared request in place if it is at least `threshold` bytes."""
+        data = request.get('data')
+        if not isinstance(data, bytes):
+            return
+        headers = request['headers']
+        if 'content-encoding' in headers or len(data) < self.config.threshold:
+            self._add(request_bytes=len(data), request_bytes_sent=len(data))
+            return
+        compressed = gzip.compress(data, compresslevel=self.config.level)
+        headers['content-encoding'] = 'gzip'
+        request['data'] = compressed
+        self._add(requests_compressed=1, request_bytes=len(data), request_bytes_sent=len(compressed))
+
+    # pylint: disable=unused-argument
+    def count_response(self, response: requests.Response, *args, **kwargs) -> requests.Response:
+        """A `requests` response hook that counts the decoded and received sizes of a response body."""
+        if kwargs.get('stream'):
+            # Streamed bodies are read by the caller and are not counted.
+            return response
+        decoded = len(response.content or b'')
+        received = _received_bytes(response, decoded)
+        encoded = response.headers.get('Content-Encoding', '').lower() == 'gzip'
+        self._add(responses_compressed=int(encoded), response_bytes=decoded, response_bytes_received=received)
+        return response
+
+    def get_stats(self) -> CompressionStats:
+        """Return a snapshot of the byte counters."""
+        with self._lock:
+            return CompressionStats(**vars(self._stats))
+
+    def _add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+
+def _received_bytes(response: requests.Response, default: int) -> int:
+    content_length = response.headers.get('Content-Length')
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+    try:
+        # urllib3 counts the bytes read from the socket, before decoding.
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError, OSError):
+        return default
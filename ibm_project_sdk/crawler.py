@@ -0,0 +1,385 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a crawler that lists the projects of an account together
+with their environments, configurations, configuration versions and deployed
+resources.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, Optional
+import json
+import logging
+import queue
+import threading
+
+from ibm_cloud_sdk_core import get_query_param
+
+from .project_v1 import (
+    Environment,
+    ProjectConfigResource,
+    ProjectConfigSummary,
+    ProjectConfigVersionSummary,
+    ProjectSummary,
+    ProjectV1,
+    _require_sync_client,
+)
+
+logger = logging.getLogger(__name__)
+
+# The kinds of resources, and the model each kind is converted to.
+_MODELS = {
+    'projects': ProjectSummary,
+    'environments': Environment,
+    'configs': ProjectConfigSummary,
+    'versions': ProjectConfigVersionSummary,
+    'resources': ProjectConfigResource,
+}
+# The kinds listed for each resource of a kind.
+_CHILDREN = {
+    'projects': ('environments', 'configs'),
+    'configs': ('versions', 'resources'),
+}
+
+
+class CrawlRecord:
+    """
+    A resource found by a crawl.
+
+    :attr str kind: The kind of the resource: 'projects', 'environments',
+          'configs', 'versions' or 'resources'.
+    :attr object resource: The resource, e.g. a ProjectSummary for a project.
+    :attr str project_id: (optional) The ID of the project of the resource.
+    :attr str config_id: (optional) The ID of the configuration of a version or
+          deployed resource.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        resource: object,
+        *,
+        project_id: Optional[str] = None,
+        config_id: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a CrawlRecord object.
+
+        :param str kind: The kind of the resource.
+        :param object resource: The resource.
+        :param str project_id: (optional) The ID of the project of the resource.
+        :param str config_id: (optional) The ID of the configuration of the resource.
+        """
+        self.kind = kind
+        self.resource = resource
+        self.project_id = project_id
+        self.config_id = config_id
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this record."""
+        _dict = {'kind': self.kind, 'resource': self.resource.to_dict()}
+        if self.project_id is not None:
+            _dict['project_id'] = self.project_id
+        if self.config_id is not None:
+            _dict['config_id'] = self.config_id
+        return _dict
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CrawlRecord object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CrawlRecord') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CrawlRecord') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CrawlStats:
+    """
+    A point-in-time snapshot of the progress of a crawl.
+
+    :attr int requests: The number of list requests completed.
+    :attr int pending: The number of list requests queued or in flight.
+    :attr int errors: The number of list requests that failed and were skipped.
+    :attr int projects: The number of projects found.
+    :attr int environments: The number of environments found.
+    :attr int configs: The number of configurations found.
+    :attr int versions: The number of configuration versions found.
+    :attr int resources: The number of deployed resources found.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests: int = 0,
+        pending: int = 0,
+        errors: int = 0,
+        projects: int = 0,
+        environments: int = 0,
+        configs: int = 0,
+        versions: int = 0,
+        resources: int = 0,
+    ) -> None:
+        self.requests = requests
+        self.pending = pending
+        self.errors = errors
+        self.projects = projects
+        self.environments = environments
+        self.configs = configs
+        self.versions = versions
+        self.resources = resources
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'CrawlStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'CrawlStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class Crawler:
+    """
+    Lists the projects of an account and, for each of them, the environments and
+    configurations, and for each configuration its versions and deployed resources.
+
+    The list requests run on a pool of `max_workers` threads. As soon as a page
+    arrives, the request for the next page and the requests for the children of
+    its resources are queued, so the whole hierarchy is listed concurrently
+    instead of one level at a time. The resources are returned as CrawlRecord
+    objects, in the order they arrive, while the crawl is running; at most
+    `max_queued` records are buffered ahead of the caller.
+
+    The requests are sent by the client, so its retry policy, rate limiter and
+    circuit breaker apply to each of them; to use `max_workers` connections,
+    size the connection pool of the client accordingly (see `PoolConfig`).
+
+    A failed request stops the crawl and its error is raised by `crawl`, unless
+    `ignore_errors` is true, in which case the error is logged, counted, and the
+    resources under the failed request are skipped.
+
+    :param ProjectV1 client: The client sending the requests.
+    :param int max_workers: (optional) The maximum number of concurrent requests.
+    :param int limit: (optional) The maximum number of resources per page.
+    :param Iterable[str] kinds: (optional) The kinds of resources to return, among
+           'projects', 'environments', 'configs', 'versions' and 'resources'; all
+           of them if not set. Only the requests needed to find them are sent.
+    :param bool ignore_errors: (optional) Whether failed requests are skipped
+           instead of stopping the crawl.
+    :param Callable on_progress: (optional) Called with a CrawlStats snapshot
+           after each request, on the thread that sent it.
+    :param int max_queued: (optional) The maximum number of records buffered
+           ahead of the caller.
+    """
+
+    def __init__(
+        self,
+        client: ProjectV1,
+        *,
+        max_workers: int = 8,
+        limit: int = 100,
+        kinds: Optional[Iterable[str]] = None,
+        ignore_errors: bool = False,
+        on_progress: Optional[Callable[[CrawlStats], None]] = None,
+        max_queued: int = 1000,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be greater than 0')
+        if max_queued < 1:
+            raise ValueError('max_queued must be greater than 0')
+        kinds = frozenset(kinds) if kinds is not None else frozenset(_MODELS)
+        if not kinds or not kinds <= set(_MODELS):
+            raise ValueError('kinds must be a non-empty subset of {0}'.format(', '.join(_MODELS)))
+        _require_sync_client(client)
+        self.client = client
+        self.max_workers = max_workers
+        self.limit = limit
+        self.kinds = kinds
+        self.ignore_errors = ignore_errors
+        self.on_progress = on_progress
+        self.max_queued = max_queued
+        # Configurations are listed to find versions and deployed resources.
+        self._listed = kinds | {'projects'}
+        if kinds & {'versions', 'resources'}:
+            self._listed |= {'configs'}
+        self._lock = threading.Lock()
+        self._crawl = None
+
+    def crawl(self) -> Iterator[CrawlRecord]:
+        """
+        List the resources of the account.
+
+        Closing the iterator before the end, e.g. by leaving a loop over it,
+        cancels the requests not sent yet.
+
+        :return: An iterator over the resources found.
+        :rtype: Iterator[CrawlRecord]
+        :raises ApiException: The error of a failed request, unless `ignore_errors` is true.
+        """
+        with self._lock:
+            if self._crawl is not None and self._crawl.running:
+                raise RuntimeError('a crawl is already running')
+            crawl = self._crawl = _Crawl(self.max_workers, self.max_queued)
+        try:
+            self._schedule(crawl, 'projects')
+            while True:
+                record, error = crawl.records.get()
+                if error is not None:
+                    raise error
+                if record is None:
+                    return
+                yield record
+        finally:
+            crawl.closed.set()
+            with self._lock:
+                crawl.running = False
+                futures = list(crawl.futures)
+            for future in futures:
+                future.cancel()
+            crawl.executor.shutdown(wait=False)
+
+    def get_stats(self) -> CrawlStats:
+        """Return a snapshot of the progress of the current or last crawl."""
+        with self._lock:
+            if self._crawl is None:
+                return CrawlStats()
+            return CrawlStats(**self._crawl.stats.to_dict())
+
+    def _schedule(
+        self,
+        crawl: '_Crawl',
+        kind: str,
+        project_id: Optional[str] = None,
+        config_id: Optional[str] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            if not crawl.running:
+                return
+            crawl.stats.pending += 1
+            future = crawl.executor.submit(self._run, crawl, kind, project_id, config_id, token)
+            crawl.futures.add(future)
+        future.add_done_callback(partial(self._forget, crawl))
+
+    def _forget(self, crawl: '_Crawl', future: Future) -> None:
+        with self._lock:
+            crawl.futures.discard(future)
+
+    def _run(
+        self,
+        crawl: '_Crawl',
+        kind: str,
+        project_id: Optional[str],
+        config_id: Optional[str],
+        token: Optional[str],
+    ) -> None:
+        # Send one list request and queue the requests that follow from it.
+        sent = failed = False
+        try:
+            if not crawl.closed.is_set():
+                sent = True
+                self._list(crawl, kind, project_id, config_id, token)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            if not self.ignore_errors:
+                self._put(crawl, (None, error))
+            else:
+                logger.warning('Skipping the %s of project %s: %s', kind, project_id, error)
+                failed = True
+        with self._lock:
+            crawl.stats.pending -= 1
+            if sent:
+                crawl.stats.requests += 1
+            if failed:
+                crawl.stats.errors += 1
+            done = crawl.stats.pending == 0
+            stats = CrawlStats(**crawl.stats.to_dict())
+        if sent and self.on_progress is not None:
+            self.on_progress(stats)
+        if done:
+            self._put(crawl, (None, None))
+
+    def _list(
+        self,
+        crawl: '_Crawl',
+        kind: str,
+        project_id: Optional[str],
+        config_id: Optional[str],
+        token: Optional[str],
+    ) -> None:
+        if kind == 'projects':
+            response = self.client.list_projects(limit=self.limit, token=token)
+        elif kind == 'environments':
+            response = self.client.list_project_environments(project_id=project_id, limit=self.limit, token=token)
+        elif kind == 'configs':
+            response = self.client.list_configs(project_id=project_id, limit=self.limit, token=token)
+        elif kind == 'versions':
+            response = self.client.list_config_versions(project_id=project_id, id=config_id)
+        else:
+            response = self.client.list_config_resources(project_id=project_id, id=config_id)
+        result = response.get_result()
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next_token = get_query_param(next_page_link.get('href'), 'token')
+            if next_token is not None:
+                self._schedule(crawl, kind, project_id, config_id, next_token)
+        for item in result.get(kind) or ():
+            if kind == 'projects':
+                project_id = item['id']
+            elif kind == 'configs':
+                config_id = item['id']
+            for child in _CHILDREN.get(kind, ()):
+                if child in self._listed:
+                    self._schedule(crawl, child, project_id, config_id)
+            if kind in self.kinds:
+                resource = _MODELS[kind].from_dict(item)
+                with self._lock:
+                    setattr(crawl.stats, kind, getattr(crawl.stats, kind) + 1)
+                self._put(crawl, (CrawlRecord(kind, resource, project_id=project_id, config_id=config_id), None))
+
+    @staticmethod
+    def _put(crawl: '_Crawl', entry: tuple) -> None:
+        # Queue a record for the caller, waiting for room unless the crawl is closed.
+        while not crawl.closed.is_set():
+            try:
+                crawl.records.put(entry, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class _Crawl:
+    # The state of one call of Crawler.crawl. The workers of a closed crawl may
+    # still be running when the next one starts, so each crawl has its own.
+
+    def __init__(self, max_workers: int, max_queued: int) -> None:
+        self.stats = CrawlStats()
+        self.records = queue.Queue(maxsize=max_queued)
+        self.closed = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ibm-project-crawl')
+        # The requests not completed yet, cancelled when the crawl is closed.
+        self.futures = set()
+        self.running = True
@@ -0,0 +1,283 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides hedged requests: a read operation that is slower than
+usual is sent a second time, and the first response to arrive is used.
+"""
+
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional
+import contextvars
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .common import Operation
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    A histogram of the latencies of one operation, with logarithmic buckets.
+
+    Counts are halved every `decay_interval` samples, so that the histogram
+    follows changes in the latency of the service.
+
+    :param int decay_interval: (optional) The number of samples between decays.
+    """
+
+    # Bucket upper bounds from 1ms to about 2 minutes, each 20% wider than the previous one.
+    BOUNDS = tuple(0.001 * 1.2**i for i in range(65))
+
+    def __init__(self, decay_interval: int = 1000) -> None:
+        if decay_interval < 1:
+            raise ValueError('decay_interval must be greater than 0')
+        self.decay_interval = decay_interval
+        self._counts = [0.0] * (len(self.BOUNDS) + 1)
+        self._total = 0.0
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        with self._lock:
+            self._counts[bisect_left(self.BOUNDS, seconds)] += 1
+            self._total += 1
+            self._samples += 1
+            if self._samples % self.decay_interval == 0:
+                self._counts = [count / 2 for count in self._counts]
+                self._total /= 2
+
+    @property
+    def samples(self) -> int:
+        """The number of samples recorded."""
+        return self._samples
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Return the latency below which `percentile` percent of the samples fall, or
+        None if the histogram is empty. The value is rounded up to a bucket bound.
+        """
+        with self._lock:
+            if not self._total:
+                return None
+            target = self._total * percentile / 100
+            cumulative = 0.0
+            for index, count in enumerate(self._counts):
+                cumulative += count
+                if cumulative >= target and count:
+                    break
+        return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+
+
+class HedgingStats:
+    """
+    A point-in-time snapshot of the activity of a hedging policy.
+
+    :attr int requests: The number of calls of hedged operations.
+    :attr int hedged: The number of calls that sent a second request.
+    :attr int hedge_wins: The number of calls answered by the second request.
+    :attr int throttled: The number of calls that were slow enough to hedge but
+          were not, because of the extra load cap.
+    """
+
+    def __init__(self, *, requests: int = 0, hedged: int = 0, hedge_wins: int = 0, throttled: int = 0) -> None:
+        self.requests = requests
+        self.hedged = hedged
+        self.hedge_wins = hedge_wins
+        self.throttled = throttled
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'HedgingStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'HedgingStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class HedgingPolicy:
+    """
+    Sends a second request for a read operation call that has not been answered
+    within the usual latency of the operation, and uses whichever response
+    arrives first.
+
+    The hedge delay of each operation is a percentile of its recent latencies,
+    tracked by the policy; until `min_samples` calls have completed,
+    `initial_delay` is used. Only GET operations are hedged, and the number of
+    second requests is capped at `max_extra_load` times the number of calls.
+    The first request of a call starts at once on a thread of its own, so that
+    the delay does not include time spent waiting for a worker; the second
+    requests run on the worker threads of the policy, so `max_workers` bounds
+    the number of them in flight.
+
+    :param float percentile: (optional) The latency percentile used as hedge delay.
+    :param int min_samples: (optional) The number of samples needed before the
+           percentile is used.
+    :param float initial_delay: (optional) The hedge delay in seconds until enough
+           samples are known.
+    :param float min_delay: (optional) The minimum hedge delay in seconds.
+    :param float max_extra_load: (optional) The maximum ratio of second requests
+           to calls, e.g. 0.05 for at most 5% more requests.
+    :param Iterable[str] operations: (optional) The IDs of the GET operations to
+           hedge; all GET operations are hedged if not set.
+    :param int max_workers: (optional) The number of worker threads sending
+           second requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        initial_delay: float = 0.1,
+        min_delay: float = 0.001,
+        max_extra_load: float = 0.05,
+        operations: Optional[Iterable[str]] = None,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        if initial_delay < 0 or min_delay < 0:
+            raise ValueError('delays must not be negative')
+        if not 0 < max_extra_load <= 1:
+            raise ValueError('max_extra_load must be greater than 0 and at most 1')
+        if max_workers < 1:
+            raise ValueError('max_workers must be greater than 0')
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_extra_load = max_extra_load
+        self.operations = frozenset(operations) if operations is not None else None
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._stats = HedgingStats()
+        # One token per 1 / max_extra_load calls; a second request takes one.
+        self._budget = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ibm-project-hedge')
+
+    def is_hedged_operation(self, operation: Operation) -> bool:
+        """Return true if calls of the operation may be hedged."""
+        if operation.method != 'GET':
+            return False
+        return self.operations is None or operation.operation_id in self.operations
+
+    def get_histogram(self, operation_id: str) -> LatencyHistogram:
+        """Return the latency histogram of an operation."""
+        with self._lock:
+            histogram = self._histograms.get(operation_id)
+            if histogram is None:
+                histogram = self._histograms[operation_id] = LatencyHistogram()
+            return histogram
+
+    def get_delay(self, operation_id: str) -> float:
+        """Return the number of seconds to wait for the first request of a call before hedging it."""
+        histogram = self.get_histogram(operation_id)
+        if histogram.samples < self.min_samples:
+            return max(self.min_delay, self.initial_delay)
+        return max(self.min_delay, histogram.percentile(self.percentile))
+
+    def get_stats(self) -> HedgingStats:
+        """Return a snapshot of the activity of the policy."""
+        with self._lock:
+            return HedgingStats(**self._stats.to_dict())
+
+    def close(self) -> None:
+        """Stop the worker threads once the calls in flight have completed."""
+        self._executor.shutdown(wait=False)
+
+    def execute(self, operation: Operation, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Call `send`, and call it a second time if the first call is slow.
+
+        :param Operation operation: The operation being invoked.
+        :param Callable send: Sends one request of the call.
+        :return: The first successful response.
+        :raises ApiException: The error of the last request to fail, if both fail.
+        """
+        histogram = self.get_histogram(operation.operation_id)
+        delay = self.get_delay(operation.operation_id)
+        # The requests run in a copy of the caller's context, e.g. the timeout capped by the retry deadline.
+        first = Future()
+        threading.Thread(
+            target=self._run_first,
+            args=(first, contextvars.copy_context(), histogram, send),
+            name='ibm-project-hedge-first',
+            daemon=True,
+        ).start()
+        futures = [first]
+        done, _ = wait(futures, timeout=delay)
+        hedged = False
+        with self._lock:
+            self._stats.requests += 1
+            self._budget = min(1.0, self._budget + self.max_extra_load)
+            if not done:
+                if self._budget >= 1.0:
+                    self._budget -= 1.0
+                    self._stats.hedged += 1
+                    hedged = True
+                else:
+                    self._stats.throttled += 1
+        if hedged:
+            logger.debug('Hedging %s after %.3f seconds', operation.operation_id, delay)
+            futures.append(self._executor.submit(contextvars.copy_context().run, self._timed, histogram, send))
+        return self._first_result(futures)
+
+    def _first_result(self, futures: list) -> DetailedResponse:
+        # Return the first successful result, or raise the last error.
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in futures:
+                if future not in done:
+                    continue
+                if future.exception() is None:
+                    if future is not futures[0]:
+                        with self._lock:
+                            self._stats.hedge_wins += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    @classmethod
+    def _run_first(
+        cls, future: Future, context: contextvars.Context, histogram: LatencyHistogram, send: Callable
+    ) -> None:
+        future.set_running_or_notify_cancel()
+        try:
+            result = context.run(cls._timed, histogram, send)
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    @staticmethod
+    def _timed(histogram: LatencyHistogram, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        start = time.monotonic()
+        response = send()
+        histogram.record(time.monotonic() - start)
+        return response
@@ -0,0 +1,251 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a `requests` transport adapter that sends requests over
+HTTP/2 with httpx. It requires the `http2` extra:
+
+    pip install ibm-project-sdk[http2]
+"""
+
+from typing import Dict, Iterator, Optional, Tuple, Union
+import os
+import ssl
+import threading
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+# Connection-specific headers are not allowed in HTTP/2 requests.
+_HOP_BY_HOP_HEADERS = frozenset(['connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade'])
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    A transport adapter that multiplexes the requests of a session over a few
+    HTTP/2 connections.
+
+    The adapter plugs into `requests` like the default adapter, so requests are
+    still built by `prepare_request` and sent by `send`: only the connection
+    handling changes. HTTPS connections negotiate HTTP/2 with ALPN and fall back
+    to HTTP/1.1 when the server does not support it. Plain HTTP connections use
+    HTTP/1.1, unless `http1` is false, in which case HTTP/2 is used with prior
+    knowledge.
+
+    The transport-level retries of `BaseService.enable_retries` and proxies are
+    not supported; use a RetryPolicy for retries.
+
+    :param int max_connections: (optional) The maximum number of connections.
+    :param int max_keepalive_connections: (optional) The maximum number of idle
+           connections kept open.
+    :param float keepalive_expiry: (optional) The number of seconds an idle
+           connection is kept open.
+    :param bool http1: (optional) Whether HTTP/1.1 may be used.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = 5.0,
+        http1: bool = True,
+    ) -> None:
+        if httpx is None:
+            raise ImportError('HTTP2Adapter requires httpx; install it with "pip install ibm-project-sdk[http2]"')
+        super().__init__()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http1 = http1
+        # One client per TLS setting; each client owns its connection pool.
+        self._clients: Dict[Tuple, 'httpx.Client'] = {}
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        *,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, Tuple[str, str]] = None,
+        proxies: Optional[dict] = None,
+    ) -> requests.Response:
+        """Send a prepared request and return its response (see `BaseAdapter.send`)."""
+        client = self._get_client(verify, cert)
+        headers = [(name, value) for name, value in request.headers.items() if name.lower() not in _HOP_BY_HOP_HEADERS]
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        try:
+            http_request = client.build_request(
+                request.method, request.url, headers=headers, content=body, timeout=to_httpx_timeout(timeout)
+            )
+            http_response = client.send(http_request, stream=True)
+        except httpx.TransportError as error:
+            raise to_requests_exception(error, request) from error
+        return self.build_response(request, http_response)
+
+    def build_response(self, request: requests.PreparedRequest, http_response: 'httpx.Response') -> requests.Response:
+        """Wrap an httpx response, whose body has not been read yet, in a `requests` response."""
+        response = requests.Response()
+        response.status_code = http_response.status_code
+        response.headers = CaseInsensitiveDict(http_response.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = http_response.reason_phrase
+        response.raw = _RawResponse(http_response, request)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        """Close the connections of the adapter."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def _get_client(self, verify: Union[bool, str], cert: Union[None, str, Tuple[str, str]]) -> 'httpx.Client':
+        key = (verify, cert)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = httpx.Client(
+                    http1=self.http1,
+                    http2=True,
+                    verify=_ssl_context(verify, cert),
+                    limits=self.limits,
+                    trust_env=False,
+                )
+            return client
+
+
+class _RawResponse:
+    """
+    A file-like view of the body of an httpx response, used as `requests.Response.raw`.
+
+    httpx decodes the content encoding itself, so the bytes are returned decoded,
+    like urllib3 does with `decode_content=True`.
+    """
+
+    def __init__(self, http_response: 'httpx.Response', request: requests.PreparedRequest) -> None:
+        self._response = http_response
+        self._request = request
+        self._chunks = None
+        self._buffer = b''
+
+    def stream(self, chunk_size: Optional[int] = None, decode_content: bool = True) -> Iterator[bytes]:
+        # pylint: disable=unused-argument
+        """Yield the decoded body in chunks."""
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = True) -> bytes:
+        # pylint: disable=unused-argument
+        """Read up to `amt` bytes of the decoded body, or all of it."""
+        if self._chunks is None:
+            self._chunks = self._response.iter_bytes()
+        while amt is None or len(self._buffer) < amt:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                self.close()
+                break
+            except httpx.TransportError as error:
+                self.close()
+                raise to_requests_exception(error, self._request) from error
+        if amt is None:
+            data, self._buffer = self._buffer, b''
+        else:
+            data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def tell(self) -> int:
+        """Return the number of body bytes received so far, before decoding."""
+        return self._response.num_bytes_downloaded
+
+    @property
+    def http_version(self) -> str:
+        """The HTTP version of the response, e.g. 'HTTP/2'."""
+        return self._response.http_version
+
+    def close(self) -> None:
+        """Release the stream of the response."""
+        self._response.close()
+
+    def release_conn(self) -> None:
+        """Release the stream of the response."""
+        self._response.close()
+
+
+def _ssl_context(verify: Union[bool, str], cert: Union[None, str, Tuple[str, str]]) -> Union[bool, ssl.SSLContext]:
+    # Build the TLS settings from the `verify` and `cert` arguments of `requests`.
+    if verify is True and not cert:
+        return True
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str) and os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    elif isinstance(verify, str):
+        context = ssl.create_default_context(cafile=verify)
+    else:
+        context = ssl.create_default_context()
+    if isinstance(cert, tuple):
+        context.load_cert_chain(*cert)
+    elif cert:
+        context.load_cert_chain(cert)
+    return context
+
+
+def to_httpx_timeout(timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]) -> 'httpx.Timeout':
+    """Convert the `timeout` argument of `requests`, a number or a (connect, read) tuple, for httpx."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def to_requests_exception(
+    error: Exception, request: Optional[requests.PreparedRequest] = None
+) -> requests.exceptions.RequestException:
+    """
+    Convert an httpx transport error into the `requests` exception raised in the
+    same situation, so that retry policies and circuit breakers handle both alike.
+    """
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.ReadTimeout):
+        return requests.exceptions.ReadTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.Timeout(error, request=request)
+    return requests.exceptions.ConnectionError(error, request=request)
@@ -0,0 +1,698 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides the base classes of the pagers of list operations, either
+paginated with a `token` query parameter or returning their whole collection in
+one response.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple
+import io
+import json
+import queue
+import logging
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse, get_query_param
+
+from .streaming import StreamingCollection
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ExportStats:
+    """
+    A summary of the resources written by a pager to a file.
+
+    :attr int items: The number of resources written.
+    :attr int bytes_written: The number of bytes written.
+    """
+
+    def __init__(self, *, items: int = 0, bytes_written: int = 0) -> None:
+        self.items = items
+        self.bytes_written = bytes_written
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this summary."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'ExportStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'ExportStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class PagerCheckpoint:
+    """
+    The position of a pager in its collection, from which another pager can
+    resume, e.g. after a crash or in another process.
+
+    :param str token: (optional) The token of the page that holds the next
+           resource, or None for the first page.
+    :param int limit: (optional) The page size the token was issued for.
+    :param int offset: (optional) The number of resources of that page that
+           have already been returned.
+    :param bool done: (optional) Whether all the resources have been returned.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        done: bool = False,
+    ) -> None:
+        if offset < 0:
+            raise ValueError('offset must not be negative')
+        self.token = token
+        self.limit = limit
+        self.offset = offset
+        self.done = done
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PagerCheckpoint':
+        """Initialize a PagerCheckpoint object from a json dictionary."""
+        return cls(
+            token=_dict.get('token'),
+            limit=_dict.get('limit'),
+            offset=_dict.get('offset', 0),
+            done=_dict.get('done', False),
+        )
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this checkpoint."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PagerCheckpoint object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PagerCheckpoint') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PagerCheckpoint') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class AdaptiveLimitStats:
+    """
+    A point-in-time snapshot of the pages requested with an adaptive limit.
+
+    :attr int pages: The number of pages received.
+    :attr int items: The number of resources received.
+    :attr int bytes_received: The number of response bytes received.
+    :attr float elapsed: The total number of seconds spent waiting for pages.
+    :attr int limit: The limit of the next page request.
+    :attr dict limits: The number of pages requested with each limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        pages: int = 0,
+        items: int = 0,
+        bytes_received: int = 0,
+        elapsed: float = 0.0,
+        limit: int = 0,
+        limits: Optional[Dict[int, int]] = None,
+    ) -> None:
+        self.pages = pages
+        self.items = items
+        self.bytes_received = bytes_received
+        self.elapsed = elapsed
+        self.limit = limit
+        self.limits = dict(limits or {})
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'AdaptiveLimitStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'AdaptiveLimitStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class AdaptiveLimit:
+    """
+    Chooses the `limit` of each page request of a pager from the latency and size
+    of the pages received so far.
+
+    The per-resource latency and size are tracked as moving averages, and the
+    next limit is the largest one expected to stay within both the latency and
+    the byte budget of a page, clamped to `[min_limit, max_limit]`. The limit
+    shrinks at once when pages get slower or bigger, and at most doubles from
+    one page to the next. The fixed cost of a request is counted in the
+    per-resource latency, so the limit errs on the small side.
+
+    An AdaptiveLimit can be shared by the pagers of similar collections; it is
+    safe to use from several threads.
+
+    :param float target_latency: (optional) The number of seconds a page request
+           should take, or None for no latency budget.
+    :param int target_bytes: (optional) The number of bytes a page should hold,
+           or None for no size budget.
+    :param int initial_limit: (optional) The limit of the first page request.
+    :param int min_limit: (optional) The smallest limit, at least the minimum
+           accepted by the service (1).
+    :param int max_limit: (optional) The largest limit, at most the maximum
+           accepted by the service (100).
+    :param Callable on_page: (optional) Called with the limit, the number of
+           resources, the latency and the size in bytes of each page received.
+    """
+
+    MIN_LIMIT = 1
+    MAX_LIMIT = 100
+
+    def __init__(
+        self,
+        *,
+        target_latency: Optional[float] = 1.0,
+        target_bytes: Optional[int] = 1048576,
+        initial_limit: int = 10,
+        min_limit: int = MIN_LIMIT,
+        max_limit: int = MAX_LIMIT,
+        on_page: Optional[Callable[[int, int, float, int], None]] = None,
+    ) -> None:
+        if target_latency is not None and target_latency <= 0:
+            raise ValueError('target_latency must be greater than 0')
+        if target_bytes is not None and target_bytes <= 0:
+            raise ValueError('target_bytes must be greater than 0')
+        if not self.MIN_LIMIT <= min_limit <= max_limit <= self.MAX_LIMIT:
+            raise ValueError(
+                'min_limit and max_limit must satisfy {0} <= min_limit <= max_limit <= {1}'.format(
+                    self.MIN_LIMIT, self.MAX_LIMIT
+                )
+            )
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.on_page = on_page
+        self._limit = min(max(initial_limit, min_limit), max_limit)
+        self._item_latency = None
+        self._item_bytes = None
+        self._stats = AdaptiveLimitStats()
+        self._lock = threading.Lock()
+
+    def next_limit(self) -> int:
+        """Return the limit of the next page request."""
+        with self._lock:
+            return self._limit
+
+    def record(self, limit: int, items: int, latency: float, size: int) -> None:
+        """
+        Record a page received and adjust the limit of the next page request.
+
+        :param int limit: The limit of the page request.
+        :param int items: The number of resources in the page.
+        :param float latency: The number of seconds the request took.
+        :param int size: The size of the response in bytes.
+        """
+        with self._lock:
+            stats = self._stats
+            stats.pages += 1
+            stats.items += items
+            stats.bytes_received += size
+            stats.elapsed += latency
+            stats.limits[limit] = stats.limits.get(limit, 0) + 1
+            if items:
+                self._item_latency = _moving_average(self._item_latency, latency / items)
+                self._item_bytes = _moving_average(self._item_bytes, size / items)
+                self._limit = self._adjust(limit)
+            new_limit = self._limit
+        logger.debug(
+            'Page of %d resources (limit %d) in %.3f seconds, %d bytes; next limit %d',
+            items,
+            limit,
+            latency,
+            size,
+            new_limit,
+        )
+        if self.on_page is not None:
+            self.on_page(limit, items, latency, size)
+
+    def get_stats(self) -> AdaptiveLimitStats:
+        """Return a snapshot of the pages received so far."""
+        with self._lock:
+            return AdaptiveLimitStats(**dict(vars(self._stats), limit=self._limit))
+
+    def _adjust(self, limit: int) -> int:
+        wanted = self.max_limit
+        if self.target_latency is not None and self._item_latency > 0:
+            wanted = min(wanted, int(self.target_latency / self._item_latency))
+        if self.target_bytes is not None and self._item_bytes > 0:
+            wanted = min(wanted, int(self.target_bytes / self._item_bytes))
+        return min(max(min(wanted, 2 * limit), self.min_limit), self.max_limit)
+
+
+class Pager:
+    """
+    The base class of the pagers of token-paginated list operations.
+
+    Pages are returned by `get_next`, and iterating the pager yields the
+    resources one at a time. With `prefetch` set, a background thread requests
+    up to that many pages ahead of the caller, so that the processing of a page
+    overlaps with the requests for the next ones; the thread waits while that
+    many pages are queued. Errors of prefetched requests are raised by the call
+    that would have returned the page. Close the pager, or use it as a context
+    manager, to stop prefetching when not all pages are consumed.
+
+    `get_checkpoint` returns the position of the pager after the resources
+    returned so far; a pager created with that checkpoint returns the next
+    resources.
+
+    With an AdaptiveLimit, the limit of each page request is chosen from the
+    latency and size of the previous pages instead of being fixed.
+
+    With a `model`, the resources are returned as instances of the model,
+    converted with `from_dict`. When prefetching, each page is converted on a
+    pool of `decode_workers` threads as soon as it has been received, so that
+    the conversion overlaps with the requests for the next pages; pages are
+    returned in order.
+
+    Subclasses set `_collection_key` and implement `_list`.
+
+    :param int limit: (optional) The maximum number of resources per page; the
+           limit of the checkpoint, if any, takes precedence.
+    :param int prefetch: (optional) The number of pages to request ahead of the
+           caller, or 0 to request each page when it is needed.
+    :param PagerCheckpoint checkpoint: (optional) The position to resume from.
+    :param AdaptiveLimit adaptive_limit: (optional) Chooses the limit of each
+           page request, overriding `limit`.
+    :param type model: (optional) The model class the resources are converted to.
+    :param int decode_workers: (optional) The number of threads converting
+           prefetched pages to models.
+    """
+
+    _collection_key = None
+
+    def __init__(
+        self,
+        *,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[PagerCheckpoint] = None,
+        adaptive_limit: Optional[AdaptiveLimit] = None,
+        model: Optional[type] = None,
+        decode_workers: int = 1,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError('prefetch must not be negative')
+        if decode_workers < 1:
+            raise ValueError('decode_workers must be greater than 0')
+        checkpoint = checkpoint or PagerCheckpoint()
+        self._limit = checkpoint.limit if checkpoint.limit is not None else limit
+        self._adaptive_limit = adaptive_limit
+        self._has_next = not checkpoint.done
+        self._page_context = {'next': checkpoint.token}
+        self._prefetch = prefetch
+        self._model = model
+        self._decode_workers = decode_workers
+        self._decoder = None
+        self._pages = None
+        self._thread = None
+        self._closed = threading.Event()
+        # The resources of the first page that were returned before the checkpoint.
+        self._skip = checkpoint.offset
+        # The position after the resources returned so far, as the token, offset and limit
+        # of their page, and whether they were the last ones.
+        self._position = (checkpoint.token, checkpoint.offset, self._limit)
+        self._done = checkpoint.done
+        self._items = iter(())
+        self._page_start = None
+        self._page_end = None
+        self._page_length = 0
+        self._page_returned = 0
+
+    def has_next(self) -> bool:
+        """
+        Returns true if there are potentially more results to be retrieved.
+        """
+        return self._has_next
+
+    def get_next(self) -> List[dict]:
+        """
+        Returns the next page of results.
+        :return: A List[dict], where each element is a dict that represents a resource.
+        :rtype: List[dict]
+        """
+        if not self.has_next():
+            raise StopIteration('No more results available')
+        page, _, end = self._get_page()
+        self._items = iter(())
+        self._position = end
+        self._done = not self._has_next
+        return page
+
+    def get_all(self) -> List[dict]:
+        """
+        Returns all results by invoking get_next() repeatedly
+        until all pages of results have been retrieved.
+        :return: A List[dict], where each element is a dict that represents a resource.
+        :rtype: List[dict]
+        """
+        results = []
+        while self.has_next():
+            next_page = self.get_next()
+            results.extend(next_page)
+        return results
+
+    def get_checkpoint(self) -> PagerCheckpoint:
+        """
+        Returns the position of the pager after the results returned so far.
+        :rtype: PagerCheckpoint
+        """
+        token, offset, limit = self._position
+        return PagerCheckpoint(token=token, limit=limit, offset=offset, done=self._done)
+
+    def iter_all(self) -> Iterator[dict]:
+        """
+        Yields all results one at a time, requesting the pages as they are needed.
+
+        Unlike get_all(), only the current page (and the prefetched ones) are held
+        in memory. The pager is closed when the generator is.
+        """
+        try:
+            yield from self
+        finally:
+            self.close()
+
+    def write_ndjson(self, fp: IO) -> ExportStats:
+        """
+        Write all results to a file, one JSON document per line, while paginating.
+
+        :param IO fp: A text or binary file-like object.
+        :return: The number of resources and bytes written.
+        :rtype: ExportStats
+        """
+        write = _writer(fp)
+        stats = ExportStats()
+        for item in self.iter_all():
+            stats.bytes_written += write(json.dumps(_to_json(item), separators=(',', ':')) + '\n')
+            stats.items += 1
+        return stats
+
+    def write_json_array(self, fp: IO) -> ExportStats:
+        """
+        Write all results to a file as one JSON array, while paginating.
+
+        :param IO fp: A text or binary file-like object.
+        :return: The number of resources and bytes written.
+        :rtype: ExportStats
+        """
+        write = _writer(fp)
+        stats = ExportStats()
+        separator = '['
+        for item in self.iter_all():
+            stats.bytes_written += write(separator + json.dumps(_to_json(item), separators=(',', ':')))
+            stats.items += 1
+            separator = ','
+        stats.bytes_written += write(']' if stats.items else '[]')
+        return stats
+
+    def close(self) -> None:
+        """
+        Stop prefetching pages. The pager returns no more results afterwards.
+        """
+        self._has_next = False
+        self._items = iter(())
+        self._closed.set()
+        if self._pages is not None:
+            # Make room for a page the prefetch thread may be waiting to queue, and
+            # drop the conversions of the queued pages.
+            try:
+                while True:
+                    result, _ = self._pages.get_nowait()
+                    if result is not None and isinstance(result[0], Future):
+                        result[0].cancel()
+            except queue.Empty:
+                pass
+        if self._decoder is not None:
+            self._decoder.shutdown(wait=False)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self
+
+    def __next__(self) -> dict:
+        while True:
+            item = next(self._items, _MISSING)
+            if item is not _MISSING:
+                self._page_returned += 1
+                if self._page_returned == self._page_length:
+                    self._position = self._page_end
+                    self._done = not self._has_next
+                else:
+                    token, offset, limit = self._page_start
+                    self._position = (token, offset + self._page_returned, limit)
+                return item
+            if not self.has_next():
+                raise StopIteration
+            page, self._page_start, self._page_end = self._get_page()
+            page = page or []
+            self._items = iter(page)
+            self._page_length = len(page)
+            self._page_returned = 0
+            if not page:
+                self._position = self._page_end
+                self._done = not self._has_next
+
+    def __enter__(self) -> 'Pager':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _get_page(self) -> Tuple[List[dict], tuple, tuple]:
+        # Return the next page with the positions before and after it, from the prefetch queue if enabled.
+        if not self._prefetch:
+            page, start, end, self._has_next = self._fetch_page()
+            if self._model is not None and page:
+                page = _from_dicts(self._model, page)
+            return page, start, end
+        if self._thread is None:
+            self._pages = queue.Queue(maxsize=self._prefetch)
+            if self._model is not None:
+                self._decoder = ThreadPoolExecutor(
+                    max_workers=self._decode_workers, thread_name_prefix='ibm-project-decode'
+                )
+            self._thread = threading.Thread(target=self._produce, name='ibm-project-pager', daemon=True)
+            self._thread.start()
+        result, error = self._pages.get()
+        if error is None:
+            page, start, end, has_next = result
+            try:
+                if isinstance(page, Future):
+                    page = page.result()
+            except Exception as decode_error:  # pylint: disable=broad-exception-caught
+                error = decode_error
+        if error is not None:
+            self._has_next = False
+            raise error
+        self._has_next = has_next
+        return page, start, end
+
+    def _fetch_page(self) -> Tuple[List[dict], tuple, tuple, bool]:
+        # Request the page at the current token and return it with the positions
+        # before and after it, and whether more pages follow.
+        token = self._page_context.get('next')
+        adaptive_limit = self._adaptive_limit
+        # A page resumed at an offset is requested with the limit of the checkpoint,
+        # so that the offset falls within it.
+        if adaptive_limit is not None and not self._skip:
+            self._limit = adaptive_limit.next_limit()
+        limit = self._limit
+        start = time.monotonic()
+        response = self._list(token)
+        latency = time.monotonic() - start
+        result = response.get_result()
+        if adaptive_limit is not None:
+            items = len(result.get(self._collection_key) or ())
+            adaptive_limit.record(limit, items, latency, _response_size(response, result))
+        next_token = None
+        next_page_link = result.get('next')
+        if next_page_link is not None:
+            next_token = get_query_param(next_page_link.get('href'), 'token')
+        self._page_context['next'] = next_token
+        page = result.get(self._collection_key)
+        skip, self._skip = self._skip, 0
+        if skip and page is not None:
+            page = page[skip:]
+        return page, (token, skip, limit), (next_token, 0, limit), next_token is not None
+
+    def _produce(self) -> None:
+        has_next = True
+        try:
+            while has_next and not self._closed.is_set():
+                try:
+                    page, start, end, has_next = self._fetch_page()
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    self._pages.put((None, error))
+                    return
+                if self._decoder is not None and page:
+                    if self._closed.is_set():
+                        return
+                    # The page is converted while the next one is being requested.
+                    try:
+                        page = self._decoder.submit(_from_dicts, self._model, page)
+                    except RuntimeError:
+                        # The pager was closed and its decoder shut down.
+                        return
+                self._pages.put(((page, start, end, has_next), None))
+                if self._closed.is_set() and isinstance(page, Future):
+                    page.cancel()
+        finally:
+            if self._decoder is not None:
+                self._decoder.shutdown(wait=False)
+
+    def _list(self, token: Optional[str]) -> DetailedResponse:
+        raise NotImplementedError()
+
+
+class StreamingPager(Pager):
+    """
+    The base class of the pagers of list operations that return their whole
+    collection in one response.
+
+    The response is streamed and decoded incrementally, and the pager splits its
+    elements into pages of `page_size` resources, so that, as with the other
+    pagers, only the current page (and the prefetched ones) are held in memory.
+    With `prefetch` set, a background thread decodes up to that many pages ahead
+    of the caller. The offset of a checkpoint counts the resources returned
+    from the start of the collection.
+
+    Subclasses implement `_stream`.
+
+    :param int page_size: (optional) The number of resources per page.
+    :param int prefetch: (optional) The number of pages to decode ahead of the
+           caller, or 0 to decode each page when it is needed.
+    :param PagerCheckpoint checkpoint: (optional) The position to resume from.
+    :param type model: (optional) The model class the resources are converted to.
+    :param int decode_workers: (optional) The number of threads converting
+           prefetched pages to models.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_size: int = 100,
+        prefetch: int = 0,
+        checkpoint: Optional[PagerCheckpoint] = None,
+        model: Optional[type] = None,
+        decode_workers: int = 1,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError('page_size must be greater than 0')
+        super().__init__(prefetch=prefetch, checkpoint=checkpoint, model=model, decode_workers=decode_workers)
+        self._page_size = page_size
+        self._collection = None
+        self._lookahead = []
+        self._decoded = 0
+
+    def close(self) -> None:
+        """
+        Stop decoding and release the connection of the response. The pager
+        returns no more results afterwards.
+        """
+        super().close()
+        if self._thread is None:
+            self._release()
+
+    def _fetch_page(self) -> Tuple[List[dict], tuple, tuple, bool]:
+        # Decode the next page, and one more resource to tell whether another page follows.
+        if self._collection is None:
+            self._collection = self._stream()
+            self._decoded, self._skip = self._skip, 0
+            deque(islice(self._collection, self._decoded), maxlen=0)
+        start = self._decoded
+        page = self._lookahead + list(islice(self._collection, self._page_size - len(self._lookahead)))
+        self._lookahead = list(islice(self._collection, 1))
+        self._decoded += len(page)
+        if not self._lookahead:
+            self._release()
+        return page, (None, start, self._limit), (None, self._decoded, self._limit), bool(self._lookahead)
+
+    def _produce(self) -> None:
+        try:
+            super()._produce()
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        collection, self._collection = self._collection, None
+        if collection is not None:
+            collection.close()
+
+    def _stream(self) -> StreamingCollection:
+        raise NotImplementedError()
+
+
+def _writer(fp: IO) -> Callable[[str], int]:
+    # Return a function writing ASCII text to fp and returning the number of bytes written.
+    # json.dumps escapes non-ASCII characters, so the text and byte lengths are the same.
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fp, 'mode', ''):
+
+        def write(text: str) -> int:
+            fp.write(text.encode('ascii'))
+            return len(text)
+
+    else:
+
+        def write(text: str) -> int:
+            fp.write(text)
+            return len(text)
+
+    return write
+
+
+def _moving_average(average: Optional[float], sample: float, weight: float = 0.5) -> float:
+    if average is None:
+        return sample
+    return average + weight * (sample - average)
+
+
+def _response_size(response: DetailedResponse, result: dict) -> int:
+    # The size of the response body as received, or of its JSON encoding if unknown.
+    content_length = (response.get_headers() or {}).get('Content-Length')
+    if content_length is not None and str(content_length).isdigit():
+        return int(content_length)
+    return len(json.dumps(result, separators=(',', ':')))
+
+
+def _from_dicts(model: type, page: List[dict]) -> list:
+    return [model.from_dict(item) for item in page]
+
+
+def _to_json(item: object) -> object:
+    return item.to_dict() if hasattr(item, 'to_dict') else item
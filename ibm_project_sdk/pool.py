@@ -0,0 +1,241 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a configurable, instrumented HTTP connection pool
+for use by the service clients.
+"""
+
+from functools import partial
+from typing import Dict, Optional
+import threading
+import time
+
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class PoolConfig:
+    """
+    The sizing and keep-alive behaviour of the connection pool used by a service client.
+
+    :param int max_connections_per_host: (optional) The maximum number of connections
+           kept per host. When `block` is true this is also the maximum number of
+           concurrent requests per host.
+    :param int max_hosts: (optional) The number of per-host pools to cache.
+    :param int max_idle: (optional) The maximum number of idle connections retained
+           per host; connections returned beyond this number are closed.
+    :param float idle_timeout: (optional) The number of seconds after which an idle
+           connection is closed instead of being reused.
+    :param bool block: (optional) Whether a request waits for a free connection when
+           the pool is exhausted, instead of opening a throwaway connection.
+    :param float pool_timeout: (optional) The maximum number of seconds to wait for a
+           free connection when `block` is true.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int = 10,
+        max_hosts: int = 10,
+        max_idle: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        block: bool = False,
+        pool_timeout: Optional[float] = None,
+    ) -> None:
+        if max_connections_per_host < 1:
+            raise ValueError('max_connections_per_host must be greater than 0')
+        if max_hosts < 1:
+            raise ValueError('max_hosts must be greater than 0')
+        if max_idle is not None and max_idle < 0:
+            raise ValueError('max_idle must not be negative')
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError('idle_timeout must be greater than 0')
+        self.max_connections_per_host = max_connections_per_host
+        self.max_hosts = max_hosts
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.block = block
+        self.pool_timeout = pool_timeout
+
+    def __str__(self) -> str:
+        return 'PoolConfig({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in vars(self).items()))
+
+
+class PoolStats:
+    """
+    A point-in-time snapshot of connection pool activity.
+
+    :attr int active: The number of connections currently checked out.
+    :attr int idle: The number of warm connections waiting to be reused.
+    :attr int requests: The number of connection checkouts.
+    :attr int reused: The number of checkouts that were served by a warm connection.
+    :attr int opened: The number of new connections opened.
+    :attr int expired: The number of idle connections closed by the idle timeout.
+    :attr int waits: The number of checkouts that found the pool exhausted.
+    """
+
+    def __init__(
+        self,
+        *,
+        active: int = 0,
+        idle: int = 0,
+        requests: int = 0,
+        reused: int = 0,
+        opened: int = 0,
+        expired: int = 0,
+        waits: int = 0,
+    ) -> None:
+        self.active = active
+        self.idle = idle
+        self.requests = requests
+        self.reused = reused
+        self.opened = opened
+        self.expired = expired
+        self.waits = waits
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return dict(vars(self))
+
+    def __str__(self) -> str:
+        return 'PoolStats({0})'.format(', '.join('{0}={1}'.format(k, v) for k, v in self.to_dict().items()))
+
+    def __eq__(self, other: 'PoolStats') -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+
+class _PoolTracker:
+    """Thread-safe counters shared by all the per-host pools of one adapter."""
+
+    def __init__(self, config: PoolConfig) -> None:
+        self.config = config
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+
+    def add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, max(0, getattr(self._stats, name) + delta))
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**self._stats.to_dict())
+
+
+class _TrackedPoolMixin:
+    """Adds idle management and statistics to a urllib3 connection pool."""
+
+    def __init__(self, *args, tracker: _PoolTracker, **kwargs) -> None:
+        self._tracker = tracker
+        self._idle_count = 0
+        self._idle_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        self._tracker.add(opened=1)
+        return conn
+
+    def _get_conn(self, timeout=None):
+        if timeout is None:
+            # urllib3 waits forever for a free connection in blocking mode otherwise.
+            timeout = self._tracker.config.pool_timeout
+        exhausted = self.block and self.pool is not None and self.pool.empty()
+        conn = super()._get_conn(timeout=timeout)
+        deltas = {'requests': 1, 'active': 1, 'waits': int(exhausted)}
+        idle_since = getattr(conn, '_pool_idle_since', None)
+        if idle_since is not None:
+            conn._pool_idle_since = None
+            with self._idle_lock:
+                self._idle_count -= 1
+            deltas['idle'] = -1
+            idle_timeout = self._tracker.config.idle_timeout
+            if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                # The connection reconnects transparently on its next request.
+                conn.close()
+                deltas['expired'] = 1
+                deltas['opened'] = 1
+            elif getattr(conn, 'sock', None) is None:
+                # The server dropped the connection while it was idle.
+                deltas['opened'] = 1
+            else:
+                deltas['reused'] = 1
+        self._tracker.add(**deltas)
+        return conn
+
+    def _put_conn(self, conn) -> None:
+        deltas = {'active': -1}
+        if conn is not None and getattr(conn, 'sock', None) is not None and not self._is_full():
+            max_idle = self._tracker.config.max_idle
+            with self._idle_lock:
+                keep = max_idle is None or self._idle_count < max_idle
+                if keep:
+                    self._idle_count += 1
+            if keep:
+                conn._pool_idle_since = time.monotonic()
+                deltas['idle'] = 1
+            else:
+                conn.close()
+                conn = None
+        self._tracker.add(**deltas)
+        super()._put_conn(conn)
+
+    def _is_full(self) -> bool:
+        # A full pool discards the connection instead of keeping it idle.
+        return self.pool is None or self.pool.full()
+
+    def close(self) -> None:
+        with self._idle_lock:
+            idle, self._idle_count = self._idle_count, 0
+        self._tracker.add(idle=-idle)
+        super().close()
+
+
+class _TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class _TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(SSLHTTPAdapter):
+    """
+    An SSLHTTPAdapter whose connection pools are sized by a PoolConfig and
+    report their activity through `get_stats()`.
+    """
+
+    def __init__(self, *args, pool_config: Optional[PoolConfig] = None, **kwargs) -> None:
+        self.pool_config = pool_config or PoolConfig()
+        self._tracker = _PoolTracker(self.pool_config)
+        kwargs.setdefault('pool_connections', self.pool_config.max_hosts)
+        kwargs.setdefault('pool_maxsize', self.pool_config.max_connections_per_host)
+        kwargs.setdefault('pool_block', self.pool_config.block)
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': partial(_TrackedHTTPConnectionPool, tracker=self._tracker),
+            'https': partial(_TrackedHTTPSConnectionPool, tracker=self._tracker),
+        }
+
+    def get_stats(self) -> PoolStats:
+        """Return a snapshot of the connection pool activity."""
+        return self._tracker.snapshot()
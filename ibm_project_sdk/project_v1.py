@@ -22,39 +22,129 @@ Manage infrastructure as code in IBM Cloud.
 API Version: 1.0.0
 """
 
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 import json
 
-from ibm_cloud_sdk_core import BaseService, DetailedResponse, get_query_param
+from ibm_cloud_sdk_core import BaseService, DetailedResponse
 from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
 from ibm_cloud_sdk_core.get_authenticator import get_authenticator_from_environment
 from ibm_cloud_sdk_core.utils import convert_model, datetime_to_string, string_to_datetime
+from requests.adapters import BaseAdapter
+
+from .batch import BatchItem, BatchResult, run_batch, unique_ids
+from .cache import CacheStats, ConditionalCache, NegativeCache, ResponseCache
+from .circuit import CircuitBreaker
+from .coalesce import CoalescingStats, RequestCoalescer
+from .common import Operation, add_response_hook
+from .compression import CompressionConfig, CompressionStats, Compressor
+from .hedging import HedgingPolicy, HedgingStats
+from .pagers import AdaptiveLimit, Pager, PagerCheckpoint, StreamingPager
+from .pool import PoolConfig, PooledHTTPAdapter, PoolStats
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import StreamingCollection
+from .token_store import TokenStore
+from .version_cache import VersionCache
 
-from .common import get_sdk_headers
+##############################################################################
+# Operations
+##############################################################################
+
+_operation = partial(Operation, 'project', 'V1')
+_json_operation = partial(_operation, content_type='application/json')
+
+_OPERATIONS = {
+    operation.operation_id: operation
+    for operation in [
+        _json_operation('create_project', 'POST', '/v1/projects'),
+        _operation('list_projects', 'GET', '/v1/projects'),
+        _operation('get_project', 'GET', '/v1/projects/{id}'),
+        _json_operation('update_project', 'PATCH', '/v1/projects/{id}'),
+        _operation('delete_project', 'DELETE', '/v1/projects/{id}'),
+        _json_operation('create_project_environment', 'POST', '/v1/projects/{project_id}/environments'),
+        _operation('list_project_environments', 'GET', '/v1/projects/{project_id}/environments'),
+        _operation('get_project_environment', 'GET', '/v1/projects/{project_id}/environments/{id}'),
+        _json_operation('update_project_environment', 'PATCH', '/v1/projects/{project_id}/environments/{id}'),
+        _operation('delete_project_environment', 'DELETE', '/v1/projects/{project_id}/environments/{id}'),
+        _json_operation('create_config', 'POST', '/v1/projects/{project_id}/configs'),
+        _operation('list_configs', 'GET', '/v1/projects/{project_id}/configs'),
+        _operation('get_config', 'GET', '/v1/projects/{project_id}/configs/{id}'),
+        _json_operation('update_config', 'PATCH', '/v1/projects/{project_id}/configs/{id}'),
+        _operation('delete_config', 'DELETE', '/v1/projects/{project_id}/configs/{id}'),
+        _json_operation('force_approve', 'POST', '/v1/projects/{project_id}/configs/{id}/force_approve'),
+        _json_operation('approve', 'POST', '/v1/projects/{project_id}/configs/{id}/approve'),
+        _operation('validate_config', 'POST', '/v1/projects/{project_id}/configs/{id}/validate'),
+        _operation('deploy_config', 'POST', '/v1/projects/{project_id}/configs/{id}/deploy'),
+        _operation('undeploy_config', 'POST', '/v1/projects/{project_id}/configs/{id}/undeploy'),
+        _json_operation('sync_config', 'POST', '/v1/projects/{project_id}/configs/{id}/sync', accept=None),
+        _operation('list_config_resources', 'GET', '/v1/projects/{project_id}/configs/{id}/resources'),
+        _json_operation('create_stack_definition', 'POST', '/v1/projects/{project_id}/configs/{id}/stack_definition'),
+        _operation('get_stack_definition', 'GET', '/v1/projects/{project_id}/configs/{id}/stack_definition'),
+        _json_operation('update_stack_definition', 'PATCH', '/v1/projects/{project_id}/configs/{id}/stack_definition'),
+        _json_operation(
+            'export_stack_definition', 'POST', '/v1/projects/{project_id}/configs/{id}/stack_definition/export'
+        ),
+        _operation('list_config_versions', 'GET', '/v1/projects/{project_id}/configs/{id}/versions'),
+        _operation('get_config_version', 'GET', '/v1/projects/{project_id}/configs/{id}/versions/{version}'),
+        _operation('delete_config_version', 'DELETE', '/v1/projects/{project_id}/configs/{id}/versions/{version}'),
+    ]
+}
 
 ##############################################################################
 # Service
 ##############################################################################
 
 
-class ProjectV1(BaseService):
-    """The project V1 service."""
+# The timeout of the attempt being sent once capped by the deadline of the
+# retry policy; it replaces the timeout of the HTTP configuration.
+_attempt_timeout: ContextVar = ContextVar('attempt_timeout', default=None)
+
+
+def _send_with_attempt_timeout(send: Callable[[dict], DetailedResponse], kwargs: dict) -> DetailedResponse:
+    token = _attempt_timeout.set(kwargs.get('timeout'))
+    try:
+        return send(kwargs)
+    finally:
+        _attempt_timeout.reset(token)
+
+
+class _ProjectV1Base(BaseService):
+    """
+    The configuration and the operations shared by ProjectV1 and AsyncProjectV1.
+
+    The operation methods validate their arguments and hand the request to
+    `_invoke`, which each client implements: ProjectV1 sends the request and
+    returns the response, AsyncProjectV1 returns a coroutine that sends it.
+    """
 
     DEFAULT_SERVICE_URL = 'https://projects.api.cloud.ibm.com'
     DEFAULT_SERVICE_NAME = 'project'
+    # Whether the operation methods return coroutines instead of responses.
+    _is_async = False
 
     @classmethod
     def new_instance(
         cls,
         service_name: str = DEFAULT_SERVICE_NAME,
-    ) -> 'ProjectV1':
+        *,
+        token_store: Optional[TokenStore] = None,
+    ) -> '_ProjectV1Base':
         """
         Return a new client for the project service using the specified parameters
                and external configuration.
+
+        :param TokenStore token_store: (optional) A store through which the
+               authenticator shares its tokens with the other processes of the
+               host, so that the workers of a server request one token between
+               them.
         """
         authenticator = get_authenticator_from_environment(service_name)
+        if token_store is not None:
+            token_store.attach(authenticator)
         service = cls(authenticator)
         service.configure_service(service_name)
         return service
@@ -62,6 +152,8 @@ class ProjectV1(BaseService):
     def __init__(
         self,
         authenticator: Authenticator = None,
+        *,
+        pool_config: Optional[PoolConfig] = None,
     ) -> None:
         """
         Construct a new client for the project service.
@@ -69,9 +161,410 @@ class ProjectV1(BaseService):
         :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
                Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
                about initializing the authenticator of your choice.
-        """
+        :param PoolConfig pool_config: (optional) The sizing of the HTTP connection pool
+               shared by all the threads that use this client.
+        """
+        self.pool_config = pool_config or PoolConfig()
+        self._compressor = None
+        self._retry_policy = None
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._coalescer = None
+        self._conditional_cache = None
+        self._response_cache = None
+        self._version_cache = None
+        self._negative_cache = None
         BaseService.__init__(self, service_url=self.DEFAULT_SERVICE_URL, authenticator=authenticator)
 
+    #########################
+    # Compression
+    #########################
+
+    def enable_compression(self, threshold: int = 1024, level: int = 6, compress_responses: bool = True) -> None:
+        """
+        Gzip-compress request bodies of at least `threshold` bytes and ask for
+        gzip-encoded responses on read operations.
+
+        Unlike `set_enable_gzip_compression`, small bodies are sent as-is, and the
+        bytes sent and received are counted (see `get_compression_stats`).
+
+        :param int threshold: The minimum size in bytes of a request body before it
+               is compressed.
+        :param int level: The gzip compression level, from 1 (fastest) to 9 (smallest).
+        :param bool compress_responses: Whether GET operations send
+               `Accept-Encoding: gzip`.
+        """
+        self._compressor = Compressor(
+            CompressionConfig(threshold=threshold, level=level, compress_responses=compress_responses)
+        )
+
+    def disable_compression(self) -> None:
+        """Stop compressing request bodies and counting bytes."""
+        self._compressor = None
+
+    def get_compression_stats(self) -> CompressionStats:
+        """
+        Return the bytes sent and received since compression was enabled.
+
+        :return: The request and response sizes before and after compression, and
+               the bytes saved.
+        :rtype: CompressionStats
+        """
+        if self._compressor is None:
+            return CompressionStats()
+        return self._compressor.get_stats()
+
+    #########################
+    # Coalescing
+    #########################
+
+    def enable_coalescing(self) -> None:
+        """
+        Let concurrent identical GET calls share one request.
+
+        Calls of the same operation with the same path parameters, query parameters
+        and headers that are made while an identical call is in flight receive its
+        DetailedResponse instead of sending their own request. The shared response
+        must not be modified by the callers.
+        """
+        self._coalescer = RequestCoalescer()
+
+    def disable_coalescing(self) -> None:
+        """Stop sharing requests between concurrent identical calls."""
+        self._coalescer = None
+
+    def get_coalescing_stats(self) -> CoalescingStats:
+        """
+        Return the number of calls that shared a request since coalescing was enabled.
+
+        :return: The hit and miss counts.
+        :rtype: CoalescingStats
+        """
+        if self._coalescer is None:
+            return CoalescingStats()
+        return self._coalescer.get_stats()
+
+    #########################
+    # Conditional requests
+    #########################
+
+    def enable_conditional_requests(
+        self, *, operations: Optional[Iterable[str]] = None, max_entries: int = 1000
+    ) -> None:
+        """
+        Keep the responses of single-resource reads and revalidate them with
+        conditional requests.
+
+        The next call for a cached resource sends the ETag (or the `modified_at`
+        date) of the cached response, and receives the cached DetailedResponse when
+        the service answers 304 Not Modified. The cached response must not be
+        modified by the callers.
+
+        :param Iterable[str] operations: (optional) The IDs of the GET operations to
+               cache; `get_project`, `get_project_environment`, `get_config` and
+               `get_stack_definition` if not set.
+        :param int max_entries: (optional) The maximum number of cached responses.
+        """
+        self._conditional_cache = ConditionalCache(operations=operations, max_entries=max_entries)
+
+    def disable_conditional_requests(self) -> None:
+        """Stop sending conditional requests and drop the cached responses."""
+        self._conditional_cache = None
+
+    def get_conditional_cache_stats(self) -> CacheStats:
+        """
+        Return the activity of the conditional request cache since it was enabled.
+
+        :return: The number of calls answered from the cache (hits) and by the
+                 service (misses), and the size of the cache.
+        :rtype: CacheStats
+        """
+        if self._conditional_cache is None:
+            return CacheStats()
+        return self._conditional_cache.get_stats()
+
+    #########################
+    # Response cache
+    #########################
+
+    def enable_response_cache(
+        self,
+        *,
+        ttl: float = 30.0,
+        operation_ttls: Optional[Dict[str, float]] = None,
+        operations: Optional[Iterable[str]] = None,
+        max_entries: int = 1000,
+        max_bytes: int = 10 * 1024 * 1024,
+    ) -> None:
+        """
+        Serve GET calls from the responses of earlier identical calls for a while.
+
+        The cached responses of a resource, of the resources below it and of the
+        collections above it are dropped when the client writes to it, e.g. an
+        `update_config` drops the `get_config`, `list_configs` and
+        `list_config_versions` responses of the configuration. The cached response
+        must not be modified by the callers.
+
+        :param float ttl: (optional) The number of seconds a response is kept.
+        :param dict operation_ttls: (optional) The TTLs of specific operations, keyed
+               by operation ID; a TTL of 0 disables caching for the operation.
+        :param Iterable[str] operations: (optional) The IDs of the GET operations to
+               cache; all GET operations if not set.
+        :param int max_entries: (optional) The maximum number of cached responses.
+        :param int max_bytes: (optional) The maximum total size of the cached bodies.
+        """
+        self._response_cache = ResponseCache(
+            ttl=ttl,
+            operation_ttls=operation_ttls,
+            operations=operations,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    def disable_response_cache(self) -> None:
+        """Stop serving calls from the response cache and drop the cached responses."""
+        self._response_cache = None
+
+    def get_response_cache_stats(self) -> CacheStats:
+        """
+        Return the activity of the response cache since it was enabled.
+
+        :return: The number of calls answered from the cache (hits) and by the
+                 service (misses), the number of responses dropped, and the size
+                 of the cache.
+        :rtype: CacheStats
+        """
+        if self._response_cache is None:
+            return CacheStats()
+        return self._response_cache.get_stats()
+
+    #########################
+    # Version cache
+    #########################
+
+    def set_version_cache(self, version_cache: Optional[VersionCache]) -> None:
+        """
+        Set the persistent cache of the configuration versions that no longer change.
+
+        `get_config_version` calls for stored versions are answered from the cache,
+        and the versions received from the service are stored if their state is
+        final; drafts always come from the service. Deleting a project, a
+        configuration or a version drops its stored versions.
+
+        :param VersionCache version_cache: The cache, or None to stop using it.
+        """
+        self._version_cache = version_cache
+
+    def get_version_cache(self) -> Optional[VersionCache]:
+        """Return the persistent cache of configuration versions, if one is set."""
+        return self._version_cache
+
+    #########################
+    # Negative cache
+    #########################
+
+    def enable_negative_cache(
+        self, *, ttl: float = 10.0, operations: Optional[Iterable[str]] = None, max_entries: int = 10000
+    ) -> None:
+        """
+        Remember for a short while the resources that GET calls found missing.
+
+        For `ttl` seconds after a GET call fails with 404 Not Found, the calls for
+        the same resource, or for resources below it, fail with the same error
+        without a request. A write to the resource, to a resource below it or to
+        its collection, e.g. a create call, makes the client forget it.
+
+        :param float ttl: (optional) The number of seconds a 404 is remembered.
+        :param Iterable[str] operations: (optional) The IDs of the GET operations
+               whose 404 errors are remembered; all GET operations if not set.
+        :param int max_entries: (optional) The maximum number of resources remembered.
+        """
+        self._negative_cache = NegativeCache(ttl=ttl, operations=operations, max_entries=max_entries)
+
+    def disable_negative_cache(self) -> None:
+        """Stop remembering missing resources."""
+        self._negative_cache = None
+
+    def get_negative_cache_stats(self) -> CacheStats:
+        """
+        Return the activity of the negative cache since it was enabled.
+
+        :return: The number of calls failed from the cache (hits) and sent to the
+                 service (misses), and the number of missing resources remembered.
+        :rtype: CacheStats
+        """
+        if self._negative_cache is None:
+            return CacheStats()
+        return self._negative_cache.get_stats()
+
+    #########################
+    # Retries
+    #########################
+
+    def set_retry_policy(self, retry_policy: Optional[RetryPolicy]) -> None:
+        """
+        Retry transient failures of operation calls according to the specified policy.
+
+        The policy is applied per operation: idempotent operations are retried by
+        default and other operations only when the policy lists them. It is applied
+        on top of the transport-level retries configured by `enable_retries`, so the
+        two are normally not used together.
+
+        :param RetryPolicy retry_policy: The retry policy, or None to stop retrying.
+        """
+        self._retry_policy = retry_policy
+
+    def get_retry_policy(self) -> Optional[RetryPolicy]:
+        """Return the retry policy of the client, if any."""
+        return self._retry_policy
+
+    @property
+    def http_config(self) -> dict:
+        """
+        The configuration of the HTTP client, set with `set_http_config`. While an
+        attempt whose timeout was capped by the deadline of the retry policy is
+        sent, the configured timeout, which `send` applies last, is replaced by
+        the capped one.
+        """
+        http_config = self._http_config
+        timeout = _attempt_timeout.get()
+        if timeout is None or 'timeout' not in http_config:
+            return http_config
+        return dict(http_config, timeout=timeout)
+
+    @http_config.setter
+    def http_config(self, http_config: dict) -> None:
+        self._http_config = http_config
+
+    #########################
+    # Rate limiting
+    #########################
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """
+        Limit the rate of requests sent by this client.
+
+        The same limiter can be attached to several clients to share one quota.
+        Every attempt of an operation call, including retries, takes capacity from
+        the limiter before it is sent.
+
+        :param RateLimiter rate_limiter: The rate limiter, or None to stop limiting.
+        """
+        self._rate_limiter = rate_limiter
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the rate limiter of the client, if any."""
+        return self._rate_limiter
+
+    #########################
+    # Circuit breaker
+    #########################
+
+    def set_circuit_breaker(self, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """
+        Fail calls fast while an endpoint of the service is unhealthy.
+
+        Every attempt of an operation call, including retries, is tracked by the
+        circuit of its operation; attempts made while the circuit is open raise
+        CircuitOpenError without sending a request.
+
+        :param CircuitBreaker circuit_breaker: The circuit breaker, or None to send
+               every call.
+        """
+        self._circuit_breaker = circuit_breaker
+
+    def get_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Return the circuit breaker of the client, if any."""
+        return self._circuit_breaker
+
+    #########################
+    # Requests
+    #########################
+
+    def _invoke(
+        self,
+        operation: Operation,
+        kwargs: dict,
+        *,
+        path_vars: tuple = (),
+        params: Optional[dict] = None,
+        data: Optional[str] = None,
+    ) -> DetailedResponse:
+        """
+        Build the request for an operation from its precompiled descriptor and send it.
+
+        :param Operation operation: The descriptor of the operation to invoke.
+        :param dict kwargs: The keyword arguments of the operation call; the
+               `headers` entry is merged into the request headers and the rest
+               is passed on to `send`.
+        :param tuple path_vars: The unencoded path parameter values, in the order
+               they appear in the operation path.
+        :param dict params: (optional) The query parameters of the request.
+        :param str data: (optional) The serialized request body.
+        """
+        raise NotImplementedError()
+
+    def _build_request(
+        self,
+        operation: Operation,
+        kwargs: dict,
+        path_vars: tuple,
+        params: Optional[dict],
+        data: Optional[str],
+    ) -> dict:
+        """
+        Build the request for an operation call, compressed if the client compresses
+        requests; the arguments are those of `_invoke`.
+        """
+        headers = operation.build_headers(kwargs.pop('headers', None))
+        compressor = self._compressor
+        if compressor is not None and compressor.config.compress_responses and operation.method == 'GET':
+            headers.setdefault('Accept-Encoding', 'gzip')
+        request = self.prepare_request(
+            method=operation.method,
+            url=operation.build_url(self.encode_path_vars(*path_vars)),
+            headers=headers,
+            params=params,
+            data=data,
+        )
+        if compressor is not None:
+            compressor.compress_request(request)
+            add_response_hook(kwargs, compressor.count_response)
+        return request
+
+    def _with_caches(
+        self,
+        operation: Operation,
+        request: dict,
+        kwargs: dict,
+        path_vars: tuple,
+        send: Callable,
+        *,
+        asynchronous: bool = False,
+    ) -> Callable:
+        """
+        Wrap the function sending a request in the caches and the coalescer of the
+        client, using their `execute_async` methods for an asynchronous `send`.
+        """
+        execute = 'execute_async' if asynchronous else 'execute'
+        conditional_cache = self._conditional_cache
+        if conditional_cache is not None and conditional_cache.is_cached(operation, kwargs):
+            key = conditional_cache.get_key(operation, request)
+            send = partial(getattr(conditional_cache, execute), key, request, send)
+        version_cache = self._version_cache
+        if version_cache is not None and version_cache.is_cached(operation, kwargs):
+            send = partial(getattr(version_cache, execute), operation, path_vars, send)
+        coalescer = self._coalescer
+        if coalescer is not None and coalescer.is_coalesced(operation, kwargs):
+            send = partial(getattr(coalescer, execute), coalescer.get_key(operation, request), send)
+        response_cache = self._response_cache
+        if response_cache is not None:
+            send = partial(getattr(response_cache, execute), operation, request, kwargs, send)
+        negative_cache = self._negative_cache
+        if negative_cache is not None:
+            send = partial(getattr(negative_cache, execute), operation, request, send)
+        return send
+
     #########################
     # Projects
     #########################
@@ -123,14 +616,6 @@ class ProjectV1(BaseService):
             configs = [convert_model(x) for x in configs]
         if environments is not None:
             environments = [convert_model(x) for x in environments]
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_project',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
             'location': location,
@@ -140,22 +625,12 @@ class ProjectV1(BaseService):
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        url = '/v1/projects'
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['create_project'],
+            kwargs,
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def list_projects(
@@ -181,33 +656,16 @@ class ProjectV1(BaseService):
         :rtype: DetailedResponse with `dict` result representing a `ProjectCollection` object
         """
 
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_projects',
-        )
-        headers.update(sdk_headers)
-
         params = {
             'token': token,
             'limit': limit,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        url = '/v1/projects'
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['list_projects'],
+            kwargs,
             params=params,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def get_project(
@@ -228,30 +686,12 @@ class ProjectV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_project',
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['id']
-        path_param_values = self.encode_path_vars(id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['get_project'],
+            kwargs,
+            path_vars=(id,),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def update_project(
@@ -278,38 +718,18 @@ class ProjectV1(BaseService):
         if definition is None:
             raise ValueError('definition must be provided')
         definition = convert_model(definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_project',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['id']
-        path_param_values = self.encode_path_vars(id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='PATCH',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['update_project'],
+            kwargs,
+            path_vars=(id,),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def delete_project(
@@ -331,30 +751,12 @@ class ProjectV1(BaseService):
 
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_project',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['id']
-        path_param_values = self.encode_path_vars(id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='DELETE',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['delete_project'],
+            kwargs,
+            path_vars=(id,),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     #########################
@@ -387,38 +789,18 @@ class ProjectV1(BaseService):
         if definition is None:
             raise ValueError('definition must be provided')
         definition = convert_model(definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_project_environment',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id']
-        path_param_values = self.encode_path_vars(project_id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/environments'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['create_project_environment'],
+            kwargs,
+            path_vars=(project_id,),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def list_project_environments(
@@ -449,36 +831,17 @@ class ProjectV1(BaseService):
 
         if not project_id:
             raise ValueError('project_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_project_environments',
-        )
-        headers.update(sdk_headers)
-
         params = {
             'token': token,
             'limit': limit,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id']
-        path_param_values = self.encode_path_vars(project_id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/environments'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['list_project_environments'],
+            kwargs,
+            path_vars=(project_id,),
             params=params,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def get_project_environment(
@@ -504,30 +867,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_project_environment',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/environments/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['get_project_environment'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def update_project_environment(
@@ -559,38 +904,18 @@ class ProjectV1(BaseService):
         if definition is None:
             raise ValueError('definition must be provided')
         definition = convert_model(definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_project_environment',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/environments/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='PATCH',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['update_project_environment'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def delete_project_environment(
@@ -615,30 +940,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_project_environment',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/environments/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='DELETE',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['delete_project_environment'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     #########################
@@ -690,39 +997,19 @@ class ProjectV1(BaseService):
         definition = convert_model(definition)
         if schematics is not None:
             schematics = convert_model(schematics)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_config',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
             'schematics': schematics,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id']
-        path_param_values = self.encode_path_vars(project_id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['create_config'],
+            kwargs,
+            path_vars=(project_id,),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def list_configs(
@@ -752,36 +1039,17 @@ class ProjectV1(BaseService):
 
         if not project_id:
             raise ValueError('project_id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_configs',
-        )
-        headers.update(sdk_headers)
-
         params = {
             'token': token,
             'limit': limit,
         }
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id']
-        path_param_values = self.encode_path_vars(project_id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['list_configs'],
+            kwargs,
+            path_vars=(project_id,),
             params=params,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def get_config(
@@ -809,30 +1077,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_config',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['get_config'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def update_config(
@@ -863,38 +1113,18 @@ class ProjectV1(BaseService):
         if definition is None:
             raise ValueError('definition must be provided')
         definition = convert_model(definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_config',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'definition': definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='PATCH',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['update_config'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def delete_config(
@@ -919,30 +1149,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_config',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='DELETE',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['delete_config'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def force_approve(
@@ -974,38 +1186,18 @@ class ProjectV1(BaseService):
             raise ValueError('id must be provided')
         if comment is None:
             raise ValueError('comment must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='force_approve',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'comment': comment,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/force_approve'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['force_approve'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def approve(
@@ -1035,38 +1227,18 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='approve',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'comment': comment,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/approve'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['approve'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def validate_config(
@@ -1093,30 +1265,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='validate_config',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/validate'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['validate_config'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def deploy_config(
@@ -1142,30 +1296,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='deploy_config',
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/deploy'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['deploy_config'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def undeploy_config(
@@ -1192,30 +1328,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='undeploy_config',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/undeploy'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['undeploy_config'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def sync_config(
@@ -1263,37 +1381,18 @@ class ProjectV1(BaseService):
             raise ValueError('id must be provided')
         if schematics is not None:
             schematics = convert_model(schematics)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='sync_config',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'schematics': schematics,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/sync'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['sync_config'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def list_config_resources(
@@ -1318,30 +1417,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_config_resources',
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/resources'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['list_config_resources'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def create_stack_definition(
@@ -1376,38 +1457,18 @@ class ProjectV1(BaseService):
         if stack_definition is None:
             raise ValueError('stack_definition must be provided')
         stack_definition = convert_model(stack_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='create_stack_definition',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'stack_definition': stack_definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/stack_definition'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['create_stack_definition'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def get_stack_definition(
@@ -1432,30 +1493,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_stack_definition',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/stack_definition'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['get_stack_definition'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def update_stack_definition(
@@ -1486,38 +1529,18 @@ class ProjectV1(BaseService):
         if stack_definition is None:
             raise ValueError('stack_definition must be provided')
         stack_definition = convert_model(stack_definition)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='update_stack_definition',
-        )
-        headers.update(sdk_headers)
-
         data = {
             'stack_definition': stack_definition,
         }
         data = {k: v for (k, v) in data.items() if v is not None}
         data = json.dumps(data)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/stack_definition'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='PATCH',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['update_stack_definition'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def export_stack_definition(
@@ -1553,34 +1576,14 @@ class ProjectV1(BaseService):
             raise ValueError('settings must be provided')
         if isinstance(settings, StackDefinitionExportRequest):
             settings = convert_model(settings)
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='export_stack_definition',
-        )
-        headers.update(sdk_headers)
-
         data = json.dumps(settings)
-        headers['content-type'] = 'application/json'
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/stack_definition/export'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='POST',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['export_stack_definition'],
+            kwargs,
+            path_vars=(project_id, id),
             data=data,
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def list_config_versions(
@@ -1606,30 +1609,12 @@ class ProjectV1(BaseService):
             raise ValueError('project_id must be provided')
         if not id:
             raise ValueError('id must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='list_config_versions',
-        )
-        headers.update(sdk_headers)
-
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id']
-        path_param_values = self.encode_path_vars(project_id, id)
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/versions'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['list_config_versions'],
+            kwargs,
+            path_vars=(project_id, id),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def get_config_version(
@@ -1658,30 +1643,12 @@ class ProjectV1(BaseService):
             raise ValueError('id must be provided')
         if version is None:
             raise ValueError('version must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='get_config_version',
-        )
-        headers.update(sdk_headers)
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
-
-        path_param_keys = ['project_id', 'id', 'version']
-        path_param_values = self.encode_path_vars(project_id, id, str(version))
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/versions/{version}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='GET',
-            url=url,
-            headers=headers,
+        response = self._invoke(
+            _OPERATIONS['get_config_version'],
+            kwargs,
+            path_vars=(project_id, id, str(version)),
         )
-
-        response = self.send(request, **kwargs)
         return response
 
     def delete_config_version(
@@ -1710,31 +1677,344 @@ class ProjectV1(BaseService):
             raise ValueError('id must be provided')
         if version is None:
             raise ValueError('version must be provided')
-        headers = {}
-        sdk_headers = get_sdk_headers(
-            service_name=self.DEFAULT_SERVICE_NAME,
-            service_version='V1',
-            operation_id='delete_config_version',
+
+        response = self._invoke(
+            _OPERATIONS['delete_config_version'],
+            kwargs,
+            path_vars=(project_id, id, str(version)),
         )
-        headers.update(sdk_headers)
+        return response
 
-        if 'headers' in kwargs:
-            headers.update(kwargs.get('headers'))
-            del kwargs['headers']
-        headers['Accept'] = 'application/json'
 
-        path_param_keys = ['project_id', 'id', 'version']
-        path_param_values = self.encode_path_vars(project_id, id, str(version))
-        path_param_dict = dict(zip(path_param_keys, path_param_values))
-        url = '/v1/projects/{project_id}/configs/{id}/versions/{version}'.format(**path_param_dict)
-        request = self.prepare_request(
-            method='DELETE',
-            url=url,
-            headers=headers,
-        )
+class ProjectV1(_ProjectV1Base):
+    """The project V1 service."""
 
-        response = self.send(request, **kwargs)
-        return response
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        pool_config: Optional[PoolConfig] = None,
+    ) -> None:
+        """
+        Construct a new client for the project service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+        :param PoolConfig pool_config: (optional) The sizing of the HTTP connection pool
+               shared by all the threads that use this client.
+        """
+        self._transport_adapter = None
+        self._hedging_policy = None
+        _ProjectV1Base.__init__(self, authenticator, pool_config=pool_config)
+        self._mount_http_adapter()
+
+    #########################
+    # Connection pool
+    #########################
+
+    def set_pool_config(self, pool_config: PoolConfig) -> None:
+        """
+        Replace the HTTP connection pool with one sized by the specified configuration.
+
+        Connections held by the previous pool are released and its statistics are discarded.
+
+        :param PoolConfig pool_config: The sizing of the HTTP connection pool.
+        """
+        if pool_config is None:
+            raise ValueError('pool_config must be provided')
+        self.pool_config = pool_config
+        self._mount_http_adapter()
+
+    def get_pool_stats(self) -> PoolStats:
+        """
+        Return a snapshot of the HTTP connection pool activity.
+
+        :return: The active, idle and wait counts of the pool along with the number
+               of connections opened and reused so far.
+        :rtype: PoolStats
+        """
+        if not isinstance(self.http_adapter, PooledHTTPAdapter):
+            return PoolStats()
+        return self.http_adapter.get_stats()
+
+    def set_transport_adapter(self, adapter: Optional[BaseAdapter]) -> None:
+        """
+        Send requests through the specified `requests` transport adapter instead of
+        the pooled HTTP/1.1 adapter, e.g. an HTTP2Adapter to multiplex concurrent
+        requests over a few HTTP/2 connections.
+
+        Requests are still built by `prepare_request` and sent by `send`. The pool
+        configuration and the transport-level retries of `enable_retries` only
+        apply to the pooled adapter.
+
+        :param BaseAdapter adapter: The transport adapter, or None to go back to
+               the pooled adapter.
+        """
+        previous_adapter = self.http_adapter
+        self._transport_adapter = adapter
+        self._mount_http_adapter(previous_adapter)
+
+    def enable_retries(self, max_retries: int = 4, retry_interval: float = 30.0) -> None:
+        """Enable automatic retries on the pooled HTTP adapter (see `BaseService.enable_retries`)."""
+        previous_adapter = self.http_adapter
+        BaseService.enable_retries(self, max_retries=max_retries, retry_interval=retry_interval)
+        self._mount_http_adapter(previous_adapter)
+
+    def disable_retries(self) -> None:
+        """Remove the retry configuration from the pooled HTTP adapter."""
+        previous_adapter = self.http_adapter
+        BaseService.disable_retries(self)
+        self._mount_http_adapter(previous_adapter)
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        """Set whether the pooled HTTP adapter verifies the server's SSL certificate."""
+        previous_adapter = self.http_adapter
+        BaseService.set_disable_ssl_verification(self, status)
+        self._mount_http_adapter(previous_adapter)
+
+    def _mount_http_adapter(self, previous_adapter=None) -> None:
+        # BaseService mounts a fresh default adapter whenever the retry or SSL
+        # settings change, so the pooled adapter has to be mounted again afterwards.
+        previous_adapter = previous_adapter or self.http_adapter
+        if self._transport_adapter is not None:
+            self.http_adapter = self._transport_adapter
+        else:
+            adapter_kwargs = {'_disable_ssl_verification': self.disable_ssl_verification}
+            if self.retry_config is not None:
+                adapter_kwargs['max_retries'] = self.retry_config
+            self.http_adapter = PooledHTTPAdapter(pool_config=self.pool_config, **adapter_kwargs)
+        self.http_client.mount('http://', self.http_adapter)
+        self.http_client.mount('https://', self.http_adapter)
+        if previous_adapter is not None and previous_adapter is not self.http_adapter:
+            previous_adapter.close()
+
+    #########################
+    # Hedging
+    #########################
+
+    def set_hedging_policy(self, hedging_policy: Optional[HedgingPolicy]) -> None:
+        """
+        Hedge slow read operation calls with a second request.
+
+        The policy can be shared by several clients; it then tracks the latency
+        of their calls together.
+
+        :param HedgingPolicy hedging_policy: The hedging policy, or None to send
+               one request per attempt.
+        """
+        self._hedging_policy = hedging_policy
+
+    def get_hedging_policy(self) -> Optional[HedgingPolicy]:
+        """Return the hedging policy of the client, if any."""
+        return self._hedging_policy
+
+    def get_hedging_stats(self) -> HedgingStats:
+        """Return a snapshot of the hedged calls, or empty statistics if hedging is disabled."""
+        if self._hedging_policy is None:
+            return HedgingStats()
+        return self._hedging_policy.get_stats()
+
+    #########################
+    # Streaming
+    #########################
+
+    def stream_projects(
+        self,
+        *,
+        token: Optional[str] = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> StreamingCollection:
+        """
+        List projects, decoding each project as soon as it has been received.
+
+        :param str token: (optional) The token of the page to list.
+        :param int limit: (optional) The maximum number of resources to return.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the projects of the page; its `envelope` holds
+                 the rest of the response once iteration ends.
+        :rtype: StreamingCollection of `ProjectSummary` objects
+        """
+        response = self.list_projects(token=token, limit=limit, stream=True, **kwargs)
+        return StreamingCollection(response.get_result(), 'projects', ProjectSummary)
+
+    def stream_project_environments(
+        self,
+        project_id: str,
+        *,
+        token: Optional[str] = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> StreamingCollection:
+        """
+        List environments, decoding each environment as soon as it has been received.
+
+        :param str project_id: The unique project ID.
+        :param str token: (optional) The token of the page to list.
+        :param int limit: (optional) The maximum number of resources to return.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the environments of the page; its `envelope`
+                 holds the rest of the response once iteration ends.
+        :rtype: StreamingCollection of `Environment` objects
+        """
+        response = self.list_project_environments(project_id, token=token, limit=limit, stream=True, **kwargs)
+        return StreamingCollection(response.get_result(), 'environments', Environment)
+
+    def stream_configs(
+        self,
+        project_id: str,
+        *,
+        token: Optional[str] = None,
+        limit: Optional[int] = None,
+        **kwargs,
+    ) -> StreamingCollection:
+        """
+        List project configurations, decoding each configuration as soon as it has
+        been received.
+
+        :param str project_id: The unique project ID.
+        :param str token: (optional) The token of the page to list.
+        :param int limit: (optional) The maximum number of resources to return.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the configurations of the page; its `envelope`
+                 holds the rest of the response once iteration ends.
+        :rtype: StreamingCollection of `ProjectConfigSummary` objects
+        """
+        response = self.list_configs(project_id, token=token, limit=limit, stream=True, **kwargs)
+        return StreamingCollection(response.get_result(), 'configs', ProjectConfigSummary)
+
+    def stream_config_resources(
+        self,
+        project_id: str,
+        id: str,
+        **kwargs,
+    ) -> StreamingCollection:
+        """
+        List the resources deployed by a configuration, decoding each resource as
+        soon as it has been received.
+
+        :param str project_id: The unique project ID.
+        :param str id: The unique configuration ID.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the resources; its `envelope` holds
+                 `resources_count` once iteration ends.
+        :rtype: StreamingCollection of `ProjectConfigResource` objects
+        """
+        response = self.list_config_resources(project_id, id, stream=True, **kwargs)
+        return StreamingCollection(response.get_result(), 'resources', ProjectConfigResource)
+
+    #########################
+    # Batches
+    #########################
+
+    def get_configs(
+        self,
+        project_id: str,
+        ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> BatchResult:
+        """
+        Get many project configurations concurrently.
+
+        Each configuration is requested with `get_config`, at most `max_workers` at
+        a time, and duplicate IDs are requested once. A failed request does not stop
+        the batch: its error is returned in the `errors` of the result.
+
+        :param str project_id: The unique project ID.
+        :param Iterable[str] ids: The unique configuration IDs.
+        :param int max_workers: (optional) The maximum number of concurrent requests.
+        :param dict headers: A `dict` containing the request headers
+        :return: The responses and errors, keyed by configuration ID in request order.
+        :rtype: BatchResult with `dict` results representing `ProjectConfig` objects
+        """
+        ids = unique_ids(ids)
+        return BatchResult.from_items(ids, self.iter_configs(project_id, ids, max_workers=max_workers, **kwargs))
+
+    def iter_configs(
+        self,
+        project_id: str,
+        ids: Iterable[str],
+        *,
+        max_workers: int = 8,
+        **kwargs,
+    ) -> Iterator[BatchItem]:
+        """
+        Get many project configurations concurrently, returning each one as soon as
+        it has been received.
+
+        Like `get_configs`, but the outcomes are returned in the order the requests
+        complete. Closing the iterator early cancels the requests not sent yet.
+
+        :param str project_id: The unique project ID.
+        :param Iterable[str] ids: The unique configuration IDs.
+        :param int max_workers: (optional) The maximum number of concurrent requests.
+        :param dict headers: A `dict` containing the request headers
+        :return: An iterator over the outcome of each request.
+        :rtype: Iterator of BatchItem with `dict` results representing `ProjectConfig` objects
+        """
+        if not project_id:
+            raise ValueError('project_id must be provided')
+        return run_batch(lambda id: self.get_config(project_id, id, **kwargs), unique_ids(ids), max_workers)
+
+    #########################
+    # Requests
+    #########################
+
+    def _invoke(
+        self,
+        operation: Operation,
+        kwargs: dict,
+        *,
+        path_vars: tuple = (),
+        params: Optional[dict] = None,
+        data: Optional[str] = None,
+    ) -> DetailedResponse:
+        """
+        Build the request for an operation from its precompiled descriptor and send it.
+        """
+        request = self._build_request(operation, kwargs, path_vars, params, data)
+        send = partial(self._execute, operation, request, kwargs)
+        return self._with_caches(operation, request, kwargs, path_vars, send)()
+
+    def _execute(self, operation: Operation, request: dict, kwargs: dict) -> DetailedResponse:
+        """
+        Send a prepared operation request, applying the retry policy of the client.
+        """
+        retry_policy = self._retry_policy
+        if retry_policy is None:
+            return self._send_hedged(operation, request, kwargs)
+        send = partial(self._send_hedged, operation, request)
+        if retry_policy.deadline is not None and 'timeout' in self._http_config:
+            # Let the policy cap the configured timeout, and send apply the capped one.
+            kwargs = dict(kwargs, timeout=self._http_config['timeout'])
+            send = partial(_send_with_attempt_timeout, send)
+        return retry_policy.execute(operation, send, kwargs)
+
+    def _send_hedged(self, operation: Operation, request: dict, kwargs: dict) -> DetailedResponse:
+        """
+        Send one attempt of an operation request, hedging it if the hedging policy applies.
+        """
+        hedging_policy = self._hedging_policy
+        # A streamed response of the losing request could not be released.
+        if hedging_policy is None or kwargs.get('stream') or not hedging_policy.is_hedged_operation(operation):
+            return self._send_attempt(operation, request, kwargs)
+        return hedging_policy.execute(operation, lambda: self._send_attempt(operation, request, kwargs))
+
+    def _send_attempt(self, operation: Operation, request: dict, kwargs: dict) -> DetailedResponse:
+        """
+        Send one attempt of an operation request once the rate limiter allows it,
+        through the circuit breaker of the client.
+        """
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None:
+            rate_limiter.acquire(operation.operation_id)
+        circuit_breaker = self._circuit_breaker
+        if circuit_breaker is None:
+            return self.send(request, **kwargs)
+        return circuit_breaker.call(operation, lambda: self.send(request, **kwargs))
 
 
 ##############################################################################
@@ -11773,83 +12053,89 @@ class StackDefinitionExportRequestStackDefinitionExportProductRequest(StackDefin
 ##############################################################################
 
 
-class ProjectsPager:
+def _require_sync_client(client: ProjectV1) -> None:
+    # The pagers and the crawler use the results of the operation methods directly.
+    if getattr(client, '_is_async', False):
+        raise TypeError('{0} returns coroutines; use the asyncio pagers'.format(type(client).__name__))
+
+
+class ProjectsPager(Pager):
     """
     ProjectsPager can be used to simplify the use of the "list_projects" method.
+
+    Iterating the pager yields the resources one at a time, as dicts that
+    represent instances of ProjectSummary.
     """
 
+    _collection_key = 'projects'
+
     def __init__(
         self,
         *,
         client: ProjectV1,
         limit: int = None,
+        prefetch: int = 0,
+        checkpoint: PagerCheckpoint = None,
+        adaptive_limit: AdaptiveLimit = None,
+        typed: bool = False,
+        decode_workers: int = 1,
     ) -> None:
         """
         Initialize a ProjectsPager object.
         :param int limit: (optional) The maximum number of resources to return. The
                number of resources that are returned is the same, except for the last
                page.
-        """
-        self._has_next = True
+        :param int prefetch: (optional) The number of pages requested ahead on a
+               background thread while the caller processes the current page.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        :param AdaptiveLimit adaptive_limit: (optional) Adjusts the limit of each
+               page request to the observed latency and size of the pages,
+               overriding `limit`.
+        :param bool typed: (optional) Whether the resources are returned as
+               ProjectSummary objects instead of dicts.
+        :param int decode_workers: (optional) The number of threads converting
+               prefetched pages to ProjectSummary objects.
+        """
+        super().__init__(
+            limit=limit,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            adaptive_limit=adaptive_limit,
+            model=ProjectSummary if typed else None,
+            decode_workers=decode_workers,
+        )
+        _require_sync_client(client)
         self._client = client
-        self._page_context = {'next': None}
-        self._limit = limit
-
-    def has_next(self) -> bool:
-        """
-        Returns true if there are potentially more results to be retrieved.
-        """
-        return self._has_next
-
-    def get_next(self) -> List[dict]:
-        """
-        Returns the next page of results.
-        :return: A List[dict], where each element is a dict that represents an instance of ProjectSummary.
-        :rtype: List[dict]
-        """
-        if not self.has_next():
-            raise StopIteration(message='No more results available')
 
-        result = self._client.list_projects(
+    def _list(self, token: Optional[str]) -> DetailedResponse:
+        return self._client.list_projects(
             limit=self._limit,
-            token=self._page_context.get('next'),
-        ).get_result()
-
-        next = None
-        next_page_link = result.get('next')
-        if next_page_link is not None:
-            next = get_query_param(next_page_link.get('href'), 'token')
-        self._page_context['next'] = next
-        if next is None:
-            self._has_next = False
-
-        return result.get('projects')
-
-    def get_all(self) -> List[dict]:
-        """
-        Returns all results by invoking get_next() repeatedly
-        until all pages of results have been retrieved.
-        :return: A List[dict], where each element is a dict that represents an instance of ProjectSummary.
-        :rtype: List[dict]
-        """
-        results = []
-        while self.has_next():
-            next_page = self.get_next()
-            results.extend(next_page)
-        return results
+            token=token,
+        )
 
 
-class ProjectEnvironmentsPager:
+class ProjectEnvironmentsPager(Pager):
     """
     ProjectEnvironmentsPager can be used to simplify the use of the "list_project_environments" method.
+
+    Iterating the pager yields the resources one at a time, as dicts that
+    represent instances of Environment.
     """
 
+    _collection_key = 'environments'
+
     def __init__(
         self,
         *,
         client: ProjectV1,
         project_id: str,
         limit: int = None,
+        prefetch: int = 0,
+        checkpoint: PagerCheckpoint = None,
+        adaptive_limit: AdaptiveLimit = None,
+        typed: bool = False,
+        decode_workers: int = 1,
     ) -> None:
         """
         Initialize a ProjectEnvironmentsPager object.
@@ -11857,69 +12143,59 @@ class ProjectEnvironmentsPager:
         :param int limit: (optional) The maximum number of resources to return. The
                number of resources that are returned is the same, except for the last
                page.
-        """
-        self._has_next = True
+        :param int prefetch: (optional) The number of pages requested ahead on a
+               background thread while the caller processes the current page.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        :param AdaptiveLimit adaptive_limit: (optional) Adjusts the limit of each
+               page request to the observed latency and size of the pages,
+               overriding `limit`.
+        :param bool typed: (optional) Whether the resources are returned as
+               Environment objects instead of dicts.
+        :param int decode_workers: (optional) The number of threads converting
+               prefetched pages to Environment objects.
+        """
+        super().__init__(
+            limit=limit,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            adaptive_limit=adaptive_limit,
+            model=Environment if typed else None,
+            decode_workers=decode_workers,
+        )
+        _require_sync_client(client)
         self._client = client
-        self._page_context = {'next': None}
         self._project_id = project_id
-        self._limit = limit
-
-    def has_next(self) -> bool:
-        """
-        Returns true if there are potentially more results to be retrieved.
-        """
-        return self._has_next
-
-    def get_next(self) -> List[dict]:
-        """
-        Returns the next page of results.
-        :return: A List[dict], where each element is a dict that represents an instance of Environment.
-        :rtype: List[dict]
-        """
-        if not self.has_next():
-            raise StopIteration(message='No more results available')
 
-        result = self._client.list_project_environments(
+    def _list(self, token: Optional[str]) -> DetailedResponse:
+        return self._client.list_project_environments(
             project_id=self._project_id,
             limit=self._limit,
-            token=self._page_context.get('next'),
-        ).get_result()
-
-        next = None
-        next_page_link = result.get('next')
-        if next_page_link is not None:
-            next = get_query_param(next_page_link.get('href'), 'token')
-        self._page_context['next'] = next
-        if next is None:
-            self._has_next = False
-
-        return result.get('environments')
-
-    def get_all(self) -> List[dict]:
-        """
-        Returns all results by invoking get_next() repeatedly
-        until all pages of results have been retrieved.
-        :return: A List[dict], where each element is a dict that represents an instance of Environment.
-        :rtype: List[dict]
-        """
-        results = []
-        while self.has_next():
-            next_page = self.get_next()
-            results.extend(next_page)
-        return results
+            token=token,
+        )
 
 
-class ConfigsPager:
+class ConfigsPager(Pager):
     """
     ConfigsPager can be used to simplify the use of the "list_configs" method.
+
+    Iterating the pager yields the resources one at a time, as dicts that
+    represent instances of ProjectConfigSummary.
     """
 
+    _collection_key = 'configs'
+
     def __init__(
         self,
         *,
         client: ProjectV1,
         project_id: str,
         limit: int = None,
+        prefetch: int = 0,
+        checkpoint: PagerCheckpoint = None,
+        adaptive_limit: AdaptiveLimit = None,
+        typed: bool = False,
+        decode_workers: int = 1,
     ) -> None:
         """
         Initialize a ConfigsPager object.
@@ -11927,53 +12203,147 @@ class ConfigsPager:
         :param int limit: (optional) The maximum number of resources to return. The
                number of resources that are returned is the same, except for the last
                page.
-        """
-        self._has_next = True
+        :param int prefetch: (optional) The number of pages requested ahead on a
+               background thread while the caller processes the current page.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        :param AdaptiveLimit adaptive_limit: (optional) Adjusts the limit of each
+               page request to the observed latency and size of the pages,
+               overriding `limit`.
+        :param bool typed: (optional) Whether the resources are returned as
+               ProjectConfigSummary objects instead of dicts.
+        :param int decode_workers: (optional) The number of threads converting
+               prefetched pages to ProjectConfigSummary objects.
+        """
+        super().__init__(
+            limit=limit,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            adaptive_limit=adaptive_limit,
+            model=ProjectConfigSummary if typed else None,
+            decode_workers=decode_workers,
+        )
+        _require_sync_client(client)
         self._client = client
-        self._page_context = {'next': None}
         self._project_id = project_id
-        self._limit = limit
 
-    def has_next(self) -> bool:
-        """
-        Returns true if there are potentially more results to be retrieved.
-        """
-        return self._has_next
+    def _list(self, token: Optional[str]) -> DetailedResponse:
+        return self._client.list_configs(
+            project_id=self._project_id,
+            limit=self._limit,
+            token=token,
+        )
+
 
-    def get_next(self) -> List[dict]:
+class ConfigVersionsPager(StreamingPager):
+    """
+    ConfigVersionsPager can be used to simplify the use of the "list_config_versions" method.
+
+    The operation returns all the versions of a configuration in one response,
+    which is decoded while it is received and split into pages. Iterating the
+    pager yields the versions one at a time, as dicts that represent instances of
+    ProjectConfigVersionSummary.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: ProjectV1,
+        project_id: str,
+        id: str,
+        page_size: int = 100,
+        prefetch: int = 0,
+        checkpoint: PagerCheckpoint = None,
+        typed: bool = False,
+        decode_workers: int = 1,
+    ) -> None:
         """
-        Returns the next page of results.
-        :return: A List[dict], where each element is a dict that represents an instance of ProjectConfigSummary.
-        :rtype: List[dict]
+        Initialize a ConfigVersionsPager object.
+        :param str project_id: The unique project ID.
+        :param str id: The unique configuration ID.
+        :param int page_size: (optional) The number of versions per page.
+        :param int prefetch: (optional) The number of pages decoded ahead on a
+               background thread while the caller processes the current page.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        :param bool typed: (optional) Whether the resources are returned as
+               ProjectConfigVersionSummary objects instead of dicts.
+        :param int decode_workers: (optional) The number of threads converting
+               prefetched pages to ProjectConfigVersionSummary objects.
+        """
+        super().__init__(
+            page_size=page_size,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            model=ProjectConfigVersionSummary if typed else None,
+            decode_workers=decode_workers,
+        )
+        _require_sync_client(client)
+        self._client = client
+        self._project_id = project_id
+        self._id = id
+
+    def _stream(self) -> StreamingCollection:
+        response = self._client.list_config_versions(
+            project_id=self._project_id,
+            id=self._id,
+            stream=True,
+        )
+        return StreamingCollection(response.get_result(), 'versions')
+
+
+class ConfigResourcesPager(StreamingPager):
+    """
+    ConfigResourcesPager can be used to simplify the use of the "list_config_resources" method.
+
+    The operation returns all the resources of a configuration in one response,
+    which is decoded while it is received and split into pages. Iterating the
+    pager yields the resources one at a time, as dicts that represent instances of
+    ProjectConfigResource.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: ProjectV1,
+        project_id: str,
+        id: str,
+        page_size: int = 100,
+        prefetch: int = 0,
+        checkpoint: PagerCheckpoint = None,
+        typed: bool = False,
+        decode_workers: int = 1,
+    ) -> None:
         """
-        if not self.has_next():
-            raise StopIteration(message='No more results available')
+        Initialize a ConfigResourcesPager object.
+        :param str project_id: The unique project ID.
+        :param str id: The unique configuration ID.
+        :param int page_size: (optional) The number of resources per page.
+        :param int prefetch: (optional) The number of pages decoded ahead on a
+               background thread while the caller processes the current page.
+        :param PagerCheckpoint checkpoint: (optional) The position to resume from,
+               as returned by `get_checkpoint`.
+        :param bool typed: (optional) Whether the resources are returned as
+               ProjectConfigResource objects instead of dicts.
+        :param int decode_workers: (optional) The number of threads converting
+               prefetched pages to ProjectConfigResource objects.
+        """
+        super().__init__(
+            page_size=page_size,
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            model=ProjectConfigResource if typed else None,
+            decode_workers=decode_workers,
+        )
+        _require_sync_client(client)
+        self._client = client
+        self._project_id = project_id
+        self._id = id
 
-        result = self._client.list_configs(
+    def _stream(self) -> StreamingCollection:
+        response = self._client.list_config_resources(
             project_id=self._project_id,
-            limit=self._limit,
-            token=self._page_context.get('next'),
-        ).get_result()
-
-        next = None
-        next_page_link = result.get('next')
-        if next_page_link is not None:
-            next = get_query_param(next_page_link.get('href'), 'token')
-        self._page_context['next'] = next
-        if next is None:
-            self._has_next = False
-
-        return result.get('configs')
-
-    def get_all(self) -> List[dict]:
-        """
-        Returns all results by invoking get_next() repeatedly
-        until all pages of results have been retrieved.
-        :return: A List[dict], where each element is a dict that represents an instance of ProjectConfigSummary.
-        :rtype: List[dict]
-        """
-        results = []
-        while self.has_next():
-            next_page = self.get_next()
-            results.extend(next_page)
-        return results
+            id=self._id,
+            stream=True,
+        )
+        return StreamingCollection(response.get_result(), 'resources')
@@ -0,0 +1,213 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a client-side token-bucket rate limiter that can be
+shared by any number of service clients.
+"""
+
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+
+class RateLimitExceeded(ApiException):
+    """
+    Raised instead of sending a request when the rate limiter has no capacity left
+    and the caller does not wait for it.
+
+    :attr float retry_after: The number of seconds until the request could be sent.
+    """
+
+    def __init__(self, operation_id: str, retry_after: float) -> None:
+        super().__init__(
+            429,
+            message='Client-side rate limit exceeded for {0}; retry in {1:.3f} seconds'.format(
+                operation_id, retry_after
+            ),
+        )
+        self.operation_id = operation_id
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    A token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens.
+
+    The bucket is not thread-safe on its own; RateLimiter serializes access to it.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        if capacity is None:
+            capacity = max(1.0, rate)
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Return the number of seconds until `tokens` tokens are available."""
+        missing = tokens - self._tokens
+        # Ignore rounding errors, which could otherwise leave a waiter sleeping for
+        # intervals too short to advance the clock.
+        return 0.0 if missing <= 1e-9 else missing / self.rate
+
+    def take(self, tokens: float = 1.0) -> None:
+        """Remove `tokens` tokens from the bucket."""
+        self._tokens -= tokens
+
+
+class RateLimiter:
+    """
+    Limits the rate of requests sent by one or more service clients.
+
+    A request consumes one token from the global bucket (if `rate` is set) and one
+    from the bucket of its operation (if a limit is set for it), so a client can run
+    just under a server-side quota for the whole account and for specific operations.
+    Attach the same limiter to several clients with `ProjectV1.set_rate_limiter` to
+    share the quota between them.
+
+    :param float rate: (optional) The global number of requests per second.
+    :param float burst: (optional) The number of requests that may be sent at once
+           after an idle period; defaults to one second worth of requests.
+    :param dict operation_limits: (optional) The (rate, burst) limits of specific
+           operations, keyed by operation ID.
+    :param bool block: (optional) Whether a request waits for capacity, instead of
+           failing with RateLimitExceeded.
+    :param float max_wait: (optional) The maximum number of seconds a request
+           waits for capacity before failing with RateLimitExceeded.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        *,
+        operation_limits: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+    ) -> None:
+        if max_wait is not None and max_wait < 0:
+            raise ValueError('max_wait must not be negative')
+        self._lock = threading.Lock()
+        self._global = TokenBucket(rate, burst) if rate is not None else None
+        self._operations = {}
+        self.block = block
+        self.max_wait = max_wait
+        for operation_id, (operation_rate, operation_burst) in (operation_limits or {}).items():
+            self.set_operation_limit(operation_id, operation_rate, operation_burst)
+
+    def set_operation_limit(self, operation_id: str, rate: float, burst: Optional[float] = None) -> None:
+        """Set the rate limit of one operation."""
+        bucket = TokenBucket(rate, burst)
+        with self._lock:
+            self._operations[operation_id] = bucket
+
+    def remove_operation_limit(self, operation_id: str) -> None:
+        """Remove the rate limit of one operation."""
+        with self._lock:
+            self._operations.pop(operation_id, None)
+
+    def estimate_wait(self, operation_id: str) -> float:
+        """Return the number of seconds a request for the operation would wait right now."""
+        with self._lock:
+            return self._wait_time(self._buckets(operation_id), time.monotonic())
+
+    def try_acquire(self, operation_id: str) -> float:
+        """
+        Take capacity for one request if it is available right now.
+
+        :return: 0.0 if the request may be sent, otherwise the estimated number of
+                 seconds until it could be (no capacity is taken).
+        :rtype: float
+        """
+        with self._lock:
+            buckets = self._buckets(operation_id)
+            wait = self._wait_time(buckets, time.monotonic())
+            if wait == 0.0:
+                for bucket in buckets:
+                    bucket.take()
+            return wait
+
+    def acquire(self, operation_id: str, block: Optional[bool] = None) -> float:
+        """
+        Take capacity for one request, waiting for it if necessary.
+
+        :param str operation_id: The ID of the operation about to be sent.
+        :param bool block: (optional) Overrides the `block` setting of the limiter.
+        :return: The number of seconds spent waiting.
+        :rtype: float
+        :raises RateLimitExceeded: If the limiter does not block, or the wait would
+                exceed `max_wait`.
+        """
+        block = self.block if block is None else block
+        start = time.monotonic()
+        while True:
+            wait = self._next_wait(operation_id, block, start)
+            if wait == 0.0:
+                return time.monotonic() - start
+            # Other threads may take the refilled tokens first; check again after the wait.
+            time.sleep(wait)
+
+    async def acquire_async(self, operation_id: str, block: Optional[bool] = None) -> float:
+        """
+        Take capacity for one request, waiting for it without blocking the event
+        loop if necessary (see `acquire`).
+        """
+        block = self.block if block is None else block
+        start = time.monotonic()
+        while True:
+            wait = self._next_wait(operation_id, block, start)
+            if wait == 0.0:
+                return time.monotonic() - start
+            await asyncio.sleep(wait)
+
+    def _next_wait(self, operation_id: str, block: bool, start: float) -> float:
+        # Take capacity if available, otherwise return the wait or raise if the caller cannot wait.
+        wait = self.try_acquire(operation_id)
+        if wait == 0.0:
+            return 0.0
+        waited = time.monotonic() - start
+        if not block or (self.max_wait is not None and waited + wait > self.max_wait):
+            raise RateLimitExceeded(operation_id, wait)
+        return wait
+
+    def _buckets(self, operation_id: str) -> List[TokenBucket]:
+        buckets = [self._global] if self._global is not None else []
+        operation_bucket = self._operations.get(operation_id)
+        if operation_bucket is not None:
+            buckets.append(operation_bucket)
+        return buckets
+
+    @staticmethod
+    def _wait_time(buckets: List[TokenBucket], now: float) -> float:
+        wait = 0.0
+        for bucket in buckets:
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time())
+        return wait
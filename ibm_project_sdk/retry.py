@@ -0,0 +1,231 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an idempotency-aware retry policy with decorrelated-jitter
+backoff, Retry-After support and a per-call deadline.
+"""
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Iterable, Optional, Tuple
+import asyncio
+import logging
+import random
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+import requests
+
+from .circuit import CircuitOpenError
+from .common import Operation
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_IDEMPOTENT_METHODS = ('GET', 'HEAD', 'DELETE')
+
+
+class RetryPolicy:
+    """
+    Decides which failed operation calls are retried, and when.
+
+    Operations whose HTTP method is idempotent (GET and DELETE by default) are
+    retried; other operations, such as `deploy_config` or `create_config`, are
+    retried only when listed in `retry_operations`. The wait between attempts
+    follows a decorrelated-jitter exponential backoff, unless the server sends a
+    Retry-After header.
+
+    :param int max_attempts: (optional) The maximum number of attempts, including
+           the first one.
+    :param float base_delay: (optional) The minimum wait in seconds between attempts.
+    :param float max_delay: (optional) The maximum backoff wait in seconds between
+           attempts. A longer Retry-After is still honored.
+    :param float deadline: (optional) The maximum number of seconds a call may take,
+           across all of its attempts and waits.
+    :param Iterable[int] retry_statuses: (optional) The HTTP status codes to retry.
+    :param Iterable[str] idempotent_methods: (optional) The HTTP methods retried
+           for every operation.
+    :param Iterable[str] retry_operations: (optional) The IDs of non-idempotent
+           operations that may be retried too, e.g. 'deploy_config'.
+    :param Iterable[str] no_retry_operations: (optional) The IDs of operations that
+           are never retried.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+        deadline: Optional[float] = None,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_methods: Iterable[str] = DEFAULT_IDEMPOTENT_METHODS,
+        retry_operations: Iterable[str] = (),
+        no_retry_operations: Iterable[str] = (),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be greater than 0')
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError('base_delay must be between 0 and max_delay')
+        if deadline is not None and deadline <= 0:
+            raise ValueError('deadline must be greater than 0')
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.retry_operations = frozenset(retry_operations)
+        self.no_retry_operations = frozenset(no_retry_operations)
+
+    def is_retryable_operation(self, operation: Operation) -> bool:
+        """Return true if failed calls of the operation may be retried."""
+        if operation.operation_id in self.no_retry_operations:
+            return False
+        return operation.operation_id in self.retry_operations or operation.method in self.idempotent_methods
+
+    def is_retryable_error(self, error: Exception) -> bool:
+        """Return true if the error is transient: a retryable status code, a connection error or a timeout."""
+        if isinstance(error, CircuitOpenError):
+            # Fail fast; the circuit will not let the call through any sooner.
+            return False
+        if isinstance(error, ApiException):
+            return error.status_code in self.retry_statuses
+        if isinstance(error, requests.exceptions.SSLError):
+            return False
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def next_delay(self, previous_delay: float) -> float:
+        """Return the next backoff wait using decorrelated jitter."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous_delay * 3)))
+
+    def execute(self, operation: Operation, send: Callable[[dict], DetailedResponse], kwargs: dict) -> DetailedResponse:
+        """
+        Call `send` with the keyword arguments of the request, retrying transient failures.
+
+        :param Operation operation: The operation being invoked.
+        :param Callable send: Sends one attempt, given the keyword arguments for
+               `BaseService.send`.
+        :param dict kwargs: The keyword arguments for `BaseService.send`.
+        :return: The response of the first successful attempt.
+        :raises ApiException: The error of the last attempt when it is not retried.
+        """
+        if not self.is_retryable_operation(operation):
+            return send(kwargs)
+        start = time.monotonic()
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return send(self._attempt_kwargs(kwargs, start))
+            except (ApiException, requests.exceptions.RequestException) as error:
+                delay, wait = self._next_wait(operation, error, attempt, delay, start)
+                if wait is None:
+                    raise
+                time.sleep(wait)
+
+    async def execute_async(
+        self, operation: Operation, send: Callable[[dict], Awaitable[DetailedResponse]], kwargs: dict
+    ) -> DetailedResponse:
+        """
+        Await `send` with the keyword arguments of the request, retrying transient
+        failures without blocking the event loop (see `execute`).
+        """
+        if not self.is_retryable_operation(operation):
+            return await send(kwargs)
+        start = time.monotonic()
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await send(self._attempt_kwargs(kwargs, start))
+            except (ApiException, requests.exceptions.RequestException) as error:
+                delay, wait = self._next_wait(operation, error, attempt, delay, start)
+                if wait is None:
+                    raise
+                await asyncio.sleep(wait)
+
+    def _attempt_kwargs(self, kwargs: dict, start: float) -> dict:
+        if self.deadline is None:
+            return kwargs
+        return _with_timeout(kwargs, self.deadline - (time.monotonic() - start))
+
+    def _next_wait(
+        self, operation: Operation, error: Exception, attempt: int, delay: float, start: float
+    ) -> Tuple[float, Optional[float]]:
+        # Return the new backoff delay and the wait before the next attempt, or None if the error is final.
+        if attempt >= self.max_attempts or not self.is_retryable_error(error):
+            return delay, None
+        delay = self.next_delay(delay)
+        retry_after = get_retry_after(error)
+        wait = delay if retry_after is None else retry_after
+        if self.deadline is not None and time.monotonic() - start + wait >= self.deadline:
+            return delay, None
+        logger.debug(
+            'Retrying %s after %s (attempt %d of %d) in %.3f seconds',
+            operation.operation_id,
+            error.__class__.__name__,
+            attempt + 1,
+            self.max_attempts,
+            wait,
+        )
+        return delay, wait
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Return the number of seconds requested by the Retry-After header of a failed
+    response, or None if the header is absent or invalid.
+    """
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        # Raised locally, e.g. by the client-side rate limiter.
+        return float(retry_after)
+    http_response = getattr(error, 'http_response', None)
+    if http_response is None:
+        http_response = getattr(error, 'response', None)
+    if http_response is None:
+        return None
+    value = http_response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _with_timeout(kwargs: dict, remaining: float) -> dict:
+    # Cap the timeout of the attempt, or each of its connect and read timeouts,
+    # at the time left before the deadline.
+    remaining = max(remaining, 0.001)
+    timeout = kwargs.get('timeout', 60)
+    if isinstance(timeout, tuple):
+        timeout = tuple(remaining if value is None else min(value, remaining) for value in timeout)
+    elif isinstance(timeout, (int, float)):
+        timeout = min(timeout, remaining)
+    elif timeout is None:
+        timeout = remaining
+    return dict(kwargs, timeout=timeout)
@@ -0,0 +1,311 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides incremental decoding of list operation responses, so that
+the elements of a page are available as soon as they have been received.
+"""
+
+from json.decoder import JSONDecodeError, JSONDecoder, scanstring
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+import codecs
+import re
+
+from ibm_cloud_sdk_core import get_query_param
+import requests
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# The characters that change the nesting depth, outside and inside of strings.
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+# The characters that may follow a complete value.
+_DELIMITERS = frozenset(',]} \t\n\r')
+
+# Parser states.
+_START, _KEY, _COLON, _VALUE, _ELEMENT, _AFTER_ELEMENT, _AFTER_VALUE, _DONE = range(8)
+
+
+class JSONCollectionDecoder:
+    """
+    A push parser for a JSON object with one array member, the collection.
+
+    Text is fed in arbitrary pieces; each call to `feed` returns the collection
+    elements completed by the piece. The other members of the object form the
+    envelope: they are available as soon as they have been parsed, and all of
+    them once `close` has been called. Only the element being received is kept
+    in memory.
+
+    :param str collection_key: The name of the array member, e.g. 'configs'.
+    """
+
+    def __init__(self, collection_key: str) -> None:
+        self.collection_key = collection_key
+        self.envelope: Dict[str, Any] = {}
+        self._decoder = JSONDecoder(strict=False)
+        self._buffer = ''
+        self._pos = 0
+        self._state = _START
+        self._key = None
+        self._final = False
+        # The progress of the scan of a nested value starting at self._pos.
+        self._scan = None
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Add the next piece of the document and return the elements it completed.
+
+        :raises ValueError: If the document is not a JSON object.
+        """
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the document and return the last elements.
+
+        :raises ValueError: If the document is incomplete or invalid.
+        """
+        self._final = True
+        elements = self._parse()
+        if self._state != _DONE:
+            raise ValueError('Incomplete JSON document')
+        if self._buffer[self._pos :].strip():
+            raise ValueError('Extra data after the JSON document')
+        return elements
+
+    def _parse(self) -> List[Any]:
+        # pylint: disable=too-many-branches
+        elements = []
+        while self._state != _DONE:
+            char = self._next_char()
+            if char is None:
+                break
+            if self._state == _START:
+                self._expect(char, '{')
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == '}' and not self.envelope and self._key is None:
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                self._expect(char, '"')
+                try:
+                    self._key, end = scanstring(self._buffer, self._pos + 1, False)
+                except JSONDecodeError:
+                    if self._final:
+                        raise
+                    break
+                self._pos = end
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(char, ':')
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._key == self.collection_key and char == '[':
+                    self._pos += 1
+                    self._state = _ELEMENT
+                    continue
+                value = self._value(char)
+                if value is self:
+                    break
+                self.envelope[self._key] = value
+                self._state = _AFTER_VALUE
+            elif self._state == _ELEMENT:
+                if char == ']':
+                    self._pos += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                value = self._value(char)
+                if value is self:
+                    break
+                elements.append(value)
+                self._state = _AFTER_ELEMENT
+            elif self._state == _AFTER_ELEMENT:
+                self._pos += 1
+                if char == ']':
+                    self._state = _AFTER_VALUE
+                else:
+                    self._expect(char, ',')
+                    self._state = _ELEMENT
+            else:
+                self._pos += 1
+                if char == '}':
+                    self._state = _DONE
+                else:
+                    self._expect(char, ',')
+                    self._state = _KEY
+        return elements
+
+    def _next_char(self) -> Optional[str]:
+        # Skip whitespace and return the next character, without consuming it.
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos >= len(self._buffer):
+            return None
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError('Expecting {0!r} at {1!r}'.format(expected, self._buffer[self._pos : self._pos + 20]))
+        if expected in '{:':
+            self._pos += 1
+
+    def _value(self, char: str) -> Any:
+        # Decode the value at self._pos, or return self if it has not been fully received.
+        if char in '{[':
+            end = self._scan_nested()
+            if end is None:
+                return self
+        elif not self._final:
+            # A number is complete only once a delimiter follows it, e.g. "-1." may continue as "-1.5e3".
+            try:
+                _, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except JSONDecodeError:
+                return self
+            if end >= len(self._buffer) or self._buffer[end] not in _DELIMITERS:
+                return self
+        value, self._pos = self._decoder.raw_decode(self._buffer, self._pos)
+        return value
+
+    def _scan_nested(self) -> Optional[int]:
+        # Find the end of the object or array at self._pos, resuming the previous scan.
+        offset, depth, in_string = self._scan or (0, 0, False)
+        buffer = self._buffer
+        index = self._pos + offset
+        while True:
+            if in_string:
+                match = _STRING_SPECIAL.search(buffer, index)
+                if match is None:
+                    index = len(buffer)
+                    break
+                index = match.end()
+                if match.group() == '\\':
+                    if index >= len(buffer):
+                        # Resume on the backslash once the escaped character arrives.
+                        index -= 1
+                        break
+                    index += 1
+                else:
+                    in_string = False
+                continue
+            match = _STRUCTURAL.search(buffer, index)
+            if match is None:
+                index = len(buffer)
+                break
+            index = match.end()
+            char = match.group()
+            if char == '"':
+                in_string = True
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    self._scan = None
+                    return index
+        self._scan = (index - self._pos, depth, in_string)
+        return None
+
+
+class StreamingCollection:
+    """
+    An iterator over the elements of a list operation response, decoded while the
+    body is being received.
+
+    The response must have been requested with `stream=True`. Iterating yields
+    each element of the collection as soon as it has been decoded, converted with
+    `model.from_dict` when a model is given. The other members of the response,
+    such as `limit` and `next`, are available in `envelope` once iteration ends.
+
+    :param requests.Response response: The streamed response of the list operation.
+    :param str collection_key: The name of the collection member, e.g. 'configs'.
+    :param type model: (optional) The model class of the elements.
+    :param int chunk_size: (optional) The number of bytes read from the response at a time.
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        collection_key: str,
+        model: Optional[type] = None,
+        *,
+        chunk_size: int = 65536,
+    ) -> None:
+        self.response = response
+        self.collection_key = collection_key
+        self.model = model
+        self.chunk_size = chunk_size
+        self._decoder = JSONCollectionDecoder(collection_key)
+        self._elements = self._generate()
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        """The members of the response other than the collection, decoded so far."""
+        return self._decoder.envelope
+
+    def get_next_token(self) -> Optional[str]:
+        """Return the token of the next page, once the envelope has been decoded."""
+        next_page_link = self.envelope.get('next')
+        if next_page_link is None:
+            return None
+        return get_query_param(next_page_link.get('href'), 'token')
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._elements)
+
+    def __enter__(self) -> 'StreamingCollection':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop decoding and release the connection of the response."""
+        self._elements.close()
+        self.response.close()
+
+    def _generate(self) -> Iterator[Any]:
+        try:
+            chunks = self.response.iter_content(self.chunk_size)
+            for element in _decode(chunks, self._decoder, self.response.encoding or 'utf-8'):
+                yield self.model.from_dict(element) if self.model is not None else element
+        finally:
+            self.response.close()
+
+
+def iter_collection(
+    chunks: Iterable[bytes], collection_key: str, convert: Optional[Callable[[dict], Any]] = None
+) -> Iterator[Any]:
+    """
+    Yield the elements of the collection of a JSON document received in chunks of bytes.
+
+    :param Iterable[bytes] chunks: The UTF-8 encoded document.
+    :param str collection_key: The name of the collection member.
+    :param Callable convert: (optional) Converts each element, e.g. `Model.from_dict`.
+    """
+    for element in _decode(chunks, JSONCollectionDecoder(collection_key)):
+        yield convert(element) if convert is not None else element
+
+
+def _decode(chunks: Iterable[bytes], decoder: JSONCollectionDecoder, encoding: str = 'utf-8') -> Iterator[Any]:
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        yield from decoder.feed(text_decoder.decode(chunk))
+    yield from decoder.feed(text_decoder.decode(b'', final=True))
+    yield from decoder.close()
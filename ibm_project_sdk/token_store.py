@@ -0,0 +1,180 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a token store that lets the processes of a host share the
+access tokens of their authenticators, so that each token is requested once.
+"""
+
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from ibm_cloud_sdk_core.token_managers.jwt_token_manager import JWTTokenManager
+import jwt
+
+from .cache import CacheStats
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# The token manager attributes, besides the request payload, that select the token requested.
+_CREDENTIAL_ATTRIBUTES = ('url', 'client_id', 'scope', 'cr_token_filename', 'username', 'password', 'apikey')
+
+
+class TokenStore:
+    """
+    Keeps the token responses of the authenticators of a host in a file shared
+    by its processes, such as the workers of a gunicorn server, so that a worker
+    reuses the token another one requested instead of requesting its own.
+
+    A stored token is used until its refresh time, at 80% of its lifetime, as
+    the token managers of the core library do. The first process that needs a
+    token after that time requests a new one while holding a lock on the store;
+    the others wait for it and read the new token. Tokens are keyed by a digest
+    of the credentials they were requested with, so one store can serve several
+    API keys.
+
+    The store holds bearer and refresh tokens: it is created readable by its
+    owner only, and should be kept in a directory no other user can write to.
+    It requires the `fcntl` module, which is not available on Windows.
+
+    :param str path: The path of the store file, created if needed. A lock file
+           with the same path and a '.lock' suffix is created next to it.
+    """
+
+    def __init__(self, path: str) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise NotImplementedError('TokenStore requires fcntl, which is not available on this platform')
+        self.path = path
+        self._lock_path = path + '.lock'
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def attach(self, authenticator: Authenticator) -> bool:
+        """
+        Make an authenticator read and write its tokens through this store.
+        Authenticators that do not request JWT tokens, such as the basic, bearer
+        token and no-auth authenticators, are left unchanged.
+
+        :param Authenticator authenticator: The authenticator to share tokens of.
+        :return: Whether the authenticator uses the store.
+        :rtype: bool
+        """
+        token_manager = getattr(authenticator, 'token_manager', None)
+        if not isinstance(token_manager, JWTTokenManager):
+            return False
+        request_token = token_manager.request_token
+        if getattr(request_token, 'func', None) == self._request_token:
+            return True
+        token_manager.request_token = partial(self._request_token, token_manager, request_token)
+        return True
+
+    def get_stats(self) -> CacheStats:
+        """
+        Return the tokens read from the store (hits) and requested by this
+        process (misses), and the number of tokens in the store.
+        """
+        with self._stats_lock:
+            stats = CacheStats(hits=self._stats.hits, misses=self._stats.misses)
+        stats.entries = len(self._read())
+        return stats
+
+    def clear(self) -> None:
+        """Drop all the stored tokens."""
+        with self._locked():
+            self._write({})
+
+    def _request_token(self, token_manager: JWTTokenManager, request_token: Callable[[], dict]) -> dict:
+        # Called by the token manager when its token is expired or due for refresh.
+        key = _get_key(token_manager)
+        now = token_manager._get_current_time()  # pylint: disable=protected-access
+        entry = self._read().get(key)
+        if entry is None or entry['refresh_time'] <= now:
+            with self._locked():
+                # Another process may have refreshed the token while this one waited for the lock.
+                entries = self._read()
+                entry = entries.get(key)
+                if entry is None or entry['refresh_time'] <= now:
+                    token_response = request_token()
+                    entries = {k: e for k, e in entries.items() if e['expire_time'] > now}
+                    entries[key] = _new_entry(token_response, token_manager.token_name)
+                    self._write(entries)
+                    self._count('misses')
+                    return token_response
+        self._count('hits')
+        return entry['token_response']
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # flock locks are held per open file, so they also serialize the threads of a process.
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _read(self) -> Dict[str, dict]:
+        # The store is replaced as a whole, so it can be read without the lock.
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, dict]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tokens-')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(entries, file, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def _get_key(token_manager: JWTTokenManager) -> str:
+    # A digest of the credentials, so that the store does not hold them.
+    credentials = {name: getattr(token_manager, name, None) for name in _CREDENTIAL_ATTRIBUTES}
+    credentials['class'] = type(token_manager).__name__
+    # The container token manager adds the compute resource token, which rotates, to its payload.
+    payload = getattr(token_manager, 'request_payload', None) or {}
+    credentials['payload'] = {name: value for name, value in payload.items() if name != 'cr_token'}
+    return hashlib.sha256(json.dumps(credentials, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _new_entry(token_response: dict, token_name: Optional[str]) -> dict:
+    # The expiration and refresh times, computed as JWTTokenManager._save_token_info does.
+    claims = jwt.decode(
+        token_response.get(token_name), algorithms=['RS256'], options={'verify_signature': False, 'verify_aud': False}
+    )
+    expire_time = claims.get('exp')
+    refresh_time = expire_time - (expire_time - claims.get('iat')) * 0.2
+    return {'token_response': token_response, 'expire_time': expire_time, 'refresh_time': refresh_time}
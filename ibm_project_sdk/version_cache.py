@@ -0,0 +1,218 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides a persistent cache of the configuration versions that no
+longer change, stored in a SQLite database.
+"""
+
+from typing import Awaitable, Callable, Iterable, Optional
+import json
+import sqlite3
+import threading
+import zlib
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .cache import CacheStats
+from .common import Operation
+
+# The states of the versions whose definition can no longer change.
+DEFAULT_IMMUTABLE_STATES = ('approved', 'superseded')
+
+# The operations whose path parameters select stored versions to drop.
+_DELETE_OPERATIONS = frozenset(['delete_project', 'delete_config', 'delete_config_version'])
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS config_versions (
+    project_id TEXT NOT NULL,
+    config_id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (project_id, config_id, version)
+)
+'''
+
+
+class VersionCache:
+    """
+    Keeps the `get_config_version` responses of the versions that can no longer
+    change in a SQLite database, so that they are read from disk instead of the
+    service, also by later processes.
+
+    Only versions in one of `states` are stored; drafts and the versions being
+    validated or deployed are always read from the service. The bodies are
+    stored compressed with zlib. The database can be shared by the processes of
+    a host; SQLite serializes their writes.
+
+    The definition of an approved version is frozen, but its state changes when
+    it is deployed or superseded; leave 'approved' out of `states` when cached
+    versions must report their current state.
+
+    :param str path: The path of the database file, created if needed, or
+           ':memory:' for a cache that is not persisted.
+    :param Iterable[str] states: (optional) The states of the versions to store.
+    :param int compression_level: (optional) The zlib compression level, from 1
+           (fastest) to 9 (smallest).
+    :param float timeout: (optional) The number of seconds to wait for the
+           database when another process is writing to it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        states: Iterable[str] = DEFAULT_IMMUTABLE_STATES,
+        compression_level: int = 6,
+        timeout: float = 30.0,
+    ) -> None:
+        if not 1 <= compression_level <= 9:
+            raise ValueError('compression_level must be between 1 and 9')
+        self.path = path
+        self.states = frozenset(states)
+        self.compression_level = compression_level
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            # Readers of other processes do not block the writer, nor the writer them.
+            self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(_SCHEMA)
+
+    def get(self, project_id: str, config_id: str, version: int) -> Optional[dict]:
+        """
+        Return the stored body of a version, or None if it is not stored.
+
+        :param str project_id: The unique project ID.
+        :param str config_id: The unique configuration ID.
+        :param int version: The configuration version.
+        :rtype: dict
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body FROM config_versions WHERE project_id = ? AND config_id = ? AND version = ?',
+                (project_id, config_id, int(version)),
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, project_id: str, config_id: str, version: int, body: dict) -> bool:
+        """
+        Store the body of a version if its state is one of `states`.
+
+        :param str project_id: The unique project ID.
+        :param str config_id: The unique configuration ID.
+        :param int version: The configuration version.
+        :param dict body: The version, as returned by `get_config_version`.
+        :return: Whether the version was stored.
+        :rtype: bool
+        """
+        if not isinstance(body, dict) or body.get('state') not in self.states:
+            return False
+        data = zlib.compress(json.dumps(body, separators=(',', ':')).encode('utf-8'), self.compression_level)
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO config_versions (project_id, config_id, version, body) VALUES (?, ?, ?, ?)',
+                (project_id, config_id, int(version), data),
+            )
+        return True
+
+    def delete(self, project_id: str, config_id: Optional[str] = None, version: Optional[int] = None) -> int:
+        """
+        Drop the stored versions of a project, of one of its configurations, or one version.
+
+        :param str project_id: The unique project ID.
+        :param str config_id: (optional) The unique configuration ID.
+        :param int version: (optional) The configuration version.
+        :return: The number of versions dropped.
+        :rtype: int
+        """
+        query = 'DELETE FROM config_versions WHERE project_id = ?'
+        args = [project_id]
+        if config_id is not None:
+            query += ' AND config_id = ?'
+            args.append(config_id)
+            if version is not None:
+                query += ' AND version = ?'
+                args.append(int(version))
+        with self._lock:
+            return self._connection.execute(query, args).rowcount
+
+    def get_stats(self) -> CacheStats:
+        """
+        Return the hits and misses of this cache object, and the number and
+        compressed size of the versions in the database.
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                'SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM config_versions'
+            ).fetchone()
+            return CacheStats(hits=self._stats.hits, misses=self._stats.misses, entries=entries, bytes=size)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    def is_cached(self, operation: Operation, kwargs: dict) -> bool:
+        """Return true if calls of the operation read or delete stored versions."""
+        if operation.operation_id == 'get_config_version':
+            return not kwargs.get('stream')
+        return operation.operation_id in _DELETE_OPERATIONS
+
+    def execute(self, operation: Operation, path_vars: tuple, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Return the stored version of a `get_config_version` call, or call `send`
+        and store the version it returns; drop the stored versions deleted by a
+        successful delete call.
+
+        :param Operation operation: The operation being invoked.
+        :param tuple path_vars: The path parameters of the call: the project ID,
+               configuration ID and version, or a prefix of them.
+        :param Callable send: Sends the request.
+        :return: The response of the call.
+        """
+        if operation.operation_id != 'get_config_version':
+            response = send()
+            self.delete(*path_vars)
+            return response
+        body = self.get(*path_vars)
+        if body is not None:
+            return DetailedResponse(response=body, status_code=200)
+        response = send()
+        self.put(*path_vars, response.get_result())
+        return response
+
+    async def execute_async(
+        self, operation: Operation, path_vars: tuple, send: Callable[[], Awaitable[DetailedResponse]]
+    ) -> DetailedResponse:
+        """
+        Like `execute`, for a `send` function returning a coroutine. The database
+        is read and written on the event loop, as local lookups are short.
+        """
+        if operation.operation_id != 'get_config_version':
+            response = await send()
+            self.delete(*path_vars)
+            return response
+        body = self.get(*path_vars)
+        if body is not None:
+            return DetailedResponse(response=body, status_code=200)
+        response = await send()
+        self.put(*path_vars, response.get_result())
+        return response
@@ -48,6 +48,7 @@ setup(
     license='Apache 2.0',
     install_requires=install_requires,
     tests_require=tests_require,
+    extras_require={'async': ['httpx>=0.24.0,<1.0.0'], 'http2': ['httpx[http2]>=0.24.0,<1.0.0']},
     author='IBM',
     author_email='dvesperini@gmail.com',
     long_description=readme,
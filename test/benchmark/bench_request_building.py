@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of the per-call request construction cost of ProjectV1.
+
+Compares the per-call header/URL building that the generated methods used to
+do with the precompiled operation descriptors, both on their own and
+including `prepare_request`. Run it with:
+
+    python test/benchmark/bench_request_building.py
+"""
+
+import timeit
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_project_sdk.common import get_sdk_headers
+from ibm_project_sdk.project_v1 import _OPERATIONS, ProjectV1
+
+NUMBER = 100000
+
+service = ProjectV1(authenticator=NoAuthAuthenticator())
+operation = _OPERATIONS['get_config']
+
+
+def build_per_call(kwargs):
+    """The request construction previously done by every generated method."""
+    headers = {}
+    sdk_headers = get_sdk_headers(
+        service_name=ProjectV1.DEFAULT_SERVICE_NAME,
+        service_version='V1',
+        operation_id='get_config',
+    )
+    headers.update(sdk_headers)
+
+    if 'headers' in kwargs:
+        headers.update(kwargs.get('headers'))
+        del kwargs['headers']
+    headers['Accept'] = 'application/json'
+
+    path_param_keys = ['project_id', 'id']
+    path_param_values = service.encode_path_vars('project-id', 'config-id')
+    path_param_dict = dict(zip(path_param_keys, path_param_values))
+    url = '/v1/projects/{project_id}/configs/{id}'.format(**path_param_dict)
+    return headers, url
+
+
+def build_precompiled(kwargs):
+    """The request construction done through the operation descriptor."""
+    headers = operation.build_headers(kwargs.pop('headers', None))
+    url = operation.build_url(service.encode_path_vars('project-id', 'config-id'))
+    return headers, url
+
+
+def prepare_per_call():
+    """A full prepare_request call with per-call request construction."""
+    headers, url = build_per_call({})
+    return service.prepare_request(method='GET', url=url, headers=headers)
+
+
+def prepare_precompiled():
+    """A full prepare_request call with the operation descriptor."""
+    headers, url = build_precompiled({})
+    return service.prepare_request(method=operation.method, url=url, headers=headers)
+
+
+def report(name, func):
+    """Print and return the best time per call of `func`, in microseconds."""
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+    usec = seconds / NUMBER * 1e6
+    print('{0:<40} {1:8.3f} usec/call'.format(name, usec))
+    return usec
+
+
+def main():
+    """Compare both ways of building a request."""
+    assert build_per_call({}) == build_precompiled({})
+    before = report('headers+url, per call', lambda: build_per_call({}))
+    after = report('headers+url, precompiled', lambda: build_precompiled({}))
+    print('{0:<40} {1:8.2f}x'.format('speedup', before / after))
+    before = report('prepare_request, per call', prepare_per_call)
+    after = report('prepare_request, precompiled', prepare_precompiled)
+    print('{0:<40} {1:8.2f}x'.format('speedup', before / after))
+
+
+if __name__ == '__main__':
+    main()
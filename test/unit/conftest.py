@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fixtures shared by the unit tests
+"""
+
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+# A request received by the local server, with its body decoded.
+LocalRequest = namedtuple('LocalRequest', ['method', 'path', 'headers', 'body'])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        request = LocalRequest(self.command, self.path, self.headers, body)
+        with server.lock:
+            server.requests.append(request)
+            status = server.statuses.pop(0) if server.statuses else 200
+        time.sleep(server.delay)
+        if status in (204, 304):
+            self.send_response(status)
+            self.end_headers()
+            return
+        payload = server.body(request) if status < 300 else {'errors': [{'message': 'failed'}]}
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if server.compress_responses and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            data = gzip.compress(data)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _respond
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+class LocalServer(ThreadingHTTPServer):
+    """
+    A local HTTP/1.1 server, for the tests that need real connections.
+
+    Requests are recorded in `requests`. Each one is answered after `delay`
+    seconds with the next status of `statuses`, 200 once it is empty, and the
+    JSON document returned by `body` for the request. Responses are gzip-encoded
+    for the clients that accept it when `compress_responses` is set.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), _Handler)
+        self.url = 'http://127.0.0.1:{0}'.format(self.server_address[1])
+        self.requests = []
+        self.statuses = []
+        self.delay = 0.0
+        self.body = lambda request: {'id': 'id'}
+        self.compress_responses = False
+        self.lock = threading.Lock()
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    """A running LocalServer."""
+    server = LocalServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the asyncio client
+"""
+
+from urllib.parse import parse_qs, urlsplit
+import asyncio
+import gzip
+import inspect
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+
+from ibm_project_sdk.circuit import CircuitBreaker, CircuitOpenError
+from ibm_project_sdk.coalesce import CoalescingStats
+from ibm_project_sdk.crawler import Crawler
+from ibm_project_sdk.pagers import PagerCheckpoint
+from ibm_project_sdk.project_v1 import (
+    _OPERATIONS,
+    ConfigsPager,
+    ConfigVersionsPager,
+    ProjectConfigSummary,
+    ProjectV1,
+)
+from ibm_project_sdk.ratelimit import RateLimiter
+from ibm_project_sdk.retry import RetryPolicy
+
+httpx = pytest.importorskip('httpx')
+async_project_v1 = pytest.importorskip('ibm_project_sdk.async_project_v1')
+
+_config = {
+    'id': 'config-id',
+    'version': 1,
+    'created_at': '2019-01-01T12:00:00.000Z',
+    'modified_at': '2019-01-01T12:00:00.000Z',
+    'state': 'approved',
+    'href': 'href',
+    'definition': {'name': 'name', 'description': 'description'},
+    'project': {'id': 'id', 'href': 'href', 'definition': {'name': 'name'}, 'crn': 'crn'},
+}
+
+
+# The pages of the list operations, keyed by path and token.
+_pages = {}
+
+
+def _page_key(url):
+    parts = urlsplit(url)
+    return parts.path, parse_qs(parts.query).get('token', [None])[0]
+
+
+def _body(request):
+    return _pages.get(_page_key(request.path), dict(_config, id=request.path))
+
+
+@pytest.fixture(name='service')
+def fixture_service(server):
+    """An AsyncProjectV1 whose requests are answered by the local server."""
+    _pages.clear()
+    server.body = _body
+    service = async_project_v1.AsyncProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(server.url)
+    return service
+
+
+def _run(service, call):
+    async def main():
+        async with service:
+            return await call()
+
+    return asyncio.run(main())
+
+
+class TestAsyncProjectV1:
+    """
+    Test Class for AsyncProjectV1
+    """
+
+    def test_operations_are_shared(self, service):
+        for operation_id in _OPERATIONS:
+            assert getattr(async_project_v1.AsyncProjectV1, operation_id) is getattr(ProjectV1, operation_id)
+        coroutine = service.get_config('project-id', 'config-id')
+        assert inspect.iscoroutine(coroutine)
+        coroutine.close()
+
+    def test_get(self, service, server):
+        response = _run(service, lambda: service.get_config('project id', 'config-id', headers={'X-Test': 'value'}))
+        assert response.get_status_code() == 200
+        assert response.get_headers()['content-type'] == 'application/json'
+        assert ProjectConfigSummary.from_dict(response.get_result()).id == '/v1/projects/project%20id/configs/config-id'
+        method, path, headers, _ = server.requests[0]
+        assert (method, path) == ('GET', '/v1/projects/project%20id/configs/config-id')
+        assert headers['X-Test'] == 'value'
+        assert headers['Accept'] == 'application/json'
+        assert headers['User-Agent'].startswith('project-python-sdk')
+
+    def test_post_and_query(self, service, server):
+        _run(service, lambda: service.create_config('project-id', {'name': 'config'}))
+        _run(service, lambda: service.list_configs('project-id', limit=10))
+        server.statuses = [204]
+        assert _run(service, lambda: service.delete_config_version('p', 'c', 1)).get_result() is None
+        method, path, headers, body = server.requests[0]
+        assert (method, path) == ('POST', '/v1/projects/project-id/configs')
+        assert headers['Content-Type'] == 'application/json'
+        assert json.loads(body) == {'definition': {'name': 'config'}}
+        assert server.requests[1][1] == '/v1/projects/project-id/configs?limit=10'
+
+    def test_validation_happens_on_call(self, service):
+        with pytest.raises(ValueError):
+            service.get_config(None, 'config-id')
+
+    def test_errors(self, service, server):
+        server.statuses = [404]
+        with pytest.raises(ApiException) as error:
+            _run(service, lambda: service.get_config('project-id', 'config-id'))
+        assert error.value.status_code == 404
+        assert error.value.message == 'failed'
+
+        service.set_service_url('http://127.0.0.1:1')
+        with pytest.raises(requests.exceptions.ConnectionError):
+            _run(service, lambda: service.get_config('project-id', 'config-id'))
+
+    def test_concurrent_requests(self, service, server):
+        server.delay = 0.2
+
+        async def call():
+            return await asyncio.gather(*(service.get_config('project-id', str(i)) for i in range(50)))
+
+        start = time.monotonic()
+        responses = _run(service, call)
+        assert time.monotonic() - start < 5
+        assert [response.get_result()['id'] for response in responses] == [
+            '/v1/projects/project-id/configs/{0}'.format(i) for i in range(50)
+        ]
+
+    def test_batches(self, service, server):
+        server.statuses = [200, 404]
+        result = _run(service, lambda: service.get_configs('project-id', ['a', 'b', 'a', 'c'], max_workers=1))
+        assert list(result.responses) == ['a', 'c']
+        assert result.errors['b'].status_code == 404
+        assert len(server.requests) == 3
+
+        server.delay = 0.1
+
+        async def first():
+            items = service.iter_configs('project-id', [str(i) for i in range(10)], max_workers=2)
+            item = await items.__anext__()
+            await items.aclose()
+            return item
+
+        assert _run(service, first).get_result()['id'].startswith('/v1/projects/project-id/configs/')
+        time.sleep(0.2)
+        # Closing the iterator cancelled the requests not sent yet.
+        assert len(server.requests) <= 3 + 3
+        with pytest.raises(ValueError):
+            service.iter_configs('project-id', ['a'], max_workers=0)
+
+    def test_policies(self, service, server):
+        service.set_retry_policy(RetryPolicy(base_delay=0.01))
+        service.set_rate_limiter(RateLimiter(rate=1000, burst=10))
+        service.set_circuit_breaker(CircuitBreaker(minimum_calls=2, window_size=2))
+        service.enable_coalescing()
+        service.enable_compression(threshold=1)
+        server.statuses = [503]
+
+        async def call():
+            return await asyncio.gather(*(service.get_config('project-id', 'config-id') for _ in range(3)))
+
+        responses = _run(service, call)
+        assert all(response is responses[0] for response in responses)
+        assert len(server.requests) == 2
+        assert service.get_coalescing_stats() == CoalescingStats(hits=2, misses=1)
+        assert service.get_compression_stats().response_bytes > 0
+
+        _run(service, lambda: service.create_config('project-id', {'name': 'config'}))
+        assert json.loads(server.requests[-1][3]) == {'definition': {'name': 'config'}}
+        assert service.get_compression_stats().requests_compressed == 1
+
+        server.statuses = [500, 500]
+        service.set_retry_policy(None)
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                _run(service, lambda: service.get_config('project-id', 'config-id'))
+        with pytest.raises(CircuitOpenError):
+            _run(service, lambda: service.get_config('project-id', 'config-id'))
+
+    def test_deadline_caps_configured_timeout(self, service, monkeypatch):
+        timeouts = []
+
+        def to_httpx_timeout(timeout):
+            timeouts.append(timeout)
+            return httpx.Timeout(timeout)
+
+        monkeypatch.setattr(async_project_v1, 'to_httpx_timeout', to_httpx_timeout)
+        service.set_http_config({'timeout': 30})
+        service.set_retry_policy(RetryPolicy(deadline=5.0))
+
+        async def call():
+            await service.get_config('project-id', 'config-id')
+
+        _run(service, call)
+        assert 0 < timeouts[0] <= 5.0
+
+    def test_conditional_requests(self, service, server):
+        service.enable_conditional_requests()
+        server.statuses = [200, 304]
+
+        async def call():
+            first = await service.get_config('project-id', 'config-id')
+            second = await service.get_config('project-id', 'config-id')
+            return first, second
+
+        first, second = _run(service, call)
+        assert second.get_result() == first.get_result()
+        assert server.requests[1][2]['If-Modified-Since'] == 'Tue, 01 Jan 2019 12:00:00 GMT'
+        assert service.get_conditional_cache_stats().hits == 1
+
+    def test_response_cache(self, service, server):
+        service.enable_response_cache()
+
+        async def call():
+            for _ in range(2):
+                await service.get_config('project-id', 'config-id')
+            await service.update_config('project-id', 'config-id', {'name': 'config'})
+            await service.get_config('project-id', 'config-id')
+
+        _run(service, call)
+        assert [request[0] for request in server.requests] == ['GET', 'PATCH', 'GET']
+        stats = service.get_response_cache_stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+    def test_negative_cache(self, service, server):
+        service.enable_negative_cache()
+        server.statuses = [404]
+
+        async def call():
+            for _ in range(2):
+                with pytest.raises(ApiException):
+                    await service.get_config('project-id', 'config-id')
+
+        _run(service, call)
+        assert len(server.requests) == 1
+        assert service.get_negative_cache_stats().hits == 1
+
+    def test_streamed_response(self, service):
+        async def call():
+            response = await service.get_config('project-id', 'config-id', stream=True)
+            http_response = response.get_result()
+            body = await http_response.aread()
+            await http_response.aclose()
+            return body
+
+        assert json.loads(_run(service, call))['id'] == '/v1/projects/project-id/configs/config-id'
+
+    def test_sync_only_features(self, service):
+        for name in ('stream_configs', 'set_transport_adapter', 'set_hedging_policy', 'get_pool_stats'):
+            assert not hasattr(service, name)
+        assert not isinstance(service, ProjectV1)
+
+    def test_sync_pagers_reject_the_client(self, service):
+        with pytest.raises(TypeError):
+            ConfigsPager(client=service, project_id='project-id')
+        with pytest.raises(TypeError):
+            ConfigVersionsPager(client=service, project_id='project-id', id='config-id')
+        with pytest.raises(TypeError):
+            Crawler(service)
+
+
+def _add_pages(path, collection_key, count, size=2):
+    for page in range(count):
+        body = {collection_key: [{'id': '{0}-{1}'.format(page, i)} for i in range(size)]}
+        if page + 1 < count:
+            body['next'] = {'href': 'https://x{0}?limit={1}&token=t{2}'.format(path, size, page + 1)}
+        _pages[path, 't{0}'.format(page) if page else None] = body
+
+
+class TestAsyncPagers:
+    """
+    Test Class for the asyncio pagers
+    """
+
+    def test_async_for(self, service):
+        _add_pages('/v1/projects/p/configs', 'configs', 3)
+        _add_pages('/v1/projects/p/environments', 'environments', 1)
+        _add_pages('/v1/projects', 'projects', 2)
+
+        async def call():
+            configs = [
+                config['id']
+                async for config in async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2)
+            ]
+            environments = [
+                e async for e in async_project_v1.AsyncProjectEnvironmentsPager(client=service, project_id='p', limit=2)
+            ]
+            projects = await async_project_v1.AsyncProjectsPager(client=service, limit=2).get_all()
+            return configs, environments, projects
+
+        configs, environments, projects = _run(service, call)
+        assert configs == ['0-0', '0-1', '1-0', '1-1', '2-0', '2-1']
+        assert len(environments) == 2
+        assert [project['id'] for project in projects] == ['0-0', '0-1', '1-0', '1-1']
+
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test_prefetch(self, service, server, prefetch):
+        _add_pages('/v1/projects/p/configs', 'configs', 3)
+        requested = []
+
+        async def call():
+            pager = async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2, prefetch=prefetch)
+            async for config in pager:
+                if config['id'] == '0-0':
+                    await asyncio.sleep(0.2)
+                    requested.append(len(server.requests))
+            with pytest.raises(StopAsyncIteration):
+                await pager.get_next()
+
+        _run(service, call)
+        assert requested == [2 if prefetch else 1]
+        assert len(server.requests) == 3
+
+    def test_early_exit_cancels_prefetch(self, service, server):
+        _add_pages('/v1/projects/p/configs', 'configs', 3)
+        server.delay = 0.1
+
+        async def call():
+            pager = async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2)
+            iterator = pager.__aiter__()
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            return first
+
+        assert _run(service, call)['id'] == '0-0'
+
+    def test_checkpoint(self, service):
+        _add_pages('/v1/projects/p/configs', 'configs', 3)
+
+        async def call():
+            pager = async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2)
+            async for config in pager:
+                if config['id'] == '1-0':
+                    break
+            checkpoint = pager.get_checkpoint()
+            resumed = async_project_v1.AsyncConfigsPager(client=service, project_id='p', checkpoint=checkpoint)
+            return checkpoint, [config['id'] async for config in resumed], resumed.get_checkpoint()
+
+        checkpoint, remaining, final = _run(service, call)
+        assert checkpoint == PagerCheckpoint(token='t1', limit=2, offset=1)
+        assert remaining == ['1-1', '2-0', '2-1']
+        assert final == PagerCheckpoint(limit=2, done=True)
+
+    def test_checkpoint_at_page_boundary(self, service):
+        # The last page is prefetched while the consumer is still on the first one.
+        _add_pages('/v1/projects/p/configs', 'configs', 2)
+
+        async def call():
+            pager = async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2)
+            async for config in pager:
+                await asyncio.sleep(0.05)
+                if config['id'] == '0-1':
+                    break
+            checkpoint = pager.get_checkpoint()
+            resumed = async_project_v1.AsyncConfigsPager(client=service, project_id='p', checkpoint=checkpoint)
+            return checkpoint, [config['id'] async for config in resumed]
+
+        checkpoint, remaining = _run(service, call)
+        assert checkpoint == PagerCheckpoint(token='t1', limit=2, offset=0)
+        assert remaining == ['1-0', '1-1']
+
+    def test_get_next_after_break(self, service):
+        _add_pages('/v1/projects/p/configs', 'configs', 3)
+
+        async def call():
+            pager = async_project_v1.AsyncConfigsPager(client=service, project_id='p', limit=2)
+            async for config in pager:
+                # Let the prefetch of the second page complete.
+                await asyncio.sleep(0.1)
+                if config['id'] == '0-1':
+                    break
+            return pager.get_checkpoint(), [config['id'] for config in await pager.get_next()]
+
+        checkpoint, page = _run(service, call)
+        assert checkpoint == PagerCheckpoint(token='t1', limit=2, offset=0)
+        assert page == ['1-0', '1-1']
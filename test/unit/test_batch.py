@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the batch operations
+"""
+
+import json
+import re
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.batch import BatchItem, BatchResult
+from ibm_project_sdk.project_v1 import ProjectV1
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+_url = re.compile(re.escape(_base_url) + r'/v1/projects/p/configs/([^/]+)$')
+
+
+class _Server:
+    """
+    Serves configs after `delay` seconds, failing for the IDs in `missing`.
+    """
+
+    def __init__(self, delay=0.0, missing=()):
+        self.delay = delay
+        self.missing = missing
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        config_id = _url.match(request.url).group(1)
+        with self.lock:
+            self.calls.append(config_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if config_id in self.missing:
+            return (404, {}, json.dumps({'errors': [{'message': 'not found'}]}))
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'id': config_id}))
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestGetConfigs:
+    """
+    Test Class for get_configs and iter_configs
+    """
+
+    @responses.activate
+    def test_get_configs(self, service):
+        server = _Server(missing=('b',))
+        responses.add_callback(responses.GET, _url, callback=server)
+        result = service.get_configs('p', ['c', 'a', 'b', 'c', 'a'], headers={'X-Test': 'value'})
+        assert isinstance(result, BatchResult)
+        assert list(result.responses) == ['c', 'a']
+        assert result.get_results() == {'c': {'id': 'c'}, 'a': {'id': 'a'}}
+        assert list(result.errors) == ['b']
+        assert result.errors['b'].status_code == 404
+        assert len(result) == 3
+        assert sorted(server.calls) == ['a', 'b', 'c']
+        assert all(call.request.headers['X-Test'] == 'value' for call in responses.calls)
+
+    @responses.activate
+    def test_concurrency_is_bounded(self, service):
+        server = _Server(delay=0.02)
+        responses.add_callback(responses.GET, _url, callback=server)
+        ids = [str(i) for i in range(20)]
+        result = service.get_configs('p', ids, max_workers=4)
+        assert list(result.responses) == ids
+        assert server.max_in_flight == 4
+
+    @responses.activate
+    def test_iter_configs(self, service):
+        server = _Server(missing=('1',))
+        responses.add_callback(responses.GET, _url, callback=server)
+        items = list(service.iter_configs('p', ['0', '1', '2'], max_workers=1))
+        assert all(isinstance(item, BatchItem) for item in items)
+        assert [item.id for item in items] == ['0', '1', '2']
+        assert items[0].get_result() == {'id': '0'}
+        with pytest.raises(ApiException):
+            items[1].get_result()
+
+    @responses.activate
+    def test_early_exit(self, service):
+        server = _Server(delay=0.01)
+        responses.add_callback(responses.GET, _url, callback=server)
+        for _ in service.iter_configs('p', [str(i) for i in range(50)], max_workers=2):
+            break
+        time.sleep(0.1)
+        assert len(server.calls) <= 4
+
+    def test_validation(self, service):
+        with pytest.raises(ValueError):
+            service.get_configs(None, ['a'])
+        with pytest.raises(ValueError):
+            service.iter_configs('p', ['a', ''])
+        with pytest.raises(ValueError):
+            service.iter_configs('p', ['a'], max_workers=0)
+        assert len(service.get_configs('p', [])) == 0
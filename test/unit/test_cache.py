@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the response caches
+"""
+
+import json
+import re
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.cache import CacheStats, ConditionalCache, NegativeCache, ResponseCache
+from ibm_project_sdk.project_v1 import ProjectV1
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+
+
+@pytest.fixture(name='service')
+def fixture_service():
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class _ETagServer:
+    """
+    Serves a resource with an ETag, answering 304 to requests that send it.
+    """
+
+    def __init__(self, body, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+
+    def __call__(self, request):
+        if request.headers.get('If-None-Match') == self.etag:
+            return (304, {'ETag': self.etag}, '')
+        return (200, {'Content-Type': 'application/json', 'ETag': self.etag}, json.dumps(self.body))
+
+
+class TestConditionalCache:
+    """
+    Test Class for ConditionalCache
+    """
+
+    @responses.activate
+    def test_etag(self, service):
+        server = _ETagServer({'id': 'c', 'version': 1})
+        url = _base_url + '/v1/projects/p/configs/c'
+        responses.add_callback(responses.GET, url, callback=server)
+        service.enable_conditional_requests()
+        first = service.get_config('p', 'c')
+        second = service.get_config('p', 'c')
+        assert second.get_status_code() == 200
+        assert second.get_result() == first.get_result() == {'id': 'c', 'version': 1}
+        assert 'If-None-Match' not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers['If-None-Match'] == '"v1"'
+        stats = service.get_conditional_cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.bytes == len('{"id":"c","version":1}')
+
+        # A modified resource is returned and replaces the cached response.
+        server.body, server.etag = {'id': 'c', 'version': 2}, '"v2"'
+        assert service.get_config('p', 'c').get_result()['version'] == 2
+        assert service.get_config('p', 'c').get_result()['version'] == 2
+        assert responses.calls[3].request.headers['If-None-Match'] == '"v2"'
+
+    @responses.activate
+    def test_modified_at(self, service):
+        url = _base_url + '/v1/projects/p'
+        responses.add(responses.GET, url, json={'id': 'p', 'modified_at': '2024-03-01T10:20:30Z'})
+        responses.add(responses.GET, url, status=304)
+        service.enable_conditional_requests()
+        service.get_project('p')
+        assert service.get_project('p').get_result()['id'] == 'p'
+        assert responses.calls[1].request.headers['If-Modified-Since'] == 'Fri, 01 Mar 2024 10:20:30 GMT'
+
+    @responses.activate
+    def test_modified_at_within_a_second(self, service):
+        # A change made in the same second as the cached copy is not answered with 304.
+        url = _base_url + '/v1/projects/p'
+        responses.add(responses.GET, url, json={'id': 'p', 'modified_at': '2024-03-01T10:20:30.200Z'})
+        responses.add(responses.GET, url, json={'id': 'p', 'modified_at': '2024-03-01T10:20:30.700Z'})
+        service.enable_conditional_requests()
+        service.get_project('p')
+        assert service.get_project('p').get_result()['modified_at'] == '2024-03-01T10:20:30.700Z'
+        assert 'If-Modified-Since' not in responses.calls[1].request.headers
+        assert service.get_conditional_cache_stats().entries == 0
+
+    @responses.activate
+    def test_uncached_calls(self, service):
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs', json={'configs': []})
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/c', json={'id': 'c'})
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/c', status=304)
+        service.enable_conditional_requests()
+        service.list_configs('p')
+        service.list_configs('p')
+        # Without a validator, nothing is cached and a 304 is an error.
+        service.get_config('p', 'c')
+        with pytest.raises(ApiException):
+            service.get_config('p', 'c', headers={'If-None-Match': '"v1"'})
+        assert not any('If-None-Match' in call.request.headers for call in responses.calls[:3])
+        assert service.get_conditional_cache_stats() == CacheStats(misses=1)
+
+        service.disable_conditional_requests()
+        assert service.get_conditional_cache_stats() == CacheStats()
+
+    @responses.activate
+    def test_eviction(self, service):
+        for config_id in ('a', 'b', 'c'):
+            url = _base_url + '/v1/projects/p/configs/' + config_id
+            responses.add_callback(responses.GET, url, callback=_ETagServer({'id': config_id}))
+        service.enable_conditional_requests(max_entries=2)
+        for config_id in ('a', 'b', 'a', 'c', 'a', 'b'):
+            service.get_config('p', config_id)
+        stats = service.get_conditional_cache_stats()
+        # 'b' was the least recently used when 'c' was added.
+        assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 4, 2, 2)
+        with pytest.raises(ValueError):
+            ConditionalCache(max_entries=0)
+
+
+def _add_reads():
+    for path in (
+        '/v1/projects',
+        '/v1/projects/p',
+        '/v1/projects/p/configs',
+        '/v1/projects/p/configs/c',
+        '/v1/projects/p/configs/c/versions',
+        '/v1/projects/p/configs/d',
+        '/v1/projects/p/environments',
+        '/v1/projects/p/environments/e',
+    ):
+        responses.add(responses.GET, _base_url + path, json={'path': path})
+
+
+def _read_all(service):
+    service.list_projects()
+    service.get_project('p')
+    service.list_configs('p')
+    service.get_config('p', 'c')
+    service.list_config_versions('p', 'c')
+    service.get_config('p', 'd')
+    service.list_project_environments('p')
+    service.get_project_environment('p', 'e')
+
+
+def _paths(calls):
+    return [call.request.path_url for call in calls]
+
+
+class TestResponseCache:
+    """
+    Test Class for ResponseCache
+    """
+
+    @responses.activate
+    def test_hits(self, service):
+        _add_reads()
+        service.enable_response_cache()
+        _read_all(service)
+        _read_all(service)
+        assert service.list_configs('p', limit=10).get_result() == {'path': '/v1/projects/p/configs'}
+        assert len(responses.calls) == 9
+        assert service.get_config('p', 'c').get_result() == {'path': '/v1/projects/p/configs/c'}
+        stats = service.get_response_cache_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (9, 9, 9)
+
+        service.disable_response_cache()
+        service.get_config('p', 'c')
+        assert len(responses.calls) == 10
+
+    @responses.activate
+    @pytest.mark.parametrize('write', ['update_config', 'approve', 'deploy_config', 'delete_config'])
+    def test_config_writes_invalidate(self, service, write):
+        _add_reads()
+        responses.add(responses.PATCH, _base_url + '/v1/projects/p/configs/c', json={})
+        responses.add(responses.POST, re.compile(_base_url + '/v1/projects/p/configs/c/.*'), json={})
+        responses.add(responses.DELETE, _base_url + '/v1/projects/p/configs/c', json={})
+        service.enable_response_cache()
+        _read_all(service)
+        if write == 'update_config':
+            service.update_config('p', 'c', {'name': 'name'})
+        elif write == 'approve':
+            service.approve('p', 'c')
+        else:
+            getattr(service, write)('p', 'c')
+        responses.calls.reset()
+        _read_all(service)
+        # The configuration, its versions, the list of configurations and the
+        # projects above are read again; the other resources are not.
+        assert _paths(responses.calls) == [
+            '/v1/projects',
+            '/v1/projects/p',
+            '/v1/projects/p/configs',
+            '/v1/projects/p/configs/c',
+            '/v1/projects/p/configs/c/versions',
+        ]
+        assert service.get_response_cache_stats().invalidations == 5
+
+    @responses.activate
+    def test_other_writes_invalidate(self, service):
+        _add_reads()
+        responses.add(responses.PATCH, _base_url + '/v1/projects/p/environments/e', json={})
+        responses.add(responses.POST, _base_url + '/v1/projects/p/configs', json={})
+        service.enable_response_cache()
+        _read_all(service)
+        service.update_project_environment('p', 'e', {'name': 'name'})
+        responses.calls.reset()
+        _read_all(service)
+        assert _paths(responses.calls) == [
+            '/v1/projects',
+            '/v1/projects/p',
+            '/v1/projects/p/environments',
+            '/v1/projects/p/environments/e',
+        ]
+        # A new configuration does not change the existing ones.
+        service.create_config('p', {'name': 'name'})
+        responses.calls.reset()
+        _read_all(service)
+        assert _paths(responses.calls) == ['/v1/projects', '/v1/projects/p', '/v1/projects/p/configs']
+
+    @responses.activate
+    def test_failed_write_invalidates(self, service):
+        _add_reads()
+        responses.add(responses.DELETE, _base_url + '/v1/projects/p/configs/d', status=500, json={})
+        service.enable_response_cache()
+        _read_all(service)
+        with pytest.raises(ApiException):
+            service.delete_config('p', 'd')
+        responses.calls.reset()
+        service.get_config('p', 'd')
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_read_during_write_is_not_cached(self, service):
+        def callback(request):  # pylint: disable=unused-argument
+            # A write completes while the read is in flight.
+            service.update_config('p', 'c', {'name': 'name'})
+            return (200, {'Content-Type': 'application/json'}, json.dumps({'version': 1}))
+
+        responses.add_callback(responses.GET, _base_url + '/v1/projects/p/configs/c', callback=callback)
+        responses.add(responses.PATCH, _base_url + '/v1/projects/p/configs/c', json={})
+        service.enable_response_cache()
+        service.get_config('p', 'c')
+        service.get_config('p', 'c')
+        assert _paths(responses.calls).count('/v1/projects/p/configs/c') == 4
+
+    @responses.activate
+    def test_ttl(self, service):
+        _add_reads()
+        service.enable_response_cache(ttl=60, operation_ttls={'get_config': 0.05, 'list_configs': 0})
+        for _ in range(2):
+            service.get_project('p')
+            service.get_config('p', 'c')
+            service.list_configs('p')
+        assert (
+            _paths(responses.calls) == ['/v1/projects/p', '/v1/projects/p/configs/c'] + ['/v1/projects/p/configs'] * 2
+        )
+        time.sleep(0.1)
+        service.get_project('p')
+        service.get_config('p', 'c')
+        assert len(responses.calls) == 5
+
+    @responses.activate
+    def test_bounds(self, service):
+        _add_reads()
+        service.enable_response_cache(max_entries=2)
+        for config_id in ('c', 'd', 'c', 'c'):
+            service.get_config('p', config_id)
+        service.get_project('p')
+        stats = service.get_response_cache_stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (2, 3, 1, 2)
+
+        # Each body is 23 to 40 bytes long: three of them do not fit in 100 bytes.
+        service.enable_response_cache(max_bytes=100)
+        _read_all(service)
+        stats = service.get_response_cache_stats()
+        assert stats.entries == 2
+        assert stats.bytes <= 100
+        assert stats.evictions == 6
+
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=-1)
+        with pytest.raises(ValueError):
+            ResponseCache(max_bytes=0)
+
+
+class TestNegativeCache:
+    """
+    Test Class for NegativeCache
+    """
+
+    def _add_missing_config(self):
+        responses.add(
+            responses.GET,
+            _base_url + '/v1/projects/p/configs/c',
+            status=404,
+            json={'errors': [{'message': 'config not found'}]},
+        )
+
+    @responses.activate
+    def test_missing_resources(self, service):
+        self._add_missing_config()
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/d', json={'id': 'd'})
+        service.enable_negative_cache()
+        for _ in range(3):
+            with pytest.raises(ApiException) as error:
+                service.get_config('p', 'c')
+            assert error.value.status_code == 404
+            assert error.value.message == 'config not found'
+        # The resources below a missing resource are missing too.
+        with pytest.raises(ApiException):
+            service.get_stack_definition('p', 'c')
+        service.get_config('p', 'd')
+        service.get_config('p', 'd')
+        assert [call.request.path_url for call in responses.calls] == ['/v1/projects/p/configs/c'] + [
+            '/v1/projects/p/configs/d'
+        ] * 2
+        assert service.get_negative_cache_stats() == CacheStats(hits=3, misses=3, entries=1)
+
+        service.disable_negative_cache()
+        with pytest.raises(ApiException):
+            service.get_config('p', 'c')
+        assert len(responses.calls) == 4
+
+    @responses.activate
+    def test_other_errors_are_not_cached(self, service):
+        responses.add(responses.GET, _base_url + '/v1/projects/p', status=500, json={})
+        service.enable_negative_cache()
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                service.get_project('p')
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_ttl(self, service):
+        self._add_missing_config()
+        service.enable_negative_cache(ttl=0.05)
+        with pytest.raises(ApiException):
+            service.get_config('p', 'c')
+        time.sleep(0.1)
+        with pytest.raises(ApiException):
+            service.get_config('p', 'c')
+        assert len(responses.calls) == 2
+        with pytest.raises(ValueError):
+            NegativeCache(ttl=0)
+
+    @responses.activate
+    def test_create_invalidates(self, service):
+        self._add_missing_config()
+        responses.add(
+            responses.GET, _base_url + '/v1/projects/p/environments/e', status=404, json={'errors': [{'message': ''}]}
+        )
+        responses.add(responses.POST, _base_url + '/v1/projects/p/configs', json={'id': 'c'})
+        service.enable_negative_cache()
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                service.get_config('p', 'c')
+            with pytest.raises(ApiException):
+                service.get_project_environment('p', 'e')
+        assert len(responses.calls) == 2
+        service.create_config('p', {'name': 'name'})
+        with pytest.raises(ApiException):
+            service.get_config('p', 'c')
+        with pytest.raises(ApiException):
+            service.get_project_environment('p', 'e')
+        # Only the configuration is read again.
+        assert len(responses.calls) == 4
+        assert service.get_negative_cache_stats().invalidations == 1
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the circuit breaker
+"""
+
+import asyncio
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+import responses
+
+from ibm_project_sdk import circuit
+from ibm_project_sdk.circuit import CircuitBreaker, CircuitOpenError, CircuitState
+from ibm_project_sdk.project_v1 import _OPERATIONS, ProjectV1
+from ibm_project_sdk.retry import RetryPolicy
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+_config_url = _base_url + '/v1/projects/testString/configs/testString'
+_configs_url = _base_url + '/v1/projects/testString/configs'
+
+
+class _Clock:
+    """A fake monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(circuit, 'time', clock)
+    return clock
+
+
+def _fail(breaker, key, count, error=None):
+    for _ in range(count):
+        breaker.acquire(key)
+        breaker.record(key, 0.01, error or ApiException(503))
+
+
+class TestCircuitBreaker:
+    """
+    Test Class for CircuitBreaker
+    """
+
+    def test_circuit_breaker_value_error(self):
+        with pytest.raises(ValueError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(window_size=5, minimum_calls=6)
+        with pytest.raises(ValueError):
+            CircuitBreaker(open_duration=0)
+        with pytest.raises(ValueError):
+            CircuitBreaker(key='url')
+
+    def test_opens_on_failure_rate(self, clock):
+        changes = []
+        breaker = CircuitBreaker(minimum_calls=4, window_size=4, on_state_change=lambda *args: changes.append(args))
+        _fail(breaker, 'get_config', 1)
+        for _ in range(2):
+            breaker.acquire('get_config')
+            breaker.record('get_config', 0.01)
+        assert breaker.get_state('get_config') == CircuitState.CLOSED
+        _fail(breaker, 'get_config', 1)
+        assert breaker.get_state('get_config') == CircuitState.OPEN
+        assert changes == [('get_config', CircuitState.CLOSED, CircuitState.OPEN)]
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.acquire('get_config')
+        assert error.value.retry_after == pytest.approx(30.0)
+        # Other circuits are not affected.
+        breaker.acquire('list_configs')
+
+    def test_client_errors_are_not_failures(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        _fail(breaker, 'get_config', 2, ApiException(404))
+        assert breaker.get_state('get_config') == CircuitState.CLOSED
+        _fail(breaker, 'get_config', 1, requests.exceptions.ConnectTimeout())
+        assert breaker.get_state('get_config') == CircuitState.OPEN
+
+    def test_opens_on_slow_calls(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, slow_call_duration=1.0, slow_call_rate_threshold=0.5)
+        breaker.acquire('get_config')
+        breaker.record('get_config', 0.1)
+        breaker.acquire('get_config')
+        breaker.record('get_config', 2.0)
+        assert breaker.get_state('get_config') == CircuitState.OPEN
+
+    def test_half_open_recovery(self, clock):
+        changes = []
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10, half_open_calls=2)
+        breaker.add_listener(lambda key, previous, state: changes.append(state))
+        _fail(breaker, 'get_config', 2)
+        clock.now += 10
+        assert breaker.get_state('get_config') == CircuitState.HALF_OPEN
+        breaker.acquire('get_config')
+        breaker.acquire('get_config')
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire('get_config')
+        breaker.record('get_config', 0.01)
+        breaker.record('get_config', 0.01)
+        assert changes == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+    def test_half_open_failure_reopens(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10)
+        _fail(breaker, 'get_config', 2)
+        clock.now += 10
+        _fail(breaker, 'get_config', 1)
+        assert breaker.get_state('get_config') == CircuitState.OPEN
+        clock.now += 5
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.acquire('get_config')
+        assert error.value.retry_after == pytest.approx(5.0)
+
+    def test_abandoned_trial_calls_are_released(self, clock):
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2, open_duration=10, half_open_calls=1)
+        operation = _OPERATIONS['get_config']
+        _fail(breaker, 'get_config', 2)
+        clock.now += 10
+
+        async def cancel_trial_call():
+            task = asyncio.ensure_future(breaker.call_async(operation, asyncio.Event().wait))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_trial_call())
+
+        def interrupt():
+            raise KeyboardInterrupt()
+
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(operation, interrupt)
+        assert breaker.get_state('get_config') == CircuitState.HALF_OPEN
+        breaker.call(operation, lambda: None)
+        assert breaker.get_state('get_config') == CircuitState.CLOSED
+
+    def test_reset(self, clock):
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+        _fail(breaker, 'get_config', 1)
+        assert breaker.get_states() == {'get_config': CircuitState.OPEN}
+        breaker.reset()
+        assert breaker.get_state('get_config') == CircuitState.CLOSED
+
+    def test_get_key(self):
+        operation = _OPERATIONS['get_config']
+        assert CircuitBreaker().get_key(operation) == 'get_config'
+        assert CircuitBreaker(key='path').get_key(operation) == '/v1/projects/{project_id}/configs/{id}'
+
+
+class TestCircuitBreakerService:
+    """
+    Test Class for the circuit breaker of ProjectV1
+    """
+
+    @responses.activate
+    def test_open_circuit_fails_fast(self, clock):
+        responses.add(responses.GET, _config_url, status=503)
+        responses.add(responses.GET, _configs_url, json={'configs': []}, status=200)
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.set_circuit_breaker(CircuitBreaker(minimum_calls=2, window_size=2))
+        assert service.get_circuit_breaker() is not None
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                service.get_config('testString', 'testString')
+        with pytest.raises(CircuitOpenError):
+            service.get_config('testString', 'testString')
+        assert len(responses.calls) == 2
+        assert service.list_configs('testString').get_status_code() == 200
+
+    @responses.activate
+    def test_open_circuit_is_not_retried(self, clock):
+        responses.add(responses.GET, _config_url, status=503)
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.set_circuit_breaker(CircuitBreaker(minimum_calls=1, window_size=1))
+        service.set_retry_policy(RetryPolicy(max_attempts=5, base_delay=0.0, max_delay=0.0))
+        with pytest.raises(CircuitOpenError):
+            service.get_config('testString', 'testString')
+        assert len(responses.calls) == 1
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request coalescing
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import re
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.coalesce import CoalescingStats, RequestCoalescer
+from ibm_project_sdk.project_v1 import _OPERATIONS, ProjectV1
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+
+
+class _Server:
+    """
+    Serves every request after 0.2 seconds, recording its path.
+    """
+
+    def __init__(self):
+        self.paths = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.paths.append(request.path_url)
+        time.sleep(0.2)
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'id': 'id'}))
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    """A _Server answering the requests of the service."""
+    server = _Server()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        for method in (responses.GET, responses.POST):
+            mock.add_callback(method, re.compile(re.escape(_base_url) + '/.*'), callback=server)
+        yield server
+
+
+@pytest.fixture(name='service')
+def fixture_service(server):  # pylint: disable=unused-argument
+    """A service whose requests are answered by the server."""
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+def _concurrently(call, count=5):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(lambda _: call(), range(count)))
+
+
+class TestRequestCoalescer:
+    """
+    Test Class for RequestCoalescer
+    """
+
+    def test_get_key(self):
+        operation = _OPERATIONS['list_configs']
+        request = {'url': 'https://x/v1/projects/p/configs', 'params': {'limit': 10}, 'headers': {'Accept': 'a'}}
+        key = RequestCoalescer.get_key(operation, request)
+        assert key == RequestCoalescer.get_key(operation, dict(request, headers={'accept': 'a'}))
+        assert key != RequestCoalescer.get_key(operation, dict(request, params={'limit': 20}))
+        assert RequestCoalescer.is_coalesced(operation, {})
+        assert not RequestCoalescer.is_coalesced(operation, {'stream': True})
+        assert not RequestCoalescer.is_coalesced(_OPERATIONS['create_config'], {})
+
+    def test_errors_are_shared(self):
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+
+        def send():
+            started.set()
+            time.sleep(0.1)
+            raise ApiException(500)
+
+        def call():
+            try:
+                coalescer.execute('key', send)
+            except ApiException as error:
+                return error
+            return None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(call)
+            started.wait()
+            second = executor.submit(call)
+        assert first.result() is second.result()
+        assert coalescer.get_stats() == CoalescingStats(hits=1, misses=1)
+
+    def test_execute_async(self):
+        coalescer = RequestCoalescer()
+        sent = []
+
+        async def send():
+            sent.append(None)
+            await asyncio.sleep(0.05)
+            return 'response'
+
+        async def main():
+            return await asyncio.gather(*(coalescer.execute_async('key', send) for _ in range(5)))
+
+        assert asyncio.run(main()) == ['response'] * 5
+        assert len(sent) == 1
+        assert coalescer.get_stats() == CoalescingStats(hits=4, misses=1)
+        assert asyncio.run(main()) == ['response'] * 5
+        assert len(sent) == 2
+
+
+class TestCoalescing:
+    """
+    Test Class for the coalescing mode of ProjectV1
+    """
+
+    def test_identical_calls_share_a_request(self, service, server):
+        service.enable_coalescing()
+        responses = _concurrently(lambda: service.get_config('project-id', 'config-id'))
+        assert len(server.paths) == 1
+        assert all(response is responses[0] for response in responses)
+        assert service.get_coalescing_stats() == CoalescingStats(hits=4, misses=1)
+
+        service.get_config('project-id', 'config-id')
+        assert len(server.paths) == 2
+
+    def test_different_calls_do_not_share(self, service, server):
+        service.enable_coalescing()
+        limits = iter(range(10, 15))
+        _concurrently(lambda: service.list_configs('project-id', limit=next(limits)))
+        assert len(server.paths) == 5
+        assert service.get_coalescing_stats() == CoalescingStats(misses=5)
+
+    def test_writes_are_not_coalesced(self, service, server):
+        service.enable_coalescing()
+        _concurrently(lambda: service.create_config('project-id', {'name': 'config'}), count=2)
+        assert len(server.paths) == 2
+        assert service.get_coalescing_stats() == CoalescingStats()
+
+    def test_disable_coalescing(self, service, server):
+        service.enable_coalescing()
+        service.disable_coalescing()
+        _concurrently(lambda: service.get_config('project-id', 'config-id'), count=2)
+        assert len(server.paths) == 2
+        assert service.get_coalescing_stats() == CoalescingStats()
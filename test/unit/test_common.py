@@ -48,3 +48,41 @@ class TestCommon(unittest.TestCase):
         self.assertIn('arch=', system_info)
         self.assertIn('os=', system_info)
         self.assertIn('python.version=', system_info)
+
+    def test_operation_build_headers(self):
+        """
+        Test the build_headers method of Operation
+        """
+        operation = common.Operation(
+            'example_service', 'V1', 'operation1', 'POST', '/v1/things', content_type='application/json'
+        )
+        headers = operation.build_headers()
+        self.assertIn('project-python-sdk', headers.get('User-Agent'))
+        self.assertEqual(headers.get('content-type'), 'application/json')
+        self.assertEqual(headers.get('Accept'), 'application/json')
+
+        headers['X-Modified'] = 'true'
+        self.assertNotIn('X-Modified', operation.build_headers())
+        with self.assertRaises(TypeError):
+            operation.headers['X-Modified'] = 'true'
+
+        headers = operation.build_headers({'content-type': 'text/plain', 'Accept': 'text/plain', 'X-Custom': 'a'})
+        self.assertEqual(headers.get('content-type'), 'text/plain')
+        self.assertEqual(headers.get('Accept'), 'application/json')
+        self.assertEqual(headers.get('X-Custom'), 'a')
+
+        operation = common.Operation('example_service', 'V1', 'operation2', 'POST', '/v1/things', accept=None)
+        self.assertNotIn('Accept', operation.build_headers())
+        self.assertNotIn('Accept', operation.build_headers({'X-Custom': 'a'}))
+
+    def test_operation_build_url(self):
+        """
+        Test the build_url method of Operation
+        """
+        operation = common.Operation('example_service', 'V1', 'operation1', 'GET', '/v1/things/{thing_id}/parts/{id}')
+        self.assertEqual(operation.path_params, ('thing_id', 'id'))
+        self.assertEqual(operation.build_url(['t1', 'p%2F1']), '/v1/things/t1/parts/p%2F1')
+        self.assertEqual(str(operation), 'GET /v1/things/{thing_id}/parts/{id} (operation1)')
+
+        operation = common.Operation('example_service', 'V1', 'operation2', 'GET', '/v1/things')
+        self.assertEqual(operation.build_url(), '/v1/things')
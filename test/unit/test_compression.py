@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for request and response compression
+"""
+
+import json
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+
+from ibm_project_sdk.compression import CompressionConfig, CompressionStats
+from ibm_project_sdk.project_v1 import ProjectV1
+
+_configs = {'configs': [{'id': 'config-{0}'.format(i), 'definition': {'name': 'x' * 100}} for i in range(50)]}
+
+
+@pytest.fixture(name='service')
+def fixture_service(server):
+    """A service whose requests are answered by the local server."""
+    server.body = lambda request: _configs if request.method == 'GET' else {'id': 'id'}
+    server.compress_responses = True
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(server.url)
+    return service
+
+
+def _received(server):
+    # The Content-Encoding and decoded JSON body of the first request.
+    request = server.requests[0]
+    return request.headers.get('Content-Encoding'), json.loads(request.body)
+
+
+class TestCompressionConfig:
+    """
+    Test Class for CompressionConfig
+    """
+
+    def test_compression_config_value_error(self):
+        with pytest.raises(ValueError):
+            CompressionConfig(threshold=-1)
+        with pytest.raises(ValueError):
+            CompressionConfig(level=0)
+        with pytest.raises(ValueError):
+            CompressionConfig(level=10)
+
+
+class TestCompression:
+    """
+    Test Class for the compression mode of ProjectV1
+    """
+
+    def test_disabled_by_default(self, service, server):
+        service.create_config('project-id', {'name': 'x' * 4096})
+        assert _received(server)[0] is None
+        assert service.get_compression_stats().to_dict() == CompressionStats().to_dict()
+
+    def test_large_request_bodies_are_compressed(self, service, server):
+        service.enable_compression(threshold=1024)
+        definition = {'name': 'config', 'inputs': {'key': 'x' * 4096}}
+        server.statuses = [201]
+        response = service.create_config('project-id', definition)
+        assert response.get_status_code() == 201
+        encoding, body = _received(server)
+        assert encoding == 'gzip'
+        assert body['definition'] == definition
+        stats = service.get_compression_stats()
+        assert stats.requests_compressed == 1
+        assert stats.request_bytes > 4096
+        assert stats.request_bytes_sent < stats.request_bytes
+
+    def test_small_request_bodies_are_not_compressed(self, service, server):
+        service.enable_compression(threshold=1024)
+        service.create_config('project-id', {'name': 'config'})
+        assert _received(server)[0] is None
+        stats = service.get_compression_stats()
+        assert stats.requests_compressed == 0
+        assert stats.request_bytes == stats.request_bytes_sent > 0
+
+    def test_read_responses_are_negotiated(self, service):
+        service.enable_compression()
+        response = service.list_configs('project-id')
+        assert response.get_result() == _configs
+        stats = service.get_compression_stats()
+        assert stats.responses_compressed == 1
+        assert stats.response_bytes == len(json.dumps(_configs))
+        assert stats.response_bytes_received < stats.response_bytes
+        assert stats.bytes_saved == stats.response_bytes - stats.response_bytes_received
+        assert stats.to_dict()['bytes_saved'] == stats.bytes_saved
+
+    def test_response_negotiation_can_be_disabled(self, service):
+        service.enable_compression(compress_responses=False)
+        service.get_config('project-id', 'config-id', headers={'Accept-Encoding': 'identity'})
+        stats = service.get_compression_stats()
+        assert stats.responses_compressed == 0
+        assert stats.response_bytes == stats.response_bytes_received
+
+    def test_caller_hooks_are_kept(self, service):
+        service.enable_compression()
+        seen = []
+        service.get_config('project-id', 'config-id', hooks={'response': lambda r, *args, **kwargs: seen.append(r)})
+        assert len(seen) == 1
+        assert service.get_compression_stats().responses_compressed == 1
+
+    def test_disable_compression(self, service, server):
+        service.enable_compression(threshold=0)
+        service.disable_compression()
+        service.create_config('project-id', {'name': 'config'})
+        assert _received(server)[0] is None
+        assert service.get_compression_stats().request_bytes == 0
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the account crawler
+"""
+
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+import pytest
+
+from ibm_project_sdk.crawler import CrawlRecord, Crawler, CrawlStats
+from ibm_project_sdk.project_v1 import Environment, ProjectConfigResource, ProjectSummary
+
+_reference = {'id': 'id', 'href': 'href', 'definition': {'name': 'name'}, 'crn': 'crn'}
+_version = {'definition': {'environment_id': 'e', 'locator_id': 'l'}, 'state': 'approved', 'version': 1, 'href': 'href'}
+
+
+def _project(project_id):
+    return {
+        'crn': 'crn',
+        'created_at': '2019-01-01T12:00:00.000Z',
+        'cumulative_needs_attention_view': [],
+        'cumulative_needs_attention_view_error': False,
+        'id': project_id,
+        'location': 'us-south',
+        'resource_group_id': 'rg',
+        'state': 'ready',
+        'href': 'href',
+        'definition': {'name': 'name', 'destroy_on_delete': True, 'description': ''},
+    }
+
+
+def _environment(environment_id):
+    return {
+        'id': environment_id,
+        'project': _reference,
+        'created_at': '2019-01-01T12:00:00.000Z',
+        'modified_at': '2019-01-01T12:00:00.000Z',
+        'href': 'href',
+        'definition': {'name': 'name', 'description': ''},
+    }
+
+
+def _config(config_id):
+    return {
+        'id': config_id,
+        'version': 1,
+        'state': 'approved',
+        'created_at': '2019-01-01T12:00:00.000Z',
+        'modified_at': '2019-01-01T12:00:00.000Z',
+        'href': 'href',
+        'definition': {'name': 'name', 'description': ''},
+        'project': _reference,
+    }
+
+
+class _Client:
+    """
+    A stand-in for ProjectV1 serving `projects` projects, each with two
+    environments and `configs` configs of one version and one resource.
+    """
+
+    def __init__(self, projects=3, configs=3, delay=0.0, fail=None):
+        self.projects = projects
+        self.configs = configs
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def _respond(self, call, key, items, limit=None, token=None):
+        with self.lock:
+            self.calls.append(call)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if call == self.fail:
+                raise ApiException(500, message='failed')
+            start = int(token or 0)
+            end = start + limit if limit else len(items)
+            result = {key: items[start:end]}
+            if end < len(items):
+                result['next'] = {'href': 'https://x/v1/projects?limit={0}&token={1}'.format(limit, end)}
+            return DetailedResponse(response=result, status_code=200)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def list_projects(self, *, limit=None, token=None):
+        projects = [_project('p{0}'.format(i)) for i in range(self.projects)]
+        return self._respond(('projects', token), 'projects', projects, limit, token)
+
+    def list_project_environments(self, *, project_id, limit=None, token=None):
+        environments = [_environment('{0}-e{1}'.format(project_id, i)) for i in range(2)]
+        return self._respond(('environments', project_id, token), 'environments', environments, limit, token)
+
+    def list_configs(self, *, project_id, limit=None, token=None):
+        configs = [_config('{0}-c{1}'.format(project_id, i)) for i in range(self.configs)]
+        return self._respond(('configs', project_id, token), 'configs', configs, limit, token)
+
+    def list_config_versions(self, *, project_id, id):  # pylint: disable=redefined-builtin
+        return self._respond(('versions', project_id, id), 'versions', [_version])
+
+    def list_config_resources(self, *, project_id, id):  # pylint: disable=redefined-builtin
+        resource = {'resource_crn': '{0}-r'.format(id)}
+        return self._respond(('resources', project_id, id), 'resources', [resource])
+
+
+class TestCrawler:
+    """
+    Test Class for Crawler
+    """
+
+    def test_crawl(self):
+        client = _Client(projects=3, configs=3)
+        crawler = Crawler(client, limit=2)
+        records = list(crawler.crawl())
+        kinds = [record.kind for record in records]
+        assert {kind: kinds.count(kind) for kind in set(kinds)} == {
+            'projects': 3,
+            'environments': 6,
+            'configs': 9,
+            'versions': 9,
+            'resources': 9,
+        }
+        # 2 pages of projects, 1 of environments and 2 of configs per project,
+        # and 2 requests per config.
+        assert len(client.calls) == 2 + 3 * 3 + 9 * 2
+        assert crawler.get_stats() == CrawlStats(
+            requests=29, projects=3, environments=6, configs=9, versions=9, resources=9
+        )
+        project = next(record for record in records if record.kind == 'projects' and record.project_id == 'p0')
+        assert project == CrawlRecord('projects', ProjectSummary.from_dict(_project('p0')), project_id='p0')
+        environment = next(record for record in records if record.kind == 'environments')
+        assert isinstance(environment.resource, Environment)
+        resource = next(record for record in records if record.kind == 'resources' and record.config_id == 'p1-c2')
+        assert resource.project_id == 'p1'
+        assert resource.resource == ProjectConfigResource(resource_crn='p1-c2-r')
+        assert resource.to_dict() == {
+            'kind': 'resources',
+            'resource': {'resource_crn': 'p1-c2-r'},
+            'project_id': 'p1',
+            'config_id': 'p1-c2',
+        }
+
+    def test_concurrency_is_bounded(self):
+        client = _Client(projects=4, configs=4, delay=0.02)
+        assert len(list(Crawler(client, max_workers=4).crawl())) == 4 * (1 + 2 + 4 * 3)
+        assert len(client.calls) == 1 + 4 * 2 + 16 * 2
+        assert client.max_in_flight == 4
+
+    def test_kinds(self):
+        client = _Client()
+        records = list(Crawler(client, kinds=['versions']).crawl())
+        assert {record.kind for record in records} == {'versions'}
+        assert len(records) == 9
+        assert {call[0] for call in client.calls} == {'projects', 'configs', 'versions'}
+        with pytest.raises(ValueError):
+            Crawler(client, kinds=['unknown'])
+
+    def test_errors(self):
+        client = _Client(fail=('configs', 'p1', None))
+        with pytest.raises(ApiException):
+            list(Crawler(client).crawl())
+
+        progress = []
+        crawler = Crawler(client, ignore_errors=True, on_progress=progress.append)
+        records = list(crawler.crawl())
+        assert not [record for record in records if record.project_id == 'p1' and record.kind == 'configs']
+        stats = crawler.get_stats()
+        assert stats.errors == 1
+        assert stats.configs == 6
+        assert len(progress) == stats.requests
+        assert progress[-1] == stats
+
+    def test_early_exit(self):
+        client = _Client(projects=10, delay=0.01)
+        crawler = Crawler(client, max_workers=2)
+        for _ in crawler.crawl():
+            break
+        time.sleep(0.1)
+        sent = len(client.calls)
+        time.sleep(0.1)
+        assert len(client.calls) == sent < 10
+        # The crawler can be reused once the previous crawl is closed.
+        crawler.client = _Client(projects=1)
+        assert len(list(crawler.crawl())) == 1 + 2 + 3 * 3
+
+    def test_crawls_are_independent(self):
+        client = _Client(projects=3, configs=1, delay=0.05)
+        crawler = Crawler(client, max_workers=4, limit=1, kinds=['projects', 'environments'])
+        for _ in crawler.crawl():
+            break
+        # The workers of the closed crawl are still running while the next one starts.
+        records = list(crawler.crawl())
+        keys = [(record.kind, record.resource.id) for record in records]
+        assert sorted(keys) == sorted(set(keys))
+        assert len(keys) == 3 + 3 * 2
+        assert crawler.get_stats().pending == 0
+        assert crawler.get_stats().projects == 3
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for hedged requests
+"""
+
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.hedging import HedgingPolicy, HedgingStats, LatencyHistogram
+from ibm_project_sdk.project_v1 import _OPERATIONS, ProjectV1
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+_config_url = _base_url + '/v1/projects/project-id/configs/config-id'
+
+
+class _Server:
+    """
+    Serves configs, after the delay at the head of `delays` for each request;
+    later requests are not delayed. The ID of a config is its delay.
+    """
+
+    def __init__(self):
+        self.delays = []
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.requests += 1
+            delay = self.delays.pop(0) if self.delays else 0
+        time.sleep(delay)
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'id': str(delay)}))
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    """A _Server answering the requests of the service."""
+    server = _Server()
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(responses.GET, _config_url, callback=server)
+        yield server
+
+
+@pytest.fixture(name='service')
+def fixture_service(server):  # pylint: disable=unused-argument
+    """A service whose requests are answered by the server."""
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestLatencyHistogram:
+    """
+    Test Class for LatencyHistogram
+    """
+
+    def test_percentile(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(50) is None
+        for _ in range(90):
+            histogram.record(0.010)
+        for _ in range(10):
+            histogram.record(1.0)
+        assert 0.010 <= histogram.percentile(50) < 0.012
+        assert 0.010 <= histogram.percentile(90) < 0.012
+        assert 1.0 <= histogram.percentile(99) < 1.2
+        assert histogram.samples == 100
+
+    def test_decay(self):
+        histogram = LatencyHistogram(decay_interval=10)
+        for _ in range(10):
+            histogram.record(1.0)
+        for _ in range(10):
+            histogram.record(0.010)
+        # The older samples weigh half as much as the newer ones.
+        assert histogram.percentile(60) < 0.012
+
+
+class TestHedgingPolicy:
+    """
+    Test Class for HedgingPolicy
+    """
+
+    def test_hedging_policy_value_error(self):
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=100)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_extra_load=0)
+        with pytest.raises(ValueError):
+            HedgingPolicy(max_workers=0)
+
+    def test_is_hedged_operation(self):
+        policy = HedgingPolicy(operations=['get_config', 'create_config'])
+        assert policy.is_hedged_operation(_OPERATIONS['get_config'])
+        assert not policy.is_hedged_operation(_OPERATIONS['get_project'])
+        assert not policy.is_hedged_operation(_OPERATIONS['create_config'])
+        assert HedgingPolicy().is_hedged_operation(_OPERATIONS['get_project'])
+
+    def test_delay_follows_latency(self):
+        policy = HedgingPolicy(percentile=90, min_samples=10, initial_delay=0.5)
+        assert policy.get_delay('get_config') == 0.5
+        for _ in range(10):
+            policy.get_histogram('get_config').record(0.020)
+        assert 0.020 <= policy.get_delay('get_config') < 0.025
+
+    def test_first_error_waits_for_hedge(self):
+        policy = HedgingPolicy(initial_delay=0.01, max_extra_load=1.0)
+        calls = []
+
+        def send():
+            calls.append(None)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise ValueError('first')
+            return 'second'
+
+        assert policy.execute(_OPERATIONS['get_config'], send) == 'second'
+        policy.close()
+
+
+class TestHedging:
+    """
+    Test Class for the hedging mode of ProjectV1
+    """
+
+    def test_slow_call_is_hedged(self, service, server):
+        policy = HedgingPolicy(initial_delay=0.05, max_extra_load=1.0)
+        service.set_hedging_policy(policy)
+        server.delays = [2.0]
+        start = time.monotonic()
+        response = service.get_config('project-id', 'config-id')
+        assert time.monotonic() - start < 1.0
+        assert response.get_result() == {'id': '0'}
+        assert server.requests == 2
+        assert service.get_hedging_stats() == HedgingStats(requests=1, hedged=1, hedge_wins=1)
+        policy.close()
+
+    def test_fast_call_is_not_hedged(self, service, server):
+        policy = HedgingPolicy(initial_delay=1.0, max_extra_load=1.0)
+        service.set_hedging_policy(policy)
+        service.get_config('project-id', 'config-id')
+        assert server.requests == 1
+        assert service.get_hedging_stats() == HedgingStats(requests=1)
+        policy.close()
+
+    def test_first_requests_do_not_wait_for_workers(self, service, server):
+        # More concurrent calls than workers: the first requests must not queue
+        # behind each other and be hedged for it.
+        policy = HedgingPolicy(initial_delay=0.1, max_extra_load=1.0, max_workers=1)
+        service.set_hedging_policy(policy)
+        server.delays = [0.05] * 8
+        threads = [threading.Thread(target=service.get_config, args=('project-id', 'config-id')) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server.requests == 8
+        assert service.get_hedging_stats() == HedgingStats(requests=8)
+        policy.close()
+
+    def test_extra_load_is_capped(self, service, server):
+        policy = HedgingPolicy(initial_delay=0.01, max_extra_load=0.5)
+        service.set_hedging_policy(policy)
+        server.delays = [0.1, 0.1]
+        service.get_config('project-id', 'config-id')
+        service.get_config('project-id', 'config-id')
+        assert service.get_hedging_stats() == HedgingStats(requests=2, hedged=1, hedge_wins=1, throttled=1)
+        policy.close()
+
+    def test_hedging_disabled(self, service):
+        assert service.get_hedging_policy() is None
+        assert service.get_hedging_stats() == HedgingStats()
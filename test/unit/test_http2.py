@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the HTTP/2 transport adapter
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import json
+import socket
+import threading
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+
+from ibm_project_sdk.pool import PooledHTTPAdapter
+from ibm_project_sdk.project_v1 import ProjectV1
+
+h2_config = pytest.importorskip('h2.config')
+h2_connection = pytest.importorskip('h2.connection')
+h2_events = pytest.importorskip('h2.events')
+http2 = pytest.importorskip('ibm_project_sdk.http2')
+pytest.importorskip('httpx')
+
+
+class _H2Server:
+    """
+    A minimal cleartext HTTP/2 server answering every request with a JSON body
+    echoing its method, path, headers and body.
+    """
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        self.connections = 0
+        self.requests = []
+        self.status = 200
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        h2 = h2_connection.H2Connection(config=h2_config.H2Configuration(client_side=False))
+        h2.initiate_connection()
+        conn.sendall(h2.data_to_send())
+        streams = {}
+        with conn:
+            while True:
+                data = conn.recv(65535)
+                if not data:
+                    return
+                for event in h2.receive_data(data):
+                    if isinstance(event, h2_events.RequestReceived):
+                        streams[event.stream_id] = [dict((k.decode(), v.decode()) for k, v in event.headers), b'']
+                    elif isinstance(event, h2_events.DataReceived):
+                        streams[event.stream_id][1] += event.data
+                        h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, h2_events.StreamEnded):
+                        self._respond(h2, event.stream_id, *streams.pop(event.stream_id))
+                conn.sendall(h2.data_to_send())
+
+    def _respond(self, h2, stream_id, headers, body):
+        self.requests.append(headers)
+        body = json.dumps(
+            {
+                'method': headers[':method'],
+                'path': headers[':path'],
+                'headers': headers,
+                'body': body.decode('utf-8'),
+            }
+        ).encode('utf-8')
+        response_headers = [(':status', str(self.status)), ('content-type', 'application/json')]
+        if 'gzip' in headers.get('accept-encoding', ''):
+            body = gzip.compress(body)
+            response_headers.append(('content-encoding', 'gzip'))
+        response_headers.append(('content-length', str(len(body))))
+        h2.send_headers(stream_id, response_headers)
+        h2.send_data(stream_id, body, end_stream=True)
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    server = _H2Server()
+    yield server
+    server.close()
+
+
+@pytest.fixture(name='service')
+def fixture_service(server):
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.port))
+    service.set_transport_adapter(http2.HTTP2Adapter(http1=False))
+    yield service
+    service.http_adapter.close()
+
+
+class TestHTTP2Adapter:
+    """
+    Test Class for HTTP2Adapter
+    """
+
+    def test_requests_are_multiplexed(self, server, service):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda i: service.get_config('project-id', 'config-{0}'.format(i)), range(32))
+            )
+        assert [response.get_result()['path'] for response in responses] == [
+            '/v1/projects/project-id/configs/config-{0}'.format(i) for i in range(32)
+        ]
+        assert server.connections == 1
+
+    def test_request_building_is_unchanged(self, server, service):
+        response = service.create_config('project-id', {'name': 'config'}, headers={'X-Test': 'value'})
+        result = response.get_result()
+        assert result['method'] == 'POST'
+        assert json.loads(result['body']) == {'definition': {'name': 'config'}}
+        assert result['headers']['x-test'] == 'value'
+        assert result['headers']['content-type'] == 'application/json'
+        assert 'connection' not in result['headers']
+        assert service.list_configs('project-id', limit=10).get_result()['path'] == (
+            '/v1/projects/project-id/configs?limit=10'
+        )
+
+    def test_compressed_and_streamed_responses(self, server, service):
+        service.enable_compression()
+        assert service.get_config('project-id', 'config-id').get_result()['method'] == 'GET'
+        stats = service.get_compression_stats()
+        assert stats.responses_compressed == 1
+        assert stats.response_bytes_received < stats.response_bytes
+
+        response = service.get_config('project-id', 'config-id', stream=True).get_result()
+        assert isinstance(response, requests.Response)
+        assert response.raw.http_version == 'HTTP/2'
+        assert json.loads(b''.join(response.iter_content(16)))['method'] == 'GET'
+
+    def test_error_statuses(self, server, service):
+        server.status = 404
+        with pytest.raises(ApiException) as error:
+            service.get_config('project-id', 'config-id')
+        assert error.value.status_code == 404
+
+    def test_connection_errors(self, server, service):
+        server.close()
+        service.set_service_url('http://127.0.0.1:1')
+        with pytest.raises(requests.exceptions.ConnectionError):
+            service.get_config('project-id', 'config-id')
+
+    def test_transport_adapter_survives_remounts(self, service):
+        adapter = service.http_adapter
+        service.set_disable_ssl_verification(True)
+        assert service.http_adapter is adapter
+        service.set_transport_adapter(None)
+        assert isinstance(service.http_adapter, PooledHTTPAdapter)
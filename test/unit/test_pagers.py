@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the pagers
+"""
+
+import io
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.pagers import AdaptiveLimit, AdaptiveLimitStats, ExportStats, Pager, PagerCheckpoint
+from ibm_project_sdk.project_v1 import (
+    ConfigResourcesPager,
+    ConfigsPager,
+    ConfigVersionsPager,
+    ProjectEnvironmentsPager,
+    ProjectsPager,
+    ProjectSummary,
+    ProjectV1,
+)
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+
+
+class _Client:
+    """
+    A stand-in for ProjectV1 serving `pages` pages of two resources.
+    """
+
+    def __init__(self, pages=3, delay=0.0, fail_at=None):
+        self.pages = pages
+        self.delay = delay
+        self.fail_at = fail_at
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _list(self, key, token, limit, project_id=None):
+        with self.lock:
+            self.calls.append((project_id, limit, token))
+        time.sleep(self.delay)
+        page = int(token or 0)
+        if page == self.fail_at:
+            raise ApiException(500, message='failed')
+        result = {key: [{'id': '{0}-{1}'.format(page, i)} for i in range(2)]}
+        if page + 1 < self.pages:
+            result['next'] = {'href': 'https://x/v1/projects?limit={0}&token={1}'.format(limit, page + 1)}
+        return DetailedResponse(response=result, status_code=200)
+
+    def list_projects(self, *, limit=None, token=None):
+        return self._list('projects', token, limit)
+
+    def list_project_environments(self, *, project_id, limit=None, token=None):
+        return self._list('environments', token, limit, project_id)
+
+    def list_configs(self, *, project_id, limit=None, token=None):
+        return self._list('configs', token, limit, project_id)
+
+
+def _ids(pages):
+    return ['{0}-{1}'.format(page, i) for page in range(pages) for i in range(2)]
+
+
+class TestPager:
+    """
+    Test Class for Pager
+    """
+
+    @pytest.mark.parametrize('prefetch', [0, 1, 3])
+    def test_iteration(self, prefetch):
+        client = _Client(pages=4)
+        pager = ConfigsPager(client=client, project_id='p', limit=2, prefetch=prefetch)
+        assert [config['id'] for config in pager] == _ids(4)
+        assert not pager.has_next()
+        assert client.calls == [('p', 2, None), ('p', 2, '1'), ('p', 2, '2'), ('p', 2, '3')]
+        with pytest.raises(StopIteration):
+            pager.get_next()
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_get_next_and_get_all(self, prefetch):
+        pager = ProjectsPager(client=_Client(pages=3), limit=2, prefetch=prefetch)
+        assert [project['id'] for project in pager.get_next()] == _ids(1)
+        assert [project['id'] for project in pager.get_all()] == _ids(3)[2:]
+        environments = ProjectEnvironmentsPager(client=_Client(pages=1), project_id='p', prefetch=prefetch)
+        assert len(environments.get_all()) == 2
+
+    def test_prefetch_overlaps_processing(self):
+        client = _Client(pages=3, delay=0.05)
+        requested = []
+        for config in ConfigsPager(client=client, project_id='p', prefetch=1):
+            if config['id'] == '0-0':
+                deadline = time.monotonic() + 1
+                while len(client.calls) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                requested.append(len(client.calls))
+        # The second page was requested while the first one was being processed.
+        assert requested == [2]
+
+    def test_prefetch_is_bounded(self):
+        client = _Client(pages=10)
+        with ConfigsPager(client=client, project_id='p', prefetch=2) as pager:
+            pager.get_next()
+            deadline = time.monotonic() + 1
+            while len(client.calls) < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            # Two pages are queued and the prefetch thread waits with a third one.
+            assert len(client.calls) == 4
+        pager._thread.join(1)  # pylint: disable=protected-access
+        assert not pager._thread.is_alive()  # pylint: disable=protected-access
+        assert len(client.calls) == 4
+        assert list(pager) == []
+
+    def test_prefetch_errors(self):
+        pager = ConfigsPager(client=_Client(pages=3, fail_at=1), project_id='p', prefetch=2)
+        assert len(pager.get_next()) == 2
+        with pytest.raises(ApiException):
+            pager.get_next()
+        assert not pager.has_next()
+
+    def test_invalid_prefetch(self):
+        with pytest.raises(ValueError):
+            Pager(prefetch=-1)
+
+
+class TestPagerExport:
+    """
+    Test Class for the streaming export of pagers
+    """
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_iter_all(self, prefetch):
+        pager = ConfigsPager(client=_Client(pages=3), project_id='p', prefetch=prefetch)
+        items = pager.iter_all()
+        assert next(items)['id'] == '0-0'
+        items.close()
+        assert not pager.has_next()
+        assert [item['id'] for item in ProjectsPager(client=_Client(pages=3)).iter_all()] == _ids(3)
+
+    def test_write_ndjson(self):
+        fp = io.StringIO()
+        stats = ProjectsPager(client=_Client(pages=3), prefetch=1).write_ndjson(fp)
+        lines = fp.getvalue().splitlines()
+        assert [json.loads(line)['id'] for line in lines] == _ids(3)
+        assert stats == ExportStats(items=6, bytes_written=len(fp.getvalue()))
+
+    def test_write_json_array(self):
+        fp = io.BytesIO()
+        stats = ConfigsPager(client=_Client(pages=2), project_id='p').write_json_array(fp)
+        assert [item['id'] for item in json.loads(fp.getvalue())] == _ids(2)
+        assert stats.to_dict() == {'items': 4, 'bytes_written': len(fp.getvalue())}
+
+        fp = io.BytesIO()
+        client = _Client(pages=1)
+        client.list_configs = lambda **kwargs: DetailedResponse(response={'configs': []}, status_code=200)
+        assert ConfigsPager(client=client, project_id='p').write_json_array(fp) == ExportStats(bytes_written=2)
+        assert json.loads(fp.getvalue()) == []
+
+
+class TestStreamingPager:
+    """
+    Test Class for ConfigVersionsPager and ConfigResourcesPager
+    """
+
+    @pytest.fixture(name='service')
+    def fixture_service(self):
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        return service
+
+    def _add_versions(self, count):
+        versions = [{'version': i, 'state': 'approved', 'href': 'href'} for i in range(count)]
+        responses.add(
+            responses.GET, _base_url + '/v1/projects/p/configs/c/versions', json={'versions': versions}, status=200
+        )
+
+    @responses.activate
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_pages(self, service, prefetch):
+        self._add_versions(5)
+        pager = ConfigVersionsPager(client=service, project_id='p', id='c', page_size=2, prefetch=prefetch)
+        assert [version['version'] for version in pager.get_next()] == [0, 1]
+        assert pager.has_next()
+        assert [[version['version'] for version in page] for page in (pager.get_next(), pager.get_next())] == [
+            [2, 3],
+            [4],
+        ]
+        assert not pager.has_next()
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_exact_pages_and_export(self, service):
+        self._add_versions(4)
+        pager = ConfigVersionsPager(client=service, project_id='p', id='c', page_size=2)
+        assert [len(pager.get_next()), len(pager.get_next())] == [2, 2]
+        assert not pager.has_next()
+
+        body = {'resources': [{'resource_crn': 'crn-{0}'.format(i)} for i in range(3)], 'resources_count': 3}
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/c/resources', json=body, status=200)
+        fp = io.StringIO()
+        stats = ConfigResourcesPager(client=service, project_id='p', id='c', prefetch=1).write_ndjson(fp)
+        assert stats.items == 3
+        assert [json.loads(line)['resource_crn'] for line in fp.getvalue().splitlines()] == ['crn-0', 'crn-1', 'crn-2']
+
+    @responses.activate
+    def test_close_releases_the_response(self, service):
+        self._add_versions(10)
+        with ConfigVersionsPager(client=service, project_id='p', id='c', page_size=3) as pager:
+            assert next(pager)['version'] == 0
+            collection = pager._collection  # pylint: disable=protected-access
+        assert pager._collection is None  # pylint: disable=protected-access
+        assert collection.response.raw.closed
+        assert list(pager) == []
+
+    @responses.activate
+    def test_errors(self, service):
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/c/resources', status=404, json={})
+        with pytest.raises(ApiException):
+            ConfigResourcesPager(client=service, project_id='p', id='c', prefetch=1).get_all()
+        with pytest.raises(ValueError):
+            ConfigResourcesPager(client=service, project_id='p', id='c', page_size=0)
+
+
+class TestPagerCheckpoint:
+    """
+    Test Class for PagerCheckpoint and resumable pagers
+    """
+
+    def test_serialization(self):
+        checkpoint = PagerCheckpoint(token='abc', limit=10, offset=3)
+        assert PagerCheckpoint.from_dict(json.loads(json.dumps(checkpoint.to_dict()))) == checkpoint
+        assert json.loads(str(checkpoint)) == {'token': 'abc', 'limit': 10, 'offset': 3, 'done': False}
+        assert PagerCheckpoint.from_dict({}) == PagerCheckpoint()
+        assert checkpoint != PagerCheckpoint()
+        with pytest.raises(ValueError):
+            PagerCheckpoint(offset=-1)
+
+    @pytest.mark.parametrize('prefetch', [0, 2])
+    def test_resume_iteration(self, prefetch):
+        pager = ConfigsPager(client=_Client(pages=4), project_id='p', limit=2, prefetch=prefetch)
+        assert pager.get_checkpoint() == PagerCheckpoint(limit=2)
+        consumed = [next(pager)['id'] for _ in range(3)]
+        checkpoint = pager.get_checkpoint()
+        pager.close()
+        assert checkpoint == PagerCheckpoint(token='1', limit=2, offset=1)
+
+        client = _Client(pages=4)
+        resumed = ConfigsPager(client=client, project_id='p', checkpoint=checkpoint, prefetch=prefetch)
+        assert consumed + [config['id'] for config in resumed] == _ids(4)
+        assert client.calls[0] == ('p', 2, '1')
+        assert resumed.get_checkpoint() == PagerCheckpoint(limit=2, done=True)
+        assert list(ConfigsPager(client=client, project_id='p', checkpoint=resumed.get_checkpoint())) == []
+
+    def test_resume_pages(self):
+        pager = ProjectsPager(client=_Client(pages=3), limit=2)
+        pager.get_next()
+        assert pager.get_checkpoint() == PagerCheckpoint(token='1', limit=2)
+        next(pager)
+        next(pager)
+        assert pager.get_checkpoint() == PagerCheckpoint(token='2', limit=2)
+        resumed = ProjectsPager(
+            client=_Client(pages=3), checkpoint=PagerCheckpoint.from_dict({'token': '1', 'offset': 2})
+        )
+        assert [project['id'] for project in resumed.get_all()] == _ids(3)[4:]
+
+    @responses.activate
+    def test_resume_streaming_pager(self):
+        versions = [{'version': i, 'state': 'approved', 'href': 'href'} for i in range(5)]
+        responses.add(
+            responses.GET, _base_url + '/v1/projects/p/configs/c/versions', json={'versions': versions}, status=200
+        )
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        pager = ConfigVersionsPager(client=service, project_id='p', id='c', page_size=2)
+        assert [next(pager)['version'] for _ in range(3)] == [0, 1, 2]
+        assert pager.get_checkpoint() == PagerCheckpoint(offset=3)
+        pager.close()
+
+        resumed = ConfigVersionsPager(client=service, project_id='p', id='c', checkpoint=pager.get_checkpoint())
+        assert [version['version'] for version in resumed] == [3, 4]
+        assert resumed.get_checkpoint() == PagerCheckpoint(offset=5, done=True)
+
+
+class _SizedClient:
+    """
+    A stand-in for ProjectV1 serving `total` configs, pages of which take
+    `item_latency` seconds and `item_bytes` bytes per config.
+    """
+
+    def __init__(self, total, item_latency=0.0, item_bytes=100):
+        self.total = total
+        self.item_latency = item_latency
+        self.item_bytes = item_bytes
+        self.limits = []
+
+    def list_configs(self, *, project_id, limit=None, token=None):
+        self.limits.append(limit)
+        start = int(token or 0)
+        end = min(start + limit, self.total)
+        time.sleep(self.item_latency * (end - start))
+        result = {'configs': [{'id': str(i)} for i in range(start, end)]}
+        if end < self.total:
+            result['next'] = {'href': 'https://x/v1/projects/p/configs?limit={0}&token={1}'.format(limit, end)}
+        headers = {'Content-Length': str(self.item_bytes * (end - start))}
+        return DetailedResponse(response=result, headers=headers, status_code=200)
+
+
+class TestAdaptiveLimit:
+    """
+    Test Class for AdaptiveLimit
+    """
+
+    def test_limit_follows_the_byte_budget(self):
+        adaptive_limit = AdaptiveLimit(target_latency=None, target_bytes=4000, initial_limit=5)
+        adaptive_limit.record(5, 5, 0.1, 500)
+        # 40 resources would fit, but the limit at most doubles.
+        assert adaptive_limit.next_limit() == 10
+        adaptive_limit.record(10, 10, 0.1, 1000)
+        assert adaptive_limit.next_limit() == 20
+        adaptive_limit.record(20, 20, 0.1, 20000)
+        # Pages got bigger: the limit shrinks at once.
+        assert adaptive_limit.next_limit() < 20
+
+    def test_limit_follows_the_latency_budget(self):
+        adaptive_limit = AdaptiveLimit(target_latency=0.5, target_bytes=None, initial_limit=50)
+        adaptive_limit.record(50, 50, 1.0, 0)
+        assert adaptive_limit.next_limit() == 25
+        adaptive_limit.record(25, 0, 0.1, 0)
+        assert adaptive_limit.next_limit() == 25
+
+    def test_bounds(self):
+        adaptive_limit = AdaptiveLimit(initial_limit=500, min_limit=5, max_limit=50)
+        assert adaptive_limit.next_limit() == 50
+        adaptive_limit.record(50, 50, 100.0, 10)
+        assert adaptive_limit.next_limit() == 5
+        with pytest.raises(ValueError):
+            AdaptiveLimit(max_limit=1000)
+        with pytest.raises(ValueError):
+            AdaptiveLimit(target_latency=0)
+
+    def test_pager_instrumentation(self):
+        pages = []
+        adaptive_limit = AdaptiveLimit(
+            target_latency=None,
+            target_bytes=2000,
+            initial_limit=2,
+            on_page=lambda *args: pages.append(args),
+        )
+        client = _SizedClient(total=100, item_bytes=100)
+        pager = ConfigsPager(client=client, project_id='p', limit=50, adaptive_limit=adaptive_limit)
+        assert [config['id'] for config in pager] == [str(i) for i in range(100)]
+        assert client.limits[:5] == [2, 4, 8, 16, 20]
+        assert set(client.limits[4:-1]) == {20}
+        assert [page[0] for page in pages] == client.limits
+        stats = adaptive_limit.get_stats()
+        assert stats.pages == len(client.limits)
+        assert stats.items == 100
+        assert stats.bytes_received == 10000
+        assert stats.limit == 20
+        assert stats.limits[20] == len(client.limits) - 4
+        assert isinstance(stats, AdaptiveLimitStats)
+        assert pager.get_checkpoint().done
+
+    def test_checkpoint_with_prefetch(self):
+        client = _SizedClient(total=100, item_bytes=100)
+        adaptive_limit = AdaptiveLimit(target_latency=None, target_bytes=2000, initial_limit=2)
+        with ConfigsPager(client=client, project_id='p', prefetch=3, adaptive_limit=adaptive_limit) as pager:
+            assert [next(pager)['id'] for _ in range(3)] == ['0', '1', '2']
+            # Let the prefetch thread request the next pages with larger limits.
+            time.sleep(0.1)
+            assert client.limits[:4] == [2, 4, 8, 16]
+            checkpoint = pager.get_checkpoint()
+        assert checkpoint == PagerCheckpoint(token='2', limit=4, offset=1)
+
+        client = _SizedClient(total=100, item_bytes=100)
+        adaptive_limit = AdaptiveLimit(target_latency=None, target_bytes=2000, initial_limit=2)
+        pager = ConfigsPager(client=client, project_id='p', checkpoint=checkpoint, adaptive_limit=adaptive_limit)
+        assert [config['id'] for config in pager] == [str(i) for i in range(3, 100)]
+        assert client.limits[0] == 4
+
+
+class _Model:
+    """
+    A model recording the threads its instances were created on.
+    """
+
+    threads = set()
+
+    def __init__(self, id):  # pylint: disable=redefined-builtin
+        self.id = id
+
+    @classmethod
+    def from_dict(cls, _dict):
+        if _dict['id'] == 'bad':
+            raise ValueError('bad')
+        cls.threads.add(threading.current_thread().name)
+        return cls(_dict['id'])
+
+    def to_dict(self):
+        return {'id': self.id}
+
+
+class TestTypedPager:
+    """
+    Test Class for pagers returning models
+    """
+
+    @pytest.mark.parametrize('prefetch', [0, 3])
+    def test_typed(self, prefetch):
+        project = {
+            'crn': 'crn',
+            'created_at': '2019-01-01T12:00:00.000Z',
+            'cumulative_needs_attention_view': [],
+            'cumulative_needs_attention_view_error': False,
+            'id': 'id',
+            'location': 'us-south',
+            'resource_group_id': 'rg',
+            'state': 'ready',
+            'href': 'href',
+            'definition': {'name': 'name', 'destroy_on_delete': True, 'description': ''},
+        }
+        client = _Client(pages=1)
+        client.list_projects = lambda **kwargs: DetailedResponse(response={'projects': [project]}, status_code=200)
+        projects = ProjectsPager(client=client, typed=True, prefetch=prefetch).get_all()
+        assert projects == [ProjectSummary.from_dict(project)]
+
+    def test_decoded_in_order_on_workers(self):
+        _Model.threads = set()
+        pager = ConfigsPager(client=_Client(pages=20), project_id='p', prefetch=4, decode_workers=3)
+        pager._model = _Model  # pylint: disable=protected-access
+        assert [config.id for config in pager] == _ids(20)
+        assert _Model.threads and all(name.startswith('ibm-project-decode') for name in _Model.threads)
+
+    def test_decode_errors(self):
+        client = _Client(pages=3)
+        original = client.list_configs
+
+        def list_configs(**kwargs):
+            response = original(**kwargs)
+            if kwargs['token'] == '1':
+                response.get_result()['configs'][0]['id'] = 'bad'
+            return response
+
+        client.list_configs = list_configs
+        pager = ConfigsPager(client=client, project_id='p', prefetch=2)
+        pager._model = _Model  # pylint: disable=protected-access
+        assert len(pager.get_next()) == 2
+        with pytest.raises(ValueError):
+            pager.get_next()
+        assert not pager.has_next()
+
+    def test_export(self):
+        pager = ConfigsPager(client=_Client(pages=2), project_id='p', typed=True, prefetch=1)
+        pager._model = _Model  # pylint: disable=protected-access
+        fp = io.StringIO()
+        assert pager.write_ndjson(fp) == ExportStats(items=4, bytes_written=len(fp.getvalue()))
+        assert [json.loads(line)['id'] for line in fp.getvalue().splitlines()] == _ids(2)
+
+    def test_close_while_prefetching(self):
+        errors = []
+        excepthook = threading.excepthook
+        threading.excepthook = errors.append
+        try:
+            pager = ConfigsPager(client=_Client(pages=5, delay=0.05), project_id='p', typed=True, prefetch=1)
+            pager._model = _Model  # pylint: disable=protected-access
+            items = pager.iter_all()
+            assert next(items).id == '0-0'
+            items.close()
+            pager._thread.join(1)  # pylint: disable=protected-access
+        finally:
+            threading.excepthook = excepthook
+        assert not pager._thread.is_alive()  # pylint: disable=protected-access
+        assert not errors
+
+    def test_invalid_decode_workers(self):
+        with pytest.raises(ValueError):
+            ConfigsPager(client=_Client(), project_id='p', typed=True, decode_workers=0)
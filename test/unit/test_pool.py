@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the connection pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+
+from ibm_project_sdk.pool import PoolConfig, PooledHTTPAdapter, PoolStats
+from ibm_project_sdk.project_v1 import ProjectV1
+
+
+def _new_service(server, **kwargs):
+    service = ProjectV1(authenticator=NoAuthAuthenticator(), **kwargs)
+    service.set_service_url(server.url)
+    return service
+
+
+class TestPoolConfig:
+    """
+    Test Class for PoolConfig
+    """
+
+    def test_pool_config_defaults(self):
+        pool_config = PoolConfig()
+        assert pool_config.max_connections_per_host == 10
+        assert pool_config.block is False
+        assert 'max_connections_per_host=10' in str(pool_config)
+
+    def test_pool_config_value_error(self):
+        with pytest.raises(ValueError):
+            PoolConfig(max_connections_per_host=0)
+        with pytest.raises(ValueError):
+            PoolConfig(max_hosts=0)
+        with pytest.raises(ValueError):
+            PoolConfig(max_idle=-1)
+        with pytest.raises(ValueError):
+            PoolConfig(idle_timeout=0)
+
+
+class TestPooledService:
+    """
+    Test Class for the pooled HTTP adapter of ProjectV1
+    """
+
+    def test_adapter_is_mounted(self):
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        assert isinstance(service.http_adapter, PooledHTTPAdapter)
+        assert service.get_http_client().get_adapter('https://example.com') is service.http_adapter
+        assert service.get_pool_stats() == PoolStats()
+
+    def test_adapter_survives_reconfiguration(self):
+        pool_config = PoolConfig(max_connections_per_host=3)
+        service = ProjectV1(authenticator=NoAuthAuthenticator(), pool_config=pool_config)
+        service.enable_retries(max_retries=2)
+        assert isinstance(service.http_adapter, PooledHTTPAdapter)
+        assert service.http_adapter.max_retries.total == 2
+        assert service.http_adapter.pool_config is pool_config
+        service.disable_retries()
+        assert isinstance(service.http_adapter, PooledHTTPAdapter)
+        assert service.http_adapter.max_retries.total == 0
+        service.set_disable_ssl_verification(True)
+        assert isinstance(service.http_adapter, PooledHTTPAdapter)
+        service.set_pool_config(PoolConfig(max_connections_per_host=5))
+        assert service.http_adapter.pool_config.max_connections_per_host == 5
+        with pytest.raises(ValueError):
+            service.set_pool_config(None)
+
+    def test_connections_are_reused(self, server):
+        service = _new_service(server)
+        for _ in range(5):
+            assert service.get_project('id').get_status_code() == 200
+        stats = service.get_pool_stats()
+        assert stats.requests == 5
+        assert stats.opened == 1
+        assert stats.reused == 4
+        assert stats.active == 0
+        assert stats.idle == 1
+
+    def test_idle_timeout_expires_connections(self, server):
+        service = _new_service(server, pool_config=PoolConfig(idle_timeout=0.05))
+        service.get_project('id')
+        time.sleep(0.1)
+        service.get_project('id')
+        stats = service.get_pool_stats()
+        assert stats.expired == 1
+        assert stats.opened == 2
+        assert stats.reused == 0
+
+    def test_max_idle_closes_extra_connections(self, server):
+        server.delay = 0.1
+        service = _new_service(server, pool_config=PoolConfig(max_connections_per_host=4, max_idle=1))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: service.get_project('id'), range(4)))
+        stats = service.get_pool_stats()
+        assert stats.opened == 4
+        assert stats.idle == 1
+        assert stats.active == 0
+
+    def test_block_on_exhaustion_counts_waits(self, server):
+        server.delay = 0.05
+        service = _new_service(server, pool_config=PoolConfig(max_connections_per_host=1, block=True))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: service.get_project('id'), range(4)))
+        stats = service.get_pool_stats()
+        assert stats.opened == 1
+        assert stats.requests == 4
+        assert stats.waits >= 1
+        assert stats.to_dict()['waits'] == stats.waits
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the rate limiter
+"""
+
+from types import SimpleNamespace
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk import ratelimit, retry
+from ibm_project_sdk.project_v1 import ProjectV1
+from ibm_project_sdk.ratelimit import RateLimiter, RateLimitExceeded, TokenBucket
+from ibm_project_sdk.retry import RetryPolicy, get_retry_after
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+_config_url = _base_url + '/v1/projects/testString/configs/testString'
+
+
+class _Clock:
+    """A fake monotonic clock advanced by the fake sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ratelimit, 'time', clock)
+    return clock
+
+
+class TestTokenBucket:
+    """
+    Test Class for TokenBucket
+    """
+
+    def test_token_bucket_value_error(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+        with pytest.raises(ValueError):
+            TokenBucket(1, 0.5)
+
+    def test_token_bucket_refill(self, clock):
+        bucket = TokenBucket(2, 4)
+        for _ in range(4):
+            assert bucket.wait_time() == 0.0
+            bucket.take()
+        assert bucket.wait_time() == 0.5
+        bucket.refill(clock.now + 1.0)
+        assert bucket.wait_time() == 0.0
+        bucket.refill(clock.now + 100.0)
+        assert bucket.wait_time(4) == 0.0
+        assert bucket.wait_time(5) == 0.5
+
+
+class TestRateLimiter:
+    """
+    Test Class for RateLimiter
+    """
+
+    def test_global_limit(self, clock):
+        limiter = RateLimiter(10, 2)
+        assert limiter.try_acquire('get_config') == 0.0
+        assert limiter.try_acquire('list_configs') == 0.0
+        assert limiter.try_acquire('get_config') == pytest.approx(0.1)
+        assert limiter.estimate_wait('get_config') == pytest.approx(0.1)
+
+    def test_operation_limit(self, clock):
+        limiter = RateLimiter(operation_limits={'get_config': (1, 1)})
+        assert limiter.try_acquire('get_config') == 0.0
+        assert limiter.try_acquire('get_config') == pytest.approx(1.0)
+        assert limiter.try_acquire('list_configs') == 0.0
+        limiter.remove_operation_limit('get_config')
+        assert limiter.try_acquire('get_config') == 0.0
+
+    def test_both_limits_must_allow(self, clock):
+        limiter = RateLimiter(100, 100, operation_limits={'get_config': (1, 1)})
+        assert limiter.try_acquire('get_config') == 0.0
+        assert limiter.try_acquire('get_config') == pytest.approx(1.0)
+        # A refused request does not take global capacity.
+        assert limiter.estimate_wait('list_configs') == 0.0
+
+    def test_acquire_blocks(self, clock):
+        limiter = RateLimiter(4, 1)
+        assert limiter.acquire('get_config') == 0.0
+        assert limiter.acquire('get_config') == pytest.approx(0.25)
+        assert clock.sleeps == [pytest.approx(0.25)]
+
+    def test_acquire_without_blocking(self, clock):
+        limiter = RateLimiter(4, 1, block=False)
+        limiter.acquire('get_config')
+        with pytest.raises(RateLimitExceeded) as error:
+            limiter.acquire('get_config')
+        assert error.value.status_code == 429
+        assert error.value.retry_after == pytest.approx(0.25)
+        assert get_retry_after(error.value) == pytest.approx(0.25)
+        assert not clock.sleeps
+
+    def test_acquire_max_wait(self, clock):
+        limiter = RateLimiter(1, 1, max_wait=0.5)
+        limiter.acquire('get_config')
+        with pytest.raises(RateLimitExceeded):
+            limiter.acquire('get_config')
+        assert not clock.sleeps
+        with pytest.raises(ValueError):
+            RateLimiter(1, max_wait=-1)
+
+
+class TestRateLimitedService:
+    """
+    Test Class for the rate limiter of ProjectV1
+    """
+
+    @responses.activate
+    def test_limiter_is_shared_between_clients(self, clock):
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        limiter = RateLimiter(2, 1)
+        services = []
+        for _ in range(2):
+            service = ProjectV1(authenticator=NoAuthAuthenticator())
+            service.set_service_url(_base_url)
+            service.set_rate_limiter(limiter)
+            assert service.get_rate_limiter() is limiter
+            services.append(service)
+        for service in services:
+            service.get_config('testString', 'testString')
+        assert len(responses.calls) == 2
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    @responses.activate
+    def test_limiter_without_blocking(self, clock):
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.set_rate_limiter(RateLimiter(1, 1, block=False))
+        service.get_config('testString', 'testString')
+        with pytest.raises(ApiException) as error:
+            service.get_config('testString', 'testString')
+        assert isinstance(error.value, RateLimitExceeded)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_retries_take_capacity(self, clock, monkeypatch):
+        responses.add(responses.GET, _config_url, status=503)
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        monkeypatch.setattr(retry, 'time', SimpleNamespace(monotonic=time.monotonic, sleep=lambda seconds: None))
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        service.set_rate_limiter(RateLimiter(1, 1))
+        service.set_retry_policy(RetryPolicy(base_delay=0.0, max_delay=0.0))
+        service.get_config('testString', 'testString')
+        assert len(responses.calls) == 2
+        assert clock.sleeps == [pytest.approx(1.0)]
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the retry policy
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+import time
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import requests
+import responses
+
+from ibm_project_sdk import retry
+from ibm_project_sdk.project_v1 import _OPERATIONS, ProjectV1
+from ibm_project_sdk.retry import RetryPolicy, get_retry_after
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+_config_url = _base_url + '/v1/projects/testString/configs/testString'
+_deploy_url = _config_url + '/deploy'
+
+
+@pytest.fixture(name='sleeps')
+def fixture_sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry, 'time', SimpleNamespace(monotonic=time.monotonic, sleep=sleeps.append))
+    return sleeps
+
+
+def _new_service(**kwargs):
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    service.set_retry_policy(RetryPolicy(**kwargs))
+    return service
+
+
+class TestRetryPolicy:
+    """
+    Test Class for RetryPolicy
+    """
+
+    def test_retry_policy_value_error(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(base_delay=2, max_delay=1)
+        with pytest.raises(ValueError):
+            RetryPolicy(deadline=0)
+
+    def test_is_retryable_operation(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable_operation(_OPERATIONS['get_config'])
+        assert policy.is_retryable_operation(_OPERATIONS['delete_config'])
+        assert not policy.is_retryable_operation(_OPERATIONS['deploy_config'])
+        assert not policy.is_retryable_operation(_OPERATIONS['update_config'])
+
+        policy = RetryPolicy(retry_operations=['deploy_config'], no_retry_operations=['delete_config'])
+        assert policy.is_retryable_operation(_OPERATIONS['deploy_config'])
+        assert not policy.is_retryable_operation(_OPERATIONS['delete_config'])
+
+    def test_is_retryable_error(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable_error(ApiException(503))
+        assert policy.is_retryable_error(ApiException(429))
+        assert not policy.is_retryable_error(ApiException(404))
+        assert policy.is_retryable_error(requests.exceptions.ConnectionError())
+        assert policy.is_retryable_error(requests.exceptions.ReadTimeout())
+        assert not policy.is_retryable_error(requests.exceptions.SSLError())
+        assert not policy.is_retryable_error(ValueError())
+
+    def test_next_delay_is_bounded(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=1.0)
+        delay = policy.base_delay
+        for _ in range(100):
+            delay = policy.next_delay(delay)
+            assert 0.1 <= delay <= 1.0
+
+    def test_get_retry_after(self):
+        response = requests.Response()
+        assert get_retry_after(ApiException(503, http_response=response)) is None
+        response.headers['Retry-After'] = '7'
+        assert get_retry_after(ApiException(503, http_response=response)) == 7.0
+        response.headers['Retry-After'] = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30))
+        assert 25 <= get_retry_after(ApiException(503, http_response=response)) <= 30
+        response.headers['Retry-After'] = 'soon'
+        assert get_retry_after(ApiException(503, http_response=response)) is None
+        assert get_retry_after(ValueError()) is None
+
+
+class TestRetries:
+    """
+    Test Class for the retry policy of ProjectV1
+    """
+
+    @responses.activate
+    def test_get_is_retried(self, sleeps):
+        responses.add(responses.GET, _config_url, status=503)
+        responses.add(responses.GET, _config_url, status=502)
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        service = _new_service(max_attempts=3)
+        response = service.get_config('testString', 'testString')
+        assert response.get_result() == {'id': 'id'}
+        assert len(responses.calls) == 3
+        assert len(sleeps) == 2
+
+    @responses.activate
+    def test_attempts_are_limited(self, sleeps):
+        responses.add(responses.GET, _config_url, status=503)
+        service = _new_service(max_attempts=2)
+        with pytest.raises(ApiException) as error:
+            service.get_config('testString', 'testString')
+        assert error.value.status_code == 503
+        assert len(responses.calls) == 2
+        assert len(sleeps) == 1
+
+    @responses.activate
+    def test_client_errors_are_not_retried(self, sleeps):
+        responses.add(responses.GET, _config_url, status=404)
+        service = _new_service()
+        with pytest.raises(ApiException):
+            service.get_config('testString', 'testString')
+        assert len(responses.calls) == 1
+        assert not sleeps
+
+    @responses.activate
+    def test_non_idempotent_operations_are_opt_in(self, sleeps):
+        responses.add(responses.POST, _deploy_url, status=503)
+        responses.add(responses.POST, _deploy_url, status=503)
+        responses.add(responses.POST, _deploy_url, json={'id': 'id'}, status=202)
+        service = _new_service()
+        with pytest.raises(ApiException):
+            service.deploy_config('testString', 'testString')
+        assert len(responses.calls) == 1
+
+        service.set_retry_policy(RetryPolicy(retry_operations=['deploy_config']))
+        response = service.deploy_config('testString', 'testString')
+        assert response.get_status_code() == 202
+        assert len(responses.calls) == 3
+        assert len(sleeps) == 1
+
+    @responses.activate
+    def test_retry_after_is_honored(self, sleeps):
+        responses.add(responses.GET, _config_url, status=429, headers={'Retry-After': '3'})
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        service = _new_service(max_delay=1.0)
+        service.get_config('testString', 'testString')
+        assert sleeps == [3.0]
+
+    @responses.activate
+    def test_deadline_stops_retries(self, sleeps):
+        responses.add(responses.GET, _config_url, status=429, headers={'Retry-After': '10'})
+        service = _new_service(deadline=5.0)
+        with pytest.raises(ApiException):
+            service.get_config('testString', 'testString')
+        assert len(responses.calls) == 1
+        assert not sleeps
+
+    def test_deadline_caps_attempt_timeout(self):
+        service = _new_service(deadline=5.0)
+        timeouts = []
+
+        def send(request, **kwargs):
+            timeouts.append(kwargs.get('timeout'))
+            return 'response'
+
+        service.send = send
+        assert service.get_config('testString', 'testString', timeout=30) == 'response'
+        assert 0 < timeouts[0] <= 5.0
+        assert service.get_config('testString', 'testString', timeout=(3, 30)) == 'response'
+        assert timeouts[1][0] == 3 and 0 < timeouts[1][1] <= 5.0
+
+    def test_deadline_caps_configured_timeout(self):
+        service = _new_service(deadline=5.0)
+        service.set_http_config({'timeout': 30})
+        timeouts = []
+
+        def request(**kwargs):
+            timeouts.append(kwargs['timeout'])
+            response = requests.Response()
+            response.status_code = 204
+            return response
+
+        service.http_client.request = request
+        service.get_config('testString', 'testString')
+        assert 0 < timeouts[0] <= 5.0
+        # The configured timeout applies again outside of the calls of the policy.
+        assert service.http_config == {'timeout': 30}
+        service.set_retry_policy(None)
+        service.get_config('testString', 'testString')
+        assert timeouts[1] == 30
+
+    @responses.activate
+    def test_connection_errors_are_retried(self, sleeps):
+        responses.add(responses.GET, _config_url, body=requests.exceptions.ConnectionError('reset'))
+        responses.add(responses.GET, _config_url, json={'id': 'id'}, status=200)
+        service = _new_service()
+        assert service.get_config('testString', 'testString').get_status_code() == 200
+        assert len(sleeps) == 1
+
+    def test_retry_policy_accessors(self):
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        assert service.get_retry_policy() is None
+        policy = RetryPolicy()
+        service.set_retry_policy(policy)
+        assert service.get_retry_policy() is policy
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for streaming decoding of list responses
+"""
+
+import json
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.project_v1 import Environment, ProjectConfigResource, ProjectConfigSummary, ProjectV1
+from ibm_project_sdk.streaming import JSONCollectionDecoder, iter_collection
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+
+_document = {
+    'limit': 10,
+    'first': {'href': 'https://x/v1/projects?brackets=[{'},
+    'configs': [
+        {'name': 'q"}]\\', 'items': [1, 2.5, {'nested': None}], 'text': 'café ✓'},
+        {'number': -1.5e3},
+        3,
+        'string',
+        True,
+        None,
+        [],
+    ],
+    'next': {'href': 'https://x/v1/projects?token=next-token'},
+    'total_count': 12345,
+}
+
+_config = {
+    'id': 'id',
+    'version': 7,
+    'state': 'approved',
+    'created_at': '2019-01-01T12:00:00.000Z',
+    'modified_at': '2019-01-01T12:00:00.000Z',
+    'href': 'href',
+    'definition': {'name': 'name', 'description': 'description'},
+    'project': {'id': 'id', 'href': 'href', 'definition': {'name': 'name'}, 'crn': 'crn'},
+}
+
+
+def _decode_in_pieces(text, size):
+    decoder = JSONCollectionDecoder('configs')
+    elements = []
+    for start in range(0, len(text), size):
+        elements.extend(decoder.feed(text[start : start + size]))
+    elements.extend(decoder.close())
+    return elements, decoder.envelope
+
+
+class TestJSONCollectionDecoder:
+    """
+    Test Class for JSONCollectionDecoder
+    """
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 64, 100000])
+    def test_decode_in_pieces(self, size):
+        elements, envelope = _decode_in_pieces(json.dumps(_document, ensure_ascii=False, indent=1), size)
+        assert elements == _document['configs']
+        assert envelope == {key: value for key, value in _document.items() if key != 'configs'}
+
+    def test_elements_are_returned_as_soon_as_complete(self):
+        decoder = JSONCollectionDecoder('configs')
+        assert decoder.feed('{"limit": 2, "configs": [{"id": "a"}, {"id"') == [{'id': 'a'}]
+        assert decoder.envelope == {'limit': 2}
+        assert decoder.feed(': "b"}]') == [{'id': 'b'}]
+        assert decoder.feed(', "total": 1') == []
+        assert decoder.feed('0}') == []
+        assert decoder.close() == []
+        assert decoder.envelope == {'limit': 2, 'total': 10}
+
+    def test_numbers_split_across_pieces(self):
+        text = '{"rate": -1.5e+3, "configs": [-1.25, 1.5e10, 2E-3, 0, 42], "total": 12.75}'
+        for split in range(1, len(text)):
+            decoder = JSONCollectionDecoder('configs')
+            elements = decoder.feed(text[:split]) + decoder.feed(text[split:]) + decoder.close()
+            assert elements == [-1.25, 1.5e10, 2e-3, 0, 42]
+            assert decoder.envelope == {'rate': -1500.0, 'total': 12.75}
+
+    @pytest.mark.parametrize('text', ['{"configs": [1,}', '[1]', '{"limit": 1', '{"limit": 1}x', '{"limit" 1}'])
+    def test_invalid_documents(self, text):
+        decoder = JSONCollectionDecoder('configs')
+        with pytest.raises(ValueError):
+            decoder.feed(text)
+            decoder.close()
+
+    def test_iter_collection(self):
+        data = json.dumps(_document).encode('utf-8')
+        chunks = [data[i : i + 5] for i in range(0, len(data), 5)]
+        assert list(iter_collection(chunks, 'configs', str)) == [str(element) for element in _document['configs']]
+
+
+class TestStreaming:
+    """
+    Test Class for the streaming list methods of ProjectV1
+    """
+
+    @pytest.fixture(name='service')
+    def fixture_service(self):
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        return service
+
+    @responses.activate
+    def test_stream_configs(self, service):
+        body = {
+            'limit': 2,
+            'configs': [dict(_config, id='a'), dict(_config, id='b')],
+            'next': {'href': _base_url + '/v1/projects/p/configs?limit=2&token=abc'},
+        }
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs', json=body, status=200)
+        with service.stream_configs('p', limit=2) as configs:
+            elements = list(configs)
+            assert [config.id for config in elements] == ['a', 'b']
+            assert all(isinstance(config, ProjectConfigSummary) for config in elements)
+            assert configs.envelope['limit'] == 2
+            assert configs.get_next_token() == 'abc'
+        assert 'limit=2' in responses.calls[0].request.url
+
+    @responses.activate
+    def test_stream_project_environments(self, service):
+        environment = {
+            'id': 'id',
+            'project': {'id': 'id', 'href': 'href', 'definition': {'name': 'name'}, 'crn': 'crn'},
+            'created_at': '2019-01-01T12:00:00.000Z',
+            'modified_at': '2019-01-01T12:00:00.000Z',
+            'href': 'href',
+            'definition': {'name': 'name', 'description': 'description'},
+        }
+        body = {'limit': 10, 'environments': [environment]}
+        responses.add(responses.GET, _base_url + '/v1/projects/p/environments', json=body, status=200)
+        environments = list(service.stream_project_environments('p'))
+        assert isinstance(environments[0], Environment)
+
+    @responses.activate
+    def test_stream_config_resources(self, service):
+        body = {'resources': [{'resource_crn': 'crn-a'}, {'resource_crn': 'crn-b'}], 'resources_count': 2}
+        responses.add(responses.GET, _base_url + '/v1/projects/p/configs/c/resources', json=body, status=200)
+        resources = service.stream_config_resources('p', 'c')
+        elements = list(resources)
+        assert [resource.resource_crn for resource in elements] == ['crn-a', 'crn-b']
+        assert all(isinstance(resource, ProjectConfigResource) for resource in elements)
+        assert resources.envelope == {'resources_count': 2}
+        assert resources.get_next_token() is None
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for TokenStore
+"""
+
+import json
+import multiprocessing
+import os
+import time
+
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator, NoAuthAuthenticator
+import jwt
+import pytest
+import responses
+
+from ibm_project_sdk.cache import CacheStats
+from ibm_project_sdk.project_v1 import ProjectV1
+from ibm_project_sdk.token_store import TokenStore
+
+_iam_url = 'https://iam.cloud.ibm.com/identity/token'
+
+
+def _token_response(lifetime=3600):
+    now = int(time.time())
+    claims = {'iat': now, 'exp': now + lifetime, 'nonce': os.urandom(8).hex()}
+    token = jwt.encode(claims, 'a-secret-that-is-long-enough-for-hs256', algorithm='HS256')
+    return {'access_token': token, 'refresh_token': 'refresh', 'token_type': 'Bearer', 'expires_in': lifetime}
+
+
+def _add_token(**kwargs):
+    responses.add(responses.POST, _iam_url, json=_token_response(**kwargs))
+
+
+def _get_token(store, apikey='apikey'):
+    authenticator = IAMAuthenticator(apikey)
+    assert store.attach(authenticator)
+    return authenticator.token_manager.get_token()
+
+
+def _worker(path, log_path):
+    # A process of its own, with its own authenticator, whose token requests are logged.
+    authenticator = IAMAuthenticator('apikey')
+
+    def request_token():
+        with open(log_path, 'a', encoding='utf-8') as log:
+            log.write('request\n')
+        time.sleep(0.2)
+        return _token_response()
+
+    authenticator.token_manager.request_token = request_token
+    TokenStore(path).attach(authenticator)
+    authenticator.token_manager.get_token()
+
+
+@pytest.fixture(name='store')
+def fixture_store(tmp_path):
+    return TokenStore(str(tmp_path / 'tokens.json'))
+
+
+class TestTokenStore:
+    """
+    Test Class for TokenStore
+    """
+
+    @responses.activate
+    def test_tokens_are_shared(self, store):
+        _add_token()
+        token = _get_token(store)
+        assert _get_token(store) == token
+        assert _get_token(TokenStore(store.path)) == token
+        assert len(responses.calls) == 1
+        assert store.get_stats() == CacheStats(hits=1, misses=1, entries=1)
+        assert os.stat(store.path).st_mode & 0o777 == 0o600
+        # The store holds a digest of the credentials, not the API key.
+        with open(store.path, encoding='utf-8') as file:
+            assert 'apikey' not in file.read()
+
+    @responses.activate
+    def test_tokens_are_keyed_by_credentials(self, store):
+        _add_token()
+        _add_token()
+        assert _get_token(store, 'apikey') != _get_token(store, 'other-apikey')
+        assert len(responses.calls) == 2
+        assert store.get_stats().entries == 2
+        store.clear()
+        assert store.get_stats().entries == 0
+
+    @responses.activate
+    def test_token_refresh(self, store):
+        _add_token()
+        _add_token()
+        first = _get_token(store)
+        # A stored token past its refresh time is replaced by the next process that needs one.
+        with open(store.path, encoding='utf-8') as file:
+            entries = json.load(file)
+        for entry in entries.values():
+            entry['refresh_time'] = time.time() - 1
+        with open(store.path, 'w', encoding='utf-8') as file:
+            json.dump(entries, file)
+        second = _get_token(store)
+        assert first != second
+        assert _get_token(store) == second
+        assert len(responses.calls) == 2
+
+    def test_workers_request_one_token(self, tmp_path):
+        path = str(tmp_path / 'tokens.json')
+        log_path = str(tmp_path / 'requests.log')
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_worker, args=(path, log_path)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+            assert worker.exitcode == 0
+        with open(log_path, encoding='utf-8') as log:
+            assert log.read() == 'request\n'
+        with open(path, encoding='utf-8') as file:
+            assert len(json.load(file)) == 1
+
+    def test_attach(self, store):
+        assert not store.attach(NoAuthAuthenticator())
+        authenticator = IAMAuthenticator('apikey')
+        assert store.attach(authenticator)
+        request_token = authenticator.token_manager.request_token
+        assert store.attach(authenticator)
+        assert authenticator.token_manager.request_token is request_token
+
+    def test_new_instance(self, store, monkeypatch):
+        monkeypatch.setenv('TEST_STORE_SERVICE_AUTH_TYPE', 'iam')
+        monkeypatch.setenv('TEST_STORE_SERVICE_APIKEY', 'apikey')
+        service = ProjectV1.new_instance(service_name='TEST_STORE_SERVICE', token_store=store)
+        request_token = service.authenticator.token_manager.request_token
+        assert request_token.func == store._request_token  # pylint: disable=protected-access
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the persistent configuration version cache
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_project_sdk.project_v1 import ProjectV1
+from ibm_project_sdk.version_cache import VersionCache
+
+_base_url = 'https://projects.api.cloud.ibm.com'
+
+
+def _version(version, state):
+    return {'id': 'c', 'version': version, 'state': state, 'definition': {'inputs': {'key': 'value' * 100}}}
+
+
+def _add_versions(*states):
+    for version, state in enumerate(states, start=1):
+        responses.add(
+            responses.GET,
+            _base_url + '/v1/projects/p/configs/c/versions/{0}'.format(version),
+            json=_version(version, state),
+        )
+
+
+@pytest.fixture(name='service')
+def fixture_service(tmp_path):
+    service = ProjectV1(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    service.set_version_cache(VersionCache(str(tmp_path / 'versions.db')))
+    yield service
+    service.get_version_cache().close()
+
+
+class TestVersionCache:
+    """
+    Test Class for VersionCache
+    """
+
+    @responses.activate
+    def test_final_versions_are_stored(self, service, tmp_path):
+        _add_versions('superseded', 'approved', 'draft')
+        for _ in range(2):
+            for version in (1, 2, 3):
+                assert service.get_config_version('p', 'c', version).get_result()['version'] == version
+        assert [call.request.path_url for call in responses.calls] == [
+            '/v1/projects/p/configs/c/versions/1',
+            '/v1/projects/p/configs/c/versions/2',
+            '/v1/projects/p/configs/c/versions/3',
+            '/v1/projects/p/configs/c/versions/3',
+        ]
+        stats = service.get_version_cache().get_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 4, 2)
+        # The bodies are compressed.
+        assert 0 < stats.bytes < 2 * len('value' * 100)
+
+        # The versions survive the process.
+        reopened = VersionCache(str(tmp_path / 'versions.db'))
+        assert reopened.get('p', 'c', 2) == _version(2, 'approved')
+        assert reopened.get('p', 'c', 3) is None
+        reopened.close()
+
+    @responses.activate
+    def test_deletes_drop_versions(self, service):
+        _add_versions('superseded', 'superseded', 'approved')
+        responses.add(responses.DELETE, _base_url + '/v1/projects/p/configs/c/versions/1', status=204)
+        responses.add(responses.DELETE, _base_url + '/v1/projects/p/configs/c', status=204)
+        version_cache = service.get_version_cache()
+        for version in (1, 2, 3):
+            service.get_config_version('p', 'c', version)
+        version_cache.put('p', 'other', 1, _version(1, 'superseded'))
+        service.delete_config_version('p', 'c', 1)
+        assert version_cache.get_stats().entries == 3
+        assert version_cache.get('p', 'c', 1) is None
+        service.delete_config('p', 'c')
+        assert version_cache.get_stats().entries == 1
+        assert version_cache.delete('p') == 1
+
+    @responses.activate
+    def test_states(self, tmp_path):
+        _add_versions('approved', 'superseded')
+        service = ProjectV1(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        version_cache = VersionCache(str(tmp_path / 'versions.db'), states=['superseded'])
+        service.set_version_cache(version_cache)
+        for _ in range(2):
+            service.get_config_version('p', 'c', 1)
+            service.get_config_version('p', 'c', 2)
+        assert len(responses.calls) == 3
+        service.set_version_cache(None)
+        service.get_config_version('p', 'c', 2)
+        assert len(responses.calls) == 4
+        version_cache.close()
+        with pytest.raises(ValueError):
+            VersionCache(':memory:', compression_level=0)